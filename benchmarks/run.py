@@ -0,0 +1,194 @@
+"""
+Benchmark suite for building and describing surveys.
+
+Run from the repository root:
+
+    python -m benchmarks.run --sizes 10000 100000 1000000 --output results.json
+    python -m benchmarks.run compare baseline.json results.json
+
+Each size is measured in its own subprocess on a freshly generated survey
+(see ``benchmarks.synthetic``), so caches are cold and the peak resident
+memory (``ru_maxrss``) belongs to that size alone. The results are written
+as JSON: one record per (size, phase) with the wall time in seconds, plus
+the peak memory of every size, so two runs can be compared with
+``compare``.
+"""
+
+import argparse
+import json
+import platform
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import UTC, datetime
+from pathlib import Path
+
+import polars as pl
+
+from surpy.config import QuestionType
+from surpy.survey.survey_builder import SurveyBuilder, _load_survey_data
+
+from .synthetic import write_survey
+
+
+SIZES = [10_000, 100_000, 1_000_000]
+
+
+def _peak_rss_bytes() -> int:
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in kilobytes on Linux and in bytes on macOS.
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def _timed(timings: dict[str, float], phase: str, function, *args, **kwargs):
+    start = time.perf_counter()
+    result = function(*args, **kwargs)
+    timings[phase] = timings.get(phase, 0.0) + time.perf_counter() - start
+    return result
+
+
+def measure(data_path: Path, metadata_path: Path) -> dict:
+    """
+    Return the wall time of every phase for one generated survey, and the
+    peak resident memory of the process once all phases ran. Per question
+    phases are summed over the questions of each ``QuestionType``, so the
+    phase names do not depend on the number of blocks.
+    """
+    timings: dict[str, float] = {}
+    builder = SurveyBuilder(str(data_path), str(metadata_path))
+    metadata = _timed(timings, "load_metadata", builder._load_metadata)
+    frame = _timed(timings, "read_data", builder._read_data, data_path)
+    _timed(
+        timings,
+        "load_survey_data",
+        _load_survey_data,
+        frame.to_dict(),
+        metadata["questions"],
+    )
+    del frame
+
+    survey = _timed(timings, "build", builder.build)
+    for question in survey.questions:
+        name = QuestionType(question.qtype).name
+        strategy = question._strategy
+        for dtype in ("number", "text"):
+            _timed(timings, f"{name}.get_df_{dtype}", strategy.get_df, dtype)
+        _timed(timings, f"{name}.describe", strategy.describe)
+    _timed(timings, "describe_all", survey.describe_all)
+    _timed(timings, "banner", survey.banner, None, ["Single1", "Multiple1"])
+
+    return {"timings": timings, "peak_rss_bytes": _peak_rss_bytes()}
+
+
+def run(sizes: list[int], data_format: str, n_blocks: int) -> dict:
+    records = []
+    peaks = {}
+    with tempfile.TemporaryDirectory() as directory:
+        for size in sizes:
+            data_path, metadata_path = write_survey(
+                directory, size, n_blocks=n_blocks, data_format=data_format
+            )
+            output = subprocess.run(
+                [
+                    sys.executable,
+                    "-m",
+                    "benchmarks.run",
+                    "measure",
+                    str(data_path),
+                    str(metadata_path),
+                ],
+                check=True,
+                capture_output=True,
+                text=True,
+                cwd=Path(__file__).parent.parent,
+            ).stdout
+            result = json.loads(output)
+            records.extend(
+                {"size": size, "phase": phase, "seconds": seconds}
+                for phase, seconds in result["timings"].items()
+            )
+            peaks[str(size)] = result["peak_rss_bytes"]
+            print(
+                f"{size:>9} respondents: build {result['timings']['build']:.3f}s, "
+                f"peak {result['peak_rss_bytes'] / 2**20:.0f} MiB",
+                file=sys.stderr,
+            )
+
+    return {
+        "created": datetime.now(UTC).isoformat(),
+        "python": platform.python_version(),
+        "polars": pl.__version__,
+        "platform": platform.platform(),
+        "data_format": data_format,
+        "n_blocks": n_blocks,
+        "results": records,
+        "peak_rss_bytes": peaks,
+    }
+
+
+def compare(baseline: dict, current: dict, threshold: float) -> list[str]:
+    """
+    Return one line per phase and size measured in both runs, with the
+    ratio of the current to the baseline time; ratios above ``threshold``
+    are flagged as regressions.
+    """
+    before = {
+        (record["size"], record["phase"]): record["seconds"]
+        for record in baseline["results"]
+    }
+    lines = []
+    for record in current["results"]:
+        key = (record["size"], record["phase"])
+        if key not in before or before[key] <= 0:
+            continue
+        ratio = record["seconds"] / before[key]
+        flag = "  REGRESSION" if ratio > threshold else ""
+        lines.append(
+            f"{record['size']:>9} {record['phase']:<32} "
+            f"{before[key]:>9.4f}s -> {record['seconds']:>9.4f}s  x{ratio:.2f}{flag}"
+        )
+    for size, peak in current["peak_rss_bytes"].items():
+        if size in baseline["peak_rss_bytes"]:
+            ratio = peak / baseline["peak_rss_bytes"][size]
+            flag = "  REGRESSION" if ratio > threshold else ""
+            lines.append(f"{size:>9} {'peak_rss':<32} x{ratio:.2f}{flag}")
+    return lines
+
+
+def main(argv: list[str] | None = None) -> None:
+    argv = sys.argv[1:] if argv is None else argv
+    if argv[:1] == ["measure"]:
+        data_path, metadata_path = argv[1:3]
+        print(json.dumps(measure(Path(data_path), Path(metadata_path))))
+        return
+
+    if argv[:1] == ["compare"]:
+        parser = argparse.ArgumentParser(prog="benchmarks.run compare")
+        parser.add_argument("baseline")
+        parser.add_argument("current")
+        parser.add_argument("--threshold", type=float, default=1.2)
+        args = parser.parse_args(argv[1:])
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        with open(args.current) as f:
+            current = json.load(f)
+        print("\n".join(compare(baseline, current, args.threshold)))
+        return
+
+    parser = argparse.ArgumentParser(prog="benchmarks.run")
+    parser.add_argument("--sizes", type=int, nargs="+", default=SIZES)
+    parser.add_argument(
+        "--format", choices=["parquet", "csv", "arrow"], default="parquet"
+    )
+    parser.add_argument("--blocks", type=int, default=1)
+    parser.add_argument("--output", default="benchmark_results.json")
+    args = parser.parse_args(argv)
+    results = run(args.sizes, args.format, args.blocks)
+    with open(args.output, "w") as f:
+        json.dump(results, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
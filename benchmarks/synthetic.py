@@ -0,0 +1,225 @@
+"""
+Synthetic survey data and metadata for benchmarks.
+
+Every value is derived from a hash of the respondent position and a column
+seed, so the data is deterministic, needs no random number generator and
+is generated by polars at any size in about the time it takes to write it.
+"""
+
+import json
+from pathlib import Path
+
+import polars as pl
+
+from surpy.config import Identifier, QuestionType
+
+
+WORDS = [
+    "cute",
+    "smart",
+    "loyal",
+    "fluffy",
+    "strong",
+    "calm",
+    "playful",
+    "friendly",
+    "quiet",
+    "funny",
+    "brave",
+    "gentle",
+]
+SUB_ITEMS = ["Dog", "Cat", "Panda", "Polar"]
+
+
+def _uniform(n: int, seed: int, k: int) -> pl.Expr:
+    """Return a pseudo random code in ``1..k`` per respondent."""
+    return (pl.int_range(n, dtype=pl.UInt64).hash(seed) % k + 1).cast(pl.Int64)
+
+
+def _missing(n: int, seed: int, rate: float) -> pl.Expr:
+    return pl.int_range(n, dtype=pl.UInt64).hash(seed) % 10_000 < int(rate * 10_000)
+
+
+def _with_missing(value: pl.Expr, n: int, seed: int, rate: float) -> pl.Expr:
+    return pl.when(~_missing(n, seed, rate)).then(value)
+
+
+def _block(n: int, block: int, missing: float) -> tuple[list[pl.Expr], list[dict]]:
+    """
+    Return the columns and metadata of one block: one question of every
+    ``QuestionType``, with ids like ``MatrixSingle<block>``.
+    """
+    seed = block * 1_000
+    ids = {qtype: f"{qtype.name}{block}" for qtype in QuestionType}
+    columns: list[pl.Expr] = []
+    metadata: list[dict] = []
+
+    qid = ids[QuestionType.Single]
+    columns.append(
+        _with_missing(_uniform(n, seed + 1, 5), n, seed + 2, missing).alias(qid)
+    )
+    metadata.append(
+        {
+            "id": qid,
+            "type": QuestionType.Single,
+            "text": "Single choice",
+            "options": [f"Option {i}" for i in range(1, 6)],
+        }
+    )
+
+    qid = ids[QuestionType.Number]
+    columns.append(
+        _with_missing(
+            (_uniform(n, seed + 3, 60_000) / 1_000 + 1940).round(3),
+            n,
+            seed + 4,
+            missing,
+        ).alias(qid)
+    )
+    metadata.append({"id": qid, "type": QuestionType.Number, "text": "Number"})
+
+    qid = ids[QuestionType.Multiple]
+    columns.extend(
+        (_uniform(n, seed + 10 + op, 3) == 1)
+        .cast(pl.Int64)
+        .alias(f"{qid}{Identifier.Multiple}{op}")
+        for op in range(1, 7)
+    )
+    metadata.append(
+        {
+            "id": qid,
+            "type": QuestionType.Multiple,
+            "text": "Multiple choice",
+            "options": [f"Option {i}" for i in range(1, 7)],
+        }
+    )
+
+    qid = ids[QuestionType.MatrixSingle]
+    columns.extend(
+        _with_missing(
+            _uniform(n, seed + 20 + sub, 10), n, seed + 30 + sub, missing
+        ).alias(f"{qid}{Identifier.Matrix}{sub}")
+        for sub in range(1, len(SUB_ITEMS) + 1)
+    )
+    metadata.append(
+        {
+            "id": qid,
+            "type": QuestionType.MatrixSingle,
+            "text": "Matrix single choice",
+            "options": list(range(1, 11)),
+            "sub_items": SUB_ITEMS,
+        }
+    )
+
+    qid = ids[QuestionType.MatrixMultiple]
+    columns.extend(
+        (_uniform(n, seed + 40 + 10 * sub + op, 2) == 1)
+        .cast(pl.Int64)
+        .alias(f"{qid}{Identifier.Matrix}{sub}{Identifier.Multiple}{op}")
+        for sub in range(1, len(SUB_ITEMS) + 1)
+        for op in range(1, 4)
+    )
+    metadata.append(
+        {
+            "id": qid,
+            "type": QuestionType.MatrixMultiple,
+            "text": "Matrix multiple choice",
+            "options": ["Strong", "Cute", "Smart"],
+            "sub_items": SUB_ITEMS,
+        }
+    )
+
+    # A rotation of the options is a valid ranking; the last position is
+    # sometimes left out, as in partial rankings.
+    qid = ids[QuestionType.Rank]
+    start = _uniform(n, seed + 90, len(SUB_ITEMS)) - 1
+    columns.extend(
+        (
+            (start + position) % len(SUB_ITEMS) + 1
+            if position < len(SUB_ITEMS)
+            else _with_missing(
+                (start + position) % len(SUB_ITEMS) + 1, n, seed + 91, 0.2
+            )
+        ).alias(f"{qid}{Identifier.Rank}{position}")
+        for position in range(1, len(SUB_ITEMS) + 1)
+    )
+    metadata.append(
+        {
+            "id": qid,
+            "type": QuestionType.Rank,
+            "text": "Rank",
+            "options": SUB_ITEMS,
+        }
+    )
+
+    qid = ids[QuestionType.Text]
+    words = pl.lit(pl.Series(WORDS))
+    columns.append(
+        _with_missing(
+            pl.concat_str(
+                [
+                    words.gather(_uniform(n, seed + 100 + k, len(WORDS)) - 1)
+                    for k in range(3)
+                ],
+                separator=" ",
+            ),
+            n,
+            seed + 104,
+            missing,
+        ).alias(qid)
+    )
+    metadata.append({"id": qid, "type": QuestionType.Text, "text": "Text"})
+
+    return columns, metadata
+
+
+def generate_survey(
+    n_respondents: int, n_blocks: int = 1, missing: float = 0.05
+) -> tuple[pl.DataFrame, dict]:
+    """
+    Return a survey data frame with ``n_respondents`` rows and its metadata.
+
+    Each of the ``n_blocks`` blocks holds one question of every
+    ``QuestionType``, using every column code convention (``_``, ``.``,
+    ``#``). Single, number, matrix single and text answers are missing at
+    rate ``missing``.
+    """
+    columns = [pl.int_range(1, n_respondents + 1, dtype=pl.Int64).alias(Identifier.Id)]
+    questions = []
+    for block in range(1, n_blocks + 1):
+        block_columns, block_metadata = _block(n_respondents, block, missing)
+        columns.extend(block_columns)
+        questions.extend(block_metadata)
+
+    data = pl.select(columns)
+    return data, {"name": f"synthetic_{n_respondents}", "questions": questions}
+
+
+def write_survey(
+    directory: str | Path,
+    n_respondents: int,
+    n_blocks: int = 1,
+    data_format: str = "parquet",
+) -> tuple[Path, Path]:
+    """
+    Write a generated survey to ``directory`` and return the data and
+    metadata paths. ``data_format`` is ``parquet``, ``csv`` or ``arrow``.
+    """
+    directory = Path(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+    data, metadata = generate_survey(n_respondents, n_blocks)
+
+    data_path = directory / f"survey_{n_respondents}.{data_format}"
+    if data_format == "parquet":
+        data.write_parquet(data_path)
+    elif data_format == "csv":
+        data.write_csv(data_path)
+    elif data_format == "arrow":
+        data.write_ipc(data_path, compression="uncompressed")
+    else:
+        raise ValueError(f"Unsupported data format: {data_format}")
+
+    metadata_path = directory / f"survey_{n_respondents}.json"
+    with open(metadata_path, "w") as f:
+        json.dump(metadata, f, indent=2)
+    return data_path, metadata_path
@@ -16,3 +16,4 @@ class Identifier(StrEnum):
     Matrix = "."
     Rank = "#"
     Id = "ID"
+    Wave = "WAVE"
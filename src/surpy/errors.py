@@ -12,3 +12,7 @@ class FileTypeError(Error):
 
 class DataError(Error):
     pass
+
+
+class QuestionNotFoundError(Error):
+    pass
@@ -0,0 +1,103 @@
+from collections.abc import Callable
+from dataclasses import dataclass
+from time import perf_counter
+from typing import Any, TypeVar
+
+import polars as pl
+
+
+T = TypeVar("T")
+
+
+@dataclass(frozen=True)
+class PhaseStats:
+    """
+    One measured phase: its wall time, and the rows, columns and estimated
+    bytes of what it produced, when that is a frame, a series or a mapping
+    of them. Shapes that cannot be measured without extra work are None.
+    """
+
+    phase: str
+    seconds: float
+    rows: int | None = None
+    columns: int | None = None
+    bytes: int | None = None
+
+
+def _leaves(data: Any) -> list[pl.Series]:
+    """
+    Return the series held in ``data``, descending into plain dicts only,
+    so lazily loaded question data is never collected.
+    """
+    if isinstance(data, pl.Series):
+        return [data]
+    if isinstance(data, dict):
+        return [leaf for value in data.values() for leaf in _leaves(value)]
+    return []
+
+
+def _shape(result: Any) -> tuple[int | None, int | None, int | None]:
+    if isinstance(result, pl.DataFrame):
+        return result.height, result.width, result.estimated_size()
+    leaves = _leaves(result)
+    if leaves:
+        return (
+            max(len(leaf) for leaf in leaves),
+            len(leaves),
+            sum(leaf.estimated_size() for leaf in leaves),
+        )
+    if isinstance(result, list):
+        return None, len(result), None
+    return None, None, None
+
+
+class BuildStats:
+    """
+    Collect per-phase statistics of a build and of the strategies of the
+    questions it builds. Pass one to ``SurveyBuilder(stats=...)``; every
+    phase is appended to ``phases`` and passed to ``callback`` if given.
+
+    Instrumented code calls ``timed``, which is a plain call when no stats
+    object is set, so instrumentation can stay in place at no cost.
+    """
+
+    def __init__(self, callback: Callable[[PhaseStats], None] | None = None) -> None:
+        self.callback = callback
+        self.phases: list[PhaseStats] = []
+
+    def record(self, stats: PhaseStats) -> None:
+        self.phases.append(stats)
+        if self.callback is not None:
+            self.callback(stats)
+
+    def measure(self, phase: str, function: Callable[..., T], *args, **kwargs) -> T:
+        start = perf_counter()
+        result = function(*args, **kwargs)
+        seconds = perf_counter() - start
+        self.record(PhaseStats(phase, seconds, *_shape(result)))
+        return result
+
+    @property
+    def total_seconds(self) -> float:
+        return sum(stats.seconds for stats in self.phases)
+
+    def to_frame(self) -> pl.DataFrame:
+        return pl.DataFrame(
+            [vars(stats) for stats in self.phases],
+            schema={
+                "phase": pl.String,
+                "seconds": pl.Float64,
+                "rows": pl.Int64,
+                "columns": pl.Int64,
+                "bytes": pl.Int64,
+            },
+        )
+
+
+def timed(
+    stats: BuildStats | None, phase: str, function: Callable[..., T], *args, **kwargs
+) -> T:
+    """Call ``function``, measured as ``phase`` when ``stats`` is set."""
+    if stats is None:
+        return function(*args, **kwargs)
+    return stats.measure(phase, function, *args, **kwargs)
@@ -1,8 +1,15 @@
-from dataclasses import dataclass, field
+from collections.abc import Mapping
+from dataclasses import dataclass, field, fields, replace
+from functools import cached_property
+
+import polars as pl
 
 from .option import Option
+from ..instrumentation import BuildStats
 from . import strategies
 from ..config import QuestionType
+from ..errors import DataError
+from .strategies.multiple_strategy import PackedSelections, pack_selections
 
 
 _strategies = {
@@ -16,18 +23,100 @@ _strategies = {
 }
 
 
-@dataclass
+# Compared by identity: ``data``, ``response_ids``, ``weights`` and ``mask``
+# hold ``pl.Series``, which have no single truth value for ``==``.
+@dataclass(eq=False)
 class Question:
     id: str
     qtype: QuestionType
     text: str
-    data: dict
-    response_ids: list[str]
+    data: Mapping
+    response_ids: pl.Series | list[str]
     options: list[Option] = field(default_factory=list)
     sub_items: list = field(default_factory=list)
+    weights: pl.Series | None = None
+    # Replace multiple choice ``data`` by its bitmasks; see ``__post_init__``.
+    packed: bool = False
+    # Respondents a filtered view keeps; see ``filter``.
+    mask: pl.Series | None = None
+    # Collects the strategy's phase statistics; see ``surpy.instrumentation``.
+    stats: BuildStats | None = field(default=None, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """
+        With ``packed``, replace the option columns of a multiple choice
+        question by their bitmasks, so only the masks are kept.
+        """
+        if (
+            self.packed
+            and self.qtype == QuestionType.Multiple
+            and not isinstance(self.data, PackedSelections)
+        ):
+            self.data = pack_selections(self.data)
+
+    def __setattr__(self, name: str, value) -> None:
+        super().__setattr__(name, value)
+        if name in self.__dataclass_fields__:
+            self.invalidate_strategy()
+
+    def invalidate_strategy(self) -> None:
+        """
+        Drop the cached strategy so it is rebuilt, and revalidated, on next
+        access. Called on attribute assignment; call it explicitly after
+        mutating ``data`` or ``options`` in place.
+        """
+        self.__dict__.pop("_strategy", None)
+
+    def filter(self, mask: pl.Series) -> "Question":
+        """
+        Return a view of the question restricted to the respondents where
+        ``mask``, aligned with ``response_ids``, is True. Masks of chained
+        views are combined. The view shares the data and, once built, the
+        cached conversions of this question; only ``get_df``, ``describe`` and
+        the other results are computed over the masked respondents.
+        """
+        mask = mask.cast(pl.Boolean).fill_null(False)
+        if self.mask is not None:
+            mask = self.mask & mask
+        view = replace(self, mask=mask)
+        # Share an already built strategy; otherwise the view builds its own
+        # on first use, so filtering does not load lazy data.
+        if "_strategy" in self.__dict__:
+            view.__dict__["_strategy"] = self._strategy.with_mask(mask)
+        return view
+
+    def _multiple(self):
+        if self.qtype != QuestionType.Multiple:
+            raise DataError(f"Question is not multiple choice: {self.id}")
+        return self._strategy
+
+    def n_selected(self) -> pl.Series:
+        """Return the number of options each respondent selected."""
+        return self._multiple().n_selected()
+
+    def any_of(self, options: list[str | int]) -> pl.Series:
+        """
+        Return whether each respondent selected at least one of ``options``,
+        given by option text or index.
+        """
+        return self._multiple().any_of(options)
+
+    def all_of(self, options: list[str | int]) -> pl.Series:
+        """
+        Return whether each respondent selected every one of ``options``,
+        given by option text or index.
+        """
+        return self._multiple().all_of(options)
+
+    def co_selection(self) -> pl.DataFrame:
+        """
+        Return how many respondents selected each pair of options, with one
+        row and one column per option; the diagonal holds the option counts.
+        """
+        return self._multiple().co_selection()
 
-    @property
+    @cached_property
     def _strategy(self):
-        if self.qtype in [QuestionType.MatrixSingle, QuestionType.MatrixMultiple]:
-            return _strategies[self.qtype](**self.__dict__)
-        return _strategies[self.qtype](**self.__dict__)
+        return _strategies[self.qtype](
+            **{f.name: getattr(self, f.name) for f in fields(self)}
+        )
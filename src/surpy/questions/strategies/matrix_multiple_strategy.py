@@ -1,10 +1,58 @@
+from functools import cached_property
+from typing import Literal
 import polars as pl
 
-from .strategy import QuestionStrategy
+from .strategy import (
+    QuestionStrategy,
+    as_series,
+    frequency_table,
+    item_labels,
+    long_selected,
+    option_enum,
+    option_labels,
+)
+from .multiple_strategy import _is_selected
 from ..option import Option
+from ...errors import DataError
+from ...instrumentation import BuildStats
+from ...config import Identifier
+
+
+def _validate_data(data: dict, response_ids: pl.Series | list) -> None:
+    if not data:
+        raise DataError("Matrix multiple question data must not be empty")
+
+    if not all(
+        isinstance(sub_index, int)
+        and isinstance(sub_data, dict)
+        and all(isinstance(op_index, int) for op_index in sub_data.keys())
+        for sub_index, sub_data in data.items()
+    ):
+        raise DataError(
+            "Matrix multiple question data must map integer sub-item keys to "
+            "dicts with integer option keys"
+        )
+
+    if not all(
+        len(op_data) == len(response_ids)
+        for sub_data in data.values()
+        for op_data in sub_data.values()
+    ):
+        raise DataError(
+            "Length of Matrix multiple question data must be equal to length of response ids"
+        )
 
 
 class MatrixMultipleStrategy(QuestionStrategy):
+    """
+    The answers are held as a respondents x (sub-item, option) boolean
+    frame, the respondents x sub-items x options tensor flattened to one
+    column per cell. Counts of every cell come from one column-wise sum.
+    """
+
+    _has_items = True
+    _multi_valued = True
+
     def __init__(
         self,
         **kwargs,
@@ -12,14 +60,127 @@ class MatrixMultipleStrategy(QuestionStrategy):
         self.id: str = kwargs["id"]
         self.text: str = kwargs["text"]
         self.options: list[Option] = kwargs["options"]
-        self.data: dict = kwargs["data"]
-        self.response_ids: dict = kwargs["response_ids"]
+        self.response_ids: pl.Series | list = kwargs["response_ids"]
+        self.weights: pl.Series | None = kwargs.get("weights")
+        self.mask: pl.Series | None = kwargs.get("mask")
+        self.stats: BuildStats | None = kwargs.get("stats")
+        self.sub_items: list = kwargs.get("sub_items", [])
+        self._timed("validate", _validate_data, kwargs["data"], self.response_ids)
+        self.raw_data: dict[int, dict[int, pl.Series]] = {
+            sub_index: {
+                op_index: as_series(op_data)
+                for op_index, op_data in sorted(sub_data.items())
+            }
+            for sub_index, sub_data in sorted(kwargs["data"].items())
+        }
+
+    def _sub_item_label(self, sub_index: int) -> str:
+        if 0 < sub_index <= len(self.sub_items):
+            return str(self.sub_items[sub_index - 1])
+        return f"{self.id}{Identifier.Matrix}{sub_index}"
+
+    @cached_property
+    def _cells(self) -> list[tuple[int, int]]:
+        return [
+            (sub_index, op_index)
+            for sub_index, sub_data in self.raw_data.items()
+            for op_index in sub_data
+        ]
+
+    @cached_property
+    def selected(self) -> pl.DataFrame:
+        """Return whether each respondent picked each option of each sub-item."""
+        return pl.DataFrame(
+            [
+                _is_selected(self.raw_data[sub_index][op_index]).alias(
+                    f"{sub_index}{Identifier.Multiple}{op_index}"
+                )
+                for sub_index, op_index in self._cells
+            ]
+        )
+
+    def _cell_data(self, dtype: Literal["number", "text"]) -> pl.DataFrame:
+        if dtype != "text":
+            return self.selected.cast(pl.Int64)
+        n2t = {op.index: str(op.text) for op in self.options}
+        enum = option_enum(self.options)
+        return self.selected.select(
+            pl.when(column).then(pl.lit(n2t.get(op_index), dtype=enum)).alias(column)
+            for column, (_, op_index) in zip(self.selected.columns, self._cells)
+        )
+
+    def get_df(self, dtype: Literal["number", "text"]) -> pl.DataFrame:
+        n2t = {op.index: str(op.text) for op in self.options}
+        return self._masked(
+            pl.DataFrame(
+                [
+                    as_series(self.response_ids).alias(Identifier.Id),
+                    *(
+                        column.alias(
+                            f"{self._sub_item_label(sub_index)}"
+                            f"{Identifier.Multiple}{n2t.get(op_index, op_index)}"
+                        )
+                        for column, (sub_index, op_index) in zip(
+                            self._cell_data(dtype).get_columns(), self._cells
+                        )
+                    ),
+                ]
+            )
+        )
+
+    def describe(self) -> pl.DataFrame:
+        return self._describe_summary(self._timed("count", self._counts().collect))
+
+    def _columns(self, dtype: Literal["number", "text"]) -> dict[str, pl.Series]:
+        return {
+            f"{self.id}{Identifier.Matrix}{column.name}": column
+            for column in self._cell_data(dtype).get_columns()
+        }
+
+    def _counts(self) -> pl.LazyFrame:
+        """
+        Return the same counts as the long-form group-by, summed straight
+        from the boolean columns. Cells nobody picked are left out.
+        """
+        selected = self._masked(self.selected)
+        n_selected = pl.Series(selected.select(pl.all().sum()).row(0))
+        if self.weights is None:
+            counts = n_selected.cast(pl.UInt32)
+        else:
+            weights = self._masked(self.weights)
+            weighted = selected.select((pl.all() * pl.lit(weights)).sum())
+            counts = pl.Series(weighted.row(0), dtype=weighted.dtypes[0])
+        return pl.LazyFrame(
+            [
+                pl.Series(
+                    "item", [sub_index for sub_index, _ in self._cells], pl.UInt32
+                ),
+                pl.Series("value", [op_index for _, op_index in self._cells], pl.Int64),
+                counts.alias("count"),
+            ]
+        ).filter(n_selected > 0)
 
-    def _validate_data(self, data: dict) -> None: ...
+    def _long_df(self) -> pl.LazyFrame:
+        return pl.concat(
+            [
+                long_selected(self.selected[column], op_index, sub_index)
+                for column, (sub_index, op_index) in zip(
+                    self.selected.columns, self._cells
+                )
+            ]
+        )
 
-    @property
-    def dtype(self) -> str: ...
+    def _describe_summary(self, counts: pl.DataFrame) -> pl.DataFrame:
+        return frequency_table(counts).select(
+            self._label_items(pl.col("item")).alias(f"{self.id}_item"),
+            self._label_values(pl.col("value")).alias(self.id),
+            "count",
+            "percent",
+            "cum_percent",
+        )
 
-    def get_df(self) -> pl.DataFrame: ...
+    def _label_items(self, items: pl.Expr) -> pl.Expr:
+        return item_labels(items, self.sub_items)
 
-    def describe(self) -> pl.DataFrame: ...
+    def _label_values(self, values: pl.Expr) -> pl.Expr:
+        return option_labels(values, self.options)
@@ -1,9 +1,50 @@
+from functools import cached_property
+from typing import Literal
 import polars as pl
-from .strategy import QuestionStrategy
+
+from .strategy import (
+    QuestionStrategy,
+    as_series,
+    frequency_table,
+    item_labels,
+    option_enum,
+    option_labels,
+)
+from .single_strategy import _to_number_data
 from ..option import Option
+from ...errors import DataError
+from ...instrumentation import BuildStats
+from ...config import Identifier
+
+
+def _validate_data(data: dict, response_ids: pl.Series | list) -> None:
+    if not data:
+        raise DataError("Matrix single question data must not be empty")
+
+    if not all(isinstance(key, int) for key in data.keys()):
+        raise DataError("Key of Matrix single question must be integer")
+
+    for sub_data in data.values():
+        values = as_series(sub_data)
+
+        if len(values) != len(response_ids):
+            raise DataError(
+                "Length of Matrix single question data must be equal to length of response ids"
+            )
+
+        if not (values.dtype in (pl.String, pl.Null) or values.dtype.is_integer()):
+            raise DataError("Invalid data type")
 
 
 class MatrixSingleStrategy(QuestionStrategy):
+    """
+    The answers are held as a respondents x sub-items frame of option codes,
+    one column per sub-item index, and every sub-item is described by the
+    same group-by.
+    """
+
+    _has_items = True
+
     def __init__(
         self,
         **kwargs,
@@ -11,14 +52,113 @@ class MatrixSingleStrategy(QuestionStrategy):
         self.id: str = kwargs["id"]
         self.text: str = kwargs["text"]
         self.options: list[Option] = kwargs["options"]
-        self.data: dict = kwargs["data"]
-        self.response_ids: dict = kwargs["response_ids"]
+        self.response_ids: pl.Series | list = kwargs["response_ids"]
+        self.weights: pl.Series | None = kwargs.get("weights")
+        self.mask: pl.Series | None = kwargs.get("mask")
+        self.stats: BuildStats | None = kwargs.get("stats")
+        self.sub_items: list = kwargs.get("sub_items", [])
+        self._timed("validate", _validate_data, kwargs["data"], self.response_ids)
+        self.raw_data: dict[int, pl.Series] = {
+            sub_index: as_series(sub_data)
+            for sub_index, sub_data in sorted(kwargs["data"].items())
+        }
+
+    def _option_mapping(self, _type: Literal["t2n", "n2t"]) -> dict:
+        if _type == "t2n":
+            return {op.text: op.index for op in self.options}
+        return {op.index: op.text for op in self.options}
+
+    def _sub_item_label(self, sub_index: int) -> str:
+        if 0 < sub_index <= len(self.sub_items):
+            return str(self.sub_items[sub_index - 1])
+        return f"{self.id}{Identifier.Matrix}{sub_index}"
+
+    @cached_property
+    def number_data(self) -> pl.DataFrame:
+        t2n = self._option_mapping("t2n")
+        return pl.DataFrame(
+            [
+                _to_number_data(sub_data, t2n).alias(str(sub_index))
+                for sub_index, sub_data in self.raw_data.items()
+            ]
+        )
+
+    @cached_property
+    def text_data(self) -> pl.DataFrame:
+        return self.number_data.select(
+            pl.all().replace_strict(
+                {op.index: str(op.text) for op in self.options},
+                default=None,
+                return_dtype=option_enum(self.options),
+            )
+        )
+
+    def get_df(self, dtype: Literal["number", "text"]) -> pl.DataFrame:
+        data = self.text_data if dtype == "text" else self.number_data
+        return self._masked(
+            pl.DataFrame(
+                [
+                    as_series(self.response_ids).alias(Identifier.Id),
+                    *(
+                        column.alias(self._sub_item_label(int(column.name)))
+                        for column in data.get_columns()
+                    ),
+                ]
+            )
+        )
+
+    def describe(self) -> pl.DataFrame:
+        return self._describe_summary(self._timed("count", self._counts().collect))
+
+    def _columns(self, dtype: Literal["number", "text"]) -> dict[str, pl.Series]:
+        data = self.text_data if dtype == "text" else self.number_data
+        return {
+            f"{self.id}{Identifier.Matrix}{column.name}": column
+            for column in data.get_columns()
+        }
 
-    def _validate_data(self, data: dict) -> None: ...
+    def _long_df(self) -> pl.LazyFrame:
+        return (
+            self.number_data.lazy()
+            .with_row_index("row")
+            .unpivot(index="row", variable_name="item", value_name="value")
+            .select(
+                "row",
+                pl.col("item").cast(pl.UInt32),
+                pl.when(pl.col("value").is_in([op.index for op in self.options])).then(
+                    "value"
+                ),
+            )
+        )
 
-    @property
-    def dtype(self) -> str: ...
+    def _describe_summary(self, counts: pl.DataFrame) -> pl.DataFrame:
+        """
+        Return the option distribution of every sub-item, with the mean
+        option code of the sub-item's answers as ``mean``.
+        """
+        answered = pl.col("value").is_not_null()
+        return (
+            frequency_table(counts)
+            .with_columns(
+                (
+                    (pl.col("value") * pl.col("count")).filter(answered).sum()
+                    / pl.col("count").filter(answered).sum()
+                )
+                .over("item")
+                .alias("mean")
+            )
+            .select(
+                self._label_items(pl.col("item")).alias(f"{self.id}_item"),
+                self._label_values(pl.col("value")).alias(self.id),
+                "count",
+                "percent",
+                "cum_percent",
+                "mean",
+            )
+        )
 
-    def get_df(self) -> pl.DataFrame: ...
+    def _label_items(self, items: pl.Expr) -> pl.Expr:
+        return item_labels(items, self.sub_items)
 
-    def describe(self) -> pl.DataFrame: ...
+    def _label_values(self, values: pl.Expr) -> pl.Expr:
+        return option_labels(values, self.options)
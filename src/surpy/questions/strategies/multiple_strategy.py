@@ -1,14 +1,26 @@
+from collections.abc import Mapping
+from functools import cached_property
 from typing import Literal
 import polars as pl
 
 from ...errors import DataError
+from ...instrumentation import BuildStats
 from ..option import Option
-from .strategy import QuestionStrategy
+from .strategy import (
+    QuestionStrategy,
+    as_series,
+    frequency_table,
+    long_selected,
+    option_enum,
+    option_labels,
+)
 from ...config import Identifier
 
 
 def _validate_data(
-    data: dict[int, list], options: list[Option], response_ids: list
+    data: dict[int, pl.Series | list],
+    options: list[Option],
+    response_ids: pl.Series | list,
 ) -> None:
     if len(data) != len(options):
         raise DataError(
@@ -18,7 +30,12 @@ def _validate_data(
         raise DataError(
             "Length of Multiple question data keys must be equal to lenght of options"
         )
-    if not all([len(v) == len(response_ids) for v in data.values()]):
+    lengths = (
+        [data.masks.height]
+        if isinstance(data, PackedSelections)
+        else [len(v) for v in data.values()]
+    )
+    if not all([length == len(response_ids) for length in lengths]):
         raise DataError(
             "Length of Multiple question data must be equal to lenght of response ids"
         )
@@ -26,26 +43,113 @@ def _validate_data(
         raise DataError("Key of Multiple question must be integer")
 
 
+def _is_selected(op_data: pl.Series) -> pl.Series:
+    """Return a boolean mask of respondents who picked the option."""
+    if op_data.dtype == pl.String:
+        return op_data.is_in(["", "0"]).not_().fill_null(False)
+    if op_data.dtype == pl.Boolean:
+        return op_data.fill_null(False)
+    return (op_data != 0).fill_null(False)
+
+
 def _to_number_data(
-    data: dict[int, list], option_mapping: dict[int, str]
-) -> dict[str, list[int]]:
+    data: dict[int, pl.Series], option_mapping: dict[int, str]
+) -> dict[str, pl.Series]:
     sorted_data = dict(sorted(data.items(), key=lambda x: x[0]))
     return {
-        option_mapping[op_index]: [1 if d else 0 for d in op_data]
+        option_mapping[op_index]: _is_selected(op_data).cast(pl.Int64)
         for op_index, op_data in sorted_data.items()
     }
 
 
-def _to_text_data(data: dict[int, list], option_mapping: dict[int, str]):
+def _to_text_data(
+    data: dict[int, pl.Series], option_mapping: dict[int, str]
+) -> dict[str, pl.Series]:
+    dtype = option_enum(
+        [Option(index=index, text=text) for index, text in option_mapping.items()]
+    )
+    sorted_data = dict(sorted(data.items(), key=lambda x: x[0]))
     return {
-        option_mapping[op_index]: [
-            option_mapping[op_index] if d else "" for d in op_data
-        ]
-        for op_index, op_data in data.items()
+        option_mapping[op_index]: pl.select(
+            pl.when(_is_selected(op_data)).then(
+                pl.lit(str(option_mapping[op_index]), dtype=dtype)
+            )
+        ).to_series()
+        for op_index, op_data in sorted_data.items()
     }
 
 
+_MASK_BITS = 64
+
+
+def _pack_selected(selected: list[pl.Series]) -> pl.DataFrame:
+    """
+    Pack boolean option columns into ``UInt64`` bitmasks, one row per
+    respondent and one ``mask_<chunk>`` column per 64 options. Bit ``b`` of
+    chunk ``c`` holds option position ``64 * c + b``.
+    """
+    frame = pl.DataFrame(
+        [op_selected.alias(str(i)) for i, op_selected in enumerate(selected)]
+    )
+    return frame.select(
+        pl.sum_horizontal(
+            pl.col(str(position)).cast(pl.UInt64)
+            * pl.lit(1 << (position % _MASK_BITS), dtype=pl.UInt64)
+            for position in range(start, min(start + _MASK_BITS, len(selected)))
+        ).alias(f"mask_{start // _MASK_BITS}")
+        for start in range(0, len(selected), _MASK_BITS)
+    )
+
+
+class PackedSelections(Mapping):
+    """
+    Multiple choice data packed by ``pack_selections``: the ``UInt64``
+    bitmasks of ``_pack_selected`` and the option indexes in bit order. As a
+    mapping of option index to column it unpacks each option on demand, so
+    it can stand in for the option columns it replaces.
+    """
+
+    def __init__(self, masks: pl.DataFrame, option_indexes: list[int]) -> None:
+        self.masks = masks
+        self.option_indexes = option_indexes
+
+    def __getitem__(self, op_index: int) -> pl.Series:
+        if op_index not in self.option_indexes:
+            raise KeyError(op_index)
+        chunk, bit = divmod(self.option_indexes.index(op_index), _MASK_BITS)
+        return self.masks.select(
+            ((pl.col(f"mask_{chunk}") & pl.lit(1 << bit, dtype=pl.UInt64)) != 0).alias(
+                str(op_index)
+            )
+        ).to_series()
+
+    def __iter__(self):
+        return iter(self.option_indexes)
+
+    def __len__(self) -> int:
+        return len(self.option_indexes)
+
+
+def pack_selections(data: Mapping) -> PackedSelections:
+    """Return multiple choice ``data``, option index -> column, packed."""
+    option_indexes = sorted(data)
+    selected = [_is_selected(as_series(data[op_index])) for op_index in option_indexes]
+    if len({len(op_selected) for op_selected in selected}) > 1:
+        raise DataError("Length of Multiple question data columns must be equal")
+    return PackedSelections(_pack_selected(selected), option_indexes)
+
+
 class MultipleStrategy(QuestionStrategy):
+    """
+    With ``packed=True``, or ``data`` from ``pack_selections``, the
+    selections are kept only as the ``UInt64`` bitmasks of ``masks``, about
+    one bit per respondent and option, and the columns are unpacked on
+    demand. ``n_selected``, ``any_of``, ``all_of`` and ``co_selection`` run
+    as bitwise operations on the masks either way.
+    """
+
+    _multi_valued = True
+
     def __init__(
         self,
         **kwargs,
@@ -53,43 +157,212 @@ class MultipleStrategy(QuestionStrategy):
         self.id: str = kwargs["id"]
         self.text: str = kwargs["text"]
         self.options: list[Option] = kwargs["options"]
-        self.response_ids: list = kwargs["response_ids"]
-        _validate_data(
+        self.response_ids: pl.Series | list = kwargs["response_ids"]
+        self.weights: pl.Series | None = kwargs.get("weights")
+        self.mask: pl.Series | None = kwargs.get("mask")
+        self.stats: BuildStats | None = kwargs.get("stats")
+        self._timed(
+            "validate",
+            _validate_data,
             kwargs["data"],
             self.options,
             self.response_ids,
         )
-        self.raw_data: dict[int, list] = kwargs["data"]
+        data = kwargs["data"]
+        if kwargs.get("packed", False) and not isinstance(data, PackedSelections):
+            data = pack_selections(data)
+        self.packed: bool = isinstance(data, PackedSelections)
+        self.raw_data: dict[int, pl.Series] | None = None
+        if self.packed:
+            self._option_indexes: list[int] = data.option_indexes
+            self.masks = data.masks
+        else:
+            self.raw_data = {
+                op_index: as_series(op_data) for op_index, op_data in data.items()
+            }
+            self._option_indexes = sorted(self.raw_data)
 
     def _option_mapping(self, _type: Literal["t2n", "n2t"]) -> dict:
         if _type == "t2n":
             return {op.text: op.index for op in self.options}
         return {op.index: op.text for op in self.options}
 
-    @property
-    def number_data(self) -> dict[str, list]:
-        return _to_number_data(self.raw_data, self._option_mapping("n2t"))
+    @cached_property
+    def masks(self) -> pl.DataFrame:
+        return _pack_selected(
+            [_is_selected(self.raw_data[op_index]) for op_index in self._option_indexes]
+        )
+
+    def _bit(self, op_index: int) -> pl.Expr:
+        chunk, bit = divmod(self._option_indexes.index(op_index), _MASK_BITS)
+        return (pl.col(f"mask_{chunk}") & pl.lit(1 << bit, dtype=pl.UInt64)) != 0
+
+    def _selections(self) -> dict[int, pl.Series]:
+        """Return a boolean mask of respondents per option index, in order."""
+        if self.raw_data is None:
+            return dict(
+                zip(
+                    self._option_indexes,
+                    self.masks.select(
+                        self._bit(op_index).alias(str(op_index))
+                        for op_index in self._option_indexes
+                    ).get_columns(),
+                )
+            )
+        return {
+            op_index: _is_selected(self.raw_data[op_index])
+            for op_index in self._option_indexes
+        }
+
+    @cached_property
+    def number_data(self) -> dict[str, pl.Series]:
+        return _to_number_data(self._selections(), self._option_mapping("n2t"))
 
-    @property
-    def text_data(self) -> dict[str, list]:
-        return _to_text_data(self.raw_data, self._option_mapping("n2t"))
+    @cached_property
+    def text_data(self) -> dict[str, pl.Series]:
+        return _to_text_data(self._selections(), self._option_mapping("n2t"))
+
+    def _query_masks(self, options: list[str | int]) -> list[int]:
+        """Return the bitmask of ``options``, by option text or index, per chunk."""
+        t2n = self._option_mapping("t2n")
+        query = [0] * self.masks.width
+        for option in options:
+            op_index = t2n.get(option, option)
+            if op_index not in self._option_indexes:
+                raise DataError(f"Option does not exist: {option}")
+            chunk, bit = divmod(self._option_indexes.index(op_index), _MASK_BITS)
+            query[chunk] |= 1 << bit
+        return query
+
+    def n_selected(self) -> pl.Series:
+        """Return the number of options each respondent selected."""
+        return (
+            self._masked(self.masks)
+            .select(pl.sum_horizontal(pl.all().bitwise_count_ones()).alias(self.id))
+            .to_series()
+        )
+
+    def _match(self, options: list[str | int], match_all: bool) -> pl.Series:
+        matches = [
+            (pl.col(f"mask_{chunk}") & pl.lit(query, dtype=pl.UInt64))
+            == pl.lit(query, dtype=pl.UInt64)
+            if match_all
+            else (pl.col(f"mask_{chunk}") & pl.lit(query, dtype=pl.UInt64)) != 0
+            for chunk, query in enumerate(self._query_masks(options))
+            if query
+        ]
+        masks = self._masked(self.masks)
+        if not matches:
+            return pl.repeat(match_all, masks.height, eager=True).alias(self.id)
+        combine = pl.all_horizontal if match_all else pl.any_horizontal
+        return masks.select(combine(matches).alias(self.id)).to_series()
+
+    def any_of(self, options: list[str | int]) -> pl.Series:
+        """Return whether each respondent selected at least one of ``options``."""
+        return self._match(options, match_all=False)
+
+    def all_of(self, options: list[str | int]) -> pl.Series:
+        """Return whether each respondent selected every one of ``options``."""
+        return self._match(options, match_all=True)
+
+    def co_selection(self) -> pl.DataFrame:
+        """
+        Return how many respondents selected each pair of options, with one
+        row and one column per option; the diagonal holds the option counts.
+
+        The masks are transposed into one bitset over respondents per option,
+        64 respondents per word, so each pair is counted by popcounts of
+        ``n / 64`` ANDed words.
+        """
+        places = pl.Series([1 << bit for bit in range(_MASK_BITS)], dtype=pl.UInt64)
+        words = (
+            self._masked(self.masks)
+            .with_row_index("row")
+            .with_columns(
+                pl.lit(places).gather(pl.col("row") % _MASK_BITS).alias("place"),
+                (pl.col("row") // _MASK_BITS).alias("word"),
+            )
+            .select(
+                "word",
+                *(
+                    pl.when(self._bit(op_index))
+                    .then("place")
+                    .otherwise(pl.lit(0, dtype=pl.UInt64))
+                    .alias(str(op_index))
+                    for op_index in self._option_indexes
+                ),
+            )
+            .group_by("word")
+            .agg(pl.all().sum())
+        )
+        pairs = [
+            (row_index, col_index)
+            for position, row_index in enumerate(self._option_indexes)
+            for col_index in self._option_indexes[position:]
+        ]
+        counts = dict(
+            zip(
+                pairs,
+                words.select(
+                    (pl.col(str(row_index)) & pl.col(str(col_index)))
+                    .bitwise_count_ones()
+                    .sum()
+                    .alias(f"{row_index}:{col_index}")
+                    for row_index, col_index in pairs
+                ).row(0),
+            )
+        )
+
+        counts.update({(col, row): count for (row, col), count in counts.items()})
+        n2t = self._option_mapping("n2t")
+        return pl.DataFrame(
+            {
+                self.id: [str(n2t[op_index]) for op_index in self._option_indexes],
+                **{
+                    str(n2t[col_index]): pl.Series(
+                        [
+                            counts[(row_index, col_index)]
+                            for row_index in self._option_indexes
+                        ],
+                        dtype=pl.UInt32,
+                    )
+                    for col_index in self._option_indexes
+                },
+            },
+            schema_overrides={self.id: option_enum(self.options)},
+        )
 
     def get_df(self, dtype: Literal["number", "text"]) -> pl.DataFrame:
         data = self.text_data if dtype == "text" else self.number_data
-        return pl.DataFrame({**{Identifier.Id: self.response_ids, **data}})
+        return self._masked(
+            pl.DataFrame({**{Identifier.Id: self.response_ids, **data}})
+        )
 
     def describe(self) -> pl.DataFrame:
-        df = self.get_df(dtype="number")
+        return self._describe_summary(self._timed("count", self._counts().collect))
 
-        describe_df = (
-            df.unpivot(index=Identifier.Id, variable_name=self.id)
-            .filter(pl.col("value"))
-            .group_by(self.id)
-            .agg(pl.n_unique(Identifier.Id).alias("count"))
-            .with_columns(
-                (pl.col("count") / pl.sum("count")).alias("percent"),
-                (pl.col("count") / pl.sum("count")).cum_sum().alias("cum_percent"),
-            )
+    def _columns(self, dtype: Literal["number", "text"]) -> dict[str, pl.Series]:
+        data = self.text_data if dtype == "text" else self.number_data
+        return {
+            f"{self.id}{Identifier.Multiple}{op_index}": op_data
+            for op_index, op_data in zip(self._option_indexes, data.values())
+        }
+
+    def _long_df(self) -> pl.LazyFrame:
+        return pl.concat(
+            [
+                long_selected(op_selected, op_index)
+                for op_index, op_selected in self._selections().items()
+            ]
+        )
+
+    def _describe_summary(self, counts: pl.DataFrame) -> pl.DataFrame:
+        return frequency_table(counts).select(
+            self._label_values(pl.col("value")).alias(self.id),
+            "count",
+            "percent",
+            "cum_percent",
         )
 
-        return describe_df
+    def _label_values(self, values: pl.Expr) -> pl.Expr:
+        return option_labels(values, self.options)
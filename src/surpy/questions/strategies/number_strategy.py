@@ -1,10 +1,151 @@
+import math
+from functools import cached_property
+from typing import Literal
 import polars as pl
 
-from .strategy import QuestionStrategy
+from .strategy import QuestionStrategy, as_series, long_values
 from ..option import Option
+from ...errors import DataError
+from ...instrumentation import BuildStats
+from ...config import Identifier
+
+
+_QUANTILES = (0.25, 0.5, 0.75)
+
+
+def _validate_data(data: dict, response_ids: pl.Series | list) -> None:
+    if 1 not in data:
+        raise DataError("Number question data must have 1 in keys")
+
+    if len(data) != 1:
+        raise DataError("Number question data can only have one key")
+
+    values = as_series(data[1])
+
+    if len(values) != len(response_ids):
+        raise DataError("Length mismatch")
+
+    if not (values.dtype in (pl.String, pl.Null) or values.dtype.is_numeric()):
+        raise DataError("Invalid data type")
+
+
+def _to_number_data(data: pl.Series | list) -> pl.Series:
+    data = as_series(data)
+    if data.dtype == pl.String:
+        return data.str.strip_chars().cast(pl.Float64, strict=False)
+    if data.dtype == pl.Null:
+        return data.cast(pl.Float64)
+    return data
+
+
+def _centroids(values: pl.Series, weights: pl.Series | None = None) -> pl.DataFrame:
+    """Return a sketch holding every answered value as its own centroid."""
+    return (
+        pl.DataFrame(
+            {
+                "value": values.cast(pl.Float64),
+                "count": pl.repeat(1.0, len(values), eager=True)
+                if weights is None
+                else weights.cast(pl.Float64),
+            }
+        )
+        .filter(pl.col("value").is_not_null() & (pl.col("count") > 0))
+        .sort("value")
+        .with_columns(
+            pl.lit(0.0).alias("m2"),
+            pl.col("value").alias("min"),
+            pl.col("value").alias("max"),
+        )
+    )
+
+
+def _compress(centroids: pl.DataFrame, compression: int) -> pl.DataFrame:
+    """
+    Merge neighbouring centroids t-digest style: clusters are narrow in the
+    tails and wide around the median, so about ``compression`` centroids
+    are kept whatever the number of values. Count, mean, variance, min and
+    max stay exact; only quantiles become approximate.
+    """
+    count = pl.col("count")
+    value = pl.col("value")
+    q = (count.cum_sum() - count / 2) / count.sum()
+    mean = (value * count).sum() / count.sum()
+    return (
+        centroids.sort("value")
+        .with_columns(
+            ((((2 * q - 1).arcsin() / math.pi) + 0.5) * compression)
+            .floor()
+            .alias("cluster")
+        )
+        .group_by("cluster")
+        .agg(
+            mean.alias("value"),
+            count.sum(),
+            (pl.col("m2").sum() + (count * (value - mean) ** 2).sum()).alias("m2"),
+            pl.col("min").min(),
+            pl.col("max").max(),
+        )
+        .sort("value")
+        .drop("cluster")
+    )
+
+
+def _moments(sketch: pl.DataFrame) -> dict[str, float | None]:
+    if sketch.is_empty():
+        return {"count": 0.0, "mean": None, "std": None, "min": None, "max": None}
+    count = pl.col("count")
+    value = pl.col("value")
+    n = count.sum()
+    mean = (value * count).sum() / n
+    m2 = pl.col("m2").sum() + (count * (value - mean) ** 2).sum()
+    return sketch.select(
+        n.alias("count"),
+        mean.alias("mean"),
+        pl.when(n > 1).then((m2 / (n - 1)).sqrt()).alias("std"),
+        pl.col("min").min(),
+        pl.col("max").max(),
+    ).row(0, named=True)
+
+
+def _quantile(sketch: pl.DataFrame, q: float) -> float | None:
+    """
+    Interpolate quantile ``q`` between the centroids, each placed at the
+    middle of its cumulative count, with the min and max at both ends.
+
+    With one centroid per answer this is the midpoint (Hazen) definition,
+    type 5 of Hyndman and Fan: the k-th of n sorted answers sits at
+    ``(k - 0.5) / n``. It differs from the ``linear`` (type 7) default of
+    ``pl.Series.quantile`` on small samples.
+    """
+    if sketch.is_empty():
+        return None
+    n = sketch["count"].sum()
+    positions = pl.concat(
+        [
+            pl.Series([0.0]),
+            sketch["count"].cum_sum() - sketch["count"] / 2,
+            pl.Series([n]),
+        ]
+    )
+    values = pl.concat([sketch["min"].head(1), sketch["value"], sketch["max"].tail(1)])
+    target = q * n
+    index = min(max(positions.search_sorted(target), 1), len(positions) - 1)
+    x0, x1 = positions[index - 1], positions[index]
+    y0, y1 = values[index - 1], values[index]
+    if x1 == x0:
+        return y1
+    return y0 + (y1 - y0) * (target - x0) / (x1 - x0)
 
 
 class NumberStrategy(QuestionStrategy):
+    """
+    Statistics are computed from a sketch of weighted centroids. ``describe``
+    keeps one centroid per answer, so its quantiles are the exact midpoint
+    quantiles of the answers (see ``_quantile``); the summaries used for
+    streaming are compressed to about ``compression`` centroids, which keeps
+    memory bounded and lets the summaries of chunks or waves be merged.
+    """
+
     def __init__(
         self,
         **kwargs,
@@ -12,14 +153,127 @@ class NumberStrategy(QuestionStrategy):
         self.id: str = kwargs["id"]
         self.text: str = kwargs["text"]
         self.options: list[Option] = kwargs["options"]
-        self.data: dict = kwargs["data"]
-        self.response_ids: dict = kwargs["response_ids"]
+        self.response_ids: pl.Series | list = kwargs["response_ids"]
+        self.weights: pl.Series | None = kwargs.get("weights")
+        self.mask: pl.Series | None = kwargs.get("mask")
+        self.stats: BuildStats | None = kwargs.get("stats")
+        self.compression: int = kwargs.get("compression", 100)
+        self._timed("validate", _validate_data, kwargs["data"], self.response_ids)
+        self.raw_data: pl.Series = as_series(kwargs["data"][1])
+
+    @cached_property
+    def number_data(self) -> pl.Series:
+        return _to_number_data(self.raw_data)
+
+    def get_df(self, dtype: Literal["number", "text"] = "number") -> pl.DataFrame:
+        return self._masked(
+            pl.DataFrame(
+                [
+                    as_series(self.response_ids).alias(Identifier.Id),
+                    *self._columns(dtype).values(),
+                ]
+            )
+        )
+
+    def describe(
+        self, quantiles: tuple[float, ...] = _QUANTILES, exact: bool = True
+    ) -> pl.DataFrame:
+        """
+        Return count, mean, std, min, the ``quantiles`` and max. Quantiles
+        use the midpoint (Hazen) definition, weighted by ``weights``. With
+        ``exact=False`` they come from the compressed sketch.
+        """
+        sketch = self._timed("sketch", self._sketch if exact else self._summarize)
+        return self._describe_summary(sketch, quantiles)
+
+    def histogram(
+        self, bins: int | list[float] = 10, exact: bool = True
+    ) -> pl.DataFrame:
+        """
+        Return the count of answers per bin, for ``bins`` equal-width bins
+        between min and max or between the given edges. The last bin
+        includes its upper edge; answers outside the edges are left out.
+        """
+        sketch = self._sketch() if exact else self._summarize()
+        if isinstance(bins, int):
+            moments = _moments(sketch)
+            low, high = moments["min"], moments["max"]
+            if low is None:
+                low = high = 0.0
+            edges = [low + (high - low) * i / bins for i in range(bins + 1)]
+        else:
+            edges = sorted(bins)
+        if len(edges) < 2:
+            raise DataError("A histogram needs at least two bin edges")
+
+        edge_series = pl.Series(edges, dtype=pl.Float64)
+        bin_index = (
+            pl.when(pl.col("value") == edge_series.max())
+            .then(len(edges) - 2)
+            .otherwise(
+                pl.lit(edge_series).search_sorted(pl.col("value"), side="right") - 1
+            )
+        )
+        counts = (
+            sketch.select(bin_index.cast(pl.Int64).alias("bin"), "count")
+            .filter(pl.col("bin").is_between(0, len(edges) - 2))
+            .group_by("bin")
+            .agg(pl.col("count").sum())
+        )
+        return (
+            pl.DataFrame(
+                {
+                    "bin": range(len(edges) - 1),
+                    "bin_start": edges[:-1],
+                    "bin_end": edges[1:],
+                },
+                schema={
+                    "bin": pl.Int64,
+                    "bin_start": pl.Float64,
+                    "bin_end": pl.Float64,
+                },
+            )
+            .join(counts, on="bin", how="left")
+            .select(
+                "bin_start",
+                "bin_end",
+                pl.col("count")
+                .fill_null(0)
+                .cast(pl.UInt32 if self.weights is None else pl.Float64),
+            )
+        )
+
+    def _columns(self, dtype: Literal["number", "text"]) -> dict[str, pl.Series]:
+        return {self.id: self.number_data.alias(self.id)}
+
+    def _long_df(self) -> pl.LazyFrame:
+        return long_values(self.number_data)
 
-    def _validate_data(self, data: dict) -> None: ...
+    def _sketch(self) -> pl.DataFrame:
+        return _centroids(
+            self._masked(self.number_data),
+            None if self.weights is None else self._masked(self.weights),
+        )
 
-    @property
-    def dtype(self) -> str: ...
+    def _summarize(self) -> pl.DataFrame:
+        return _compress(self._sketch(), self.compression)
 
-    def get_df(self) -> pl.DataFrame: ...
+    def _merge_summaries(self, summaries: list[pl.DataFrame]) -> pl.DataFrame:
+        return _compress(pl.concat(summaries), self.compression)
 
-    def describe(self) -> pl.DataFrame: ...
+    def _describe_summary(
+        self, summary: pl.DataFrame, quantiles: tuple[float, ...] = _QUANTILES
+    ) -> pl.DataFrame:
+        moments = _moments(summary)
+        statistics = {
+            "count": moments["count"],
+            "mean": moments["mean"],
+            "std": moments["std"],
+            "min": moments["min"],
+            **{f"p{round(q * 100, 2):g}": _quantile(summary, q) for q in quantiles},
+            "max": moments["max"],
+        }
+        return pl.DataFrame(
+            {"statistic": list(statistics), self.id: list(statistics.values())},
+            schema={"statistic": pl.String, self.id: pl.Float64},
+        )
@@ -1,10 +1,43 @@
+from functools import cached_property
+from typing import Literal
 import polars as pl
 
-from .strategy import QuestionStrategy
+from .strategy import QuestionStrategy, as_series, option_enum, option_labels
+from .single_strategy import _to_number_data
 from ..option import Option
+from ...errors import DataError
+from ...instrumentation import BuildStats
+from ...config import Identifier
+
+
+def _validate_data(data: dict, response_ids: pl.Series | list) -> None:
+    if not data:
+        raise DataError("Rank question data must not be empty")
+
+    if not all(isinstance(key, int) and key > 0 for key in data.keys()):
+        raise DataError("Key of Rank question must be a positive integer")
+
+    for rank_data in data.values():
+        values = as_series(rank_data)
+
+        if len(values) != len(response_ids):
+            raise DataError(
+                "Length of Rank question data must be equal to length of response ids"
+            )
+
+        if not (values.dtype in (pl.String, pl.Null) or values.dtype.is_integer()):
+            raise DataError("Invalid data type")
 
 
 class RankStrategy(QuestionStrategy):
+    """
+    The answers are held as a respondents x rank positions frame of option
+    codes, one column per position. Partial rankings leave the unused
+    positions null, and those are ignored by every statistic.
+    """
+
+    _has_items = True
+
     def __init__(
         self,
         **kwargs,
@@ -12,14 +45,126 @@ class RankStrategy(QuestionStrategy):
         self.id: str = kwargs["id"]
         self.text: str = kwargs["text"]
         self.options: list[Option] = kwargs["options"]
-        self.data: dict = kwargs["data"]
-        self.response_ids: dict = kwargs["response_ids"]
+        self.response_ids: pl.Series | list = kwargs["response_ids"]
+        self.weights: pl.Series | None = kwargs.get("weights")
+        self.mask: pl.Series | None = kwargs.get("mask")
+        self.stats: BuildStats | None = kwargs.get("stats")
+        self._timed("validate", _validate_data, kwargs["data"], self.response_ids)
+        self.raw_data: dict[int, pl.Series] = {
+            rank_index: as_series(rank_data)
+            for rank_index, rank_data in sorted(kwargs["data"].items())
+        }
+
+    def _option_mapping(self, _type: Literal["t2n", "n2t"]) -> dict:
+        if _type == "t2n":
+            return {op.text: op.index for op in self.options}
+        return {op.index: op.text for op in self.options}
+
+    @cached_property
+    def number_data(self) -> pl.DataFrame:
+        t2n = self._option_mapping("t2n")
+        return pl.DataFrame(
+            [
+                _to_number_data(rank_data, t2n).alias(str(rank_index))
+                for rank_index, rank_data in self.raw_data.items()
+            ]
+        )
+
+    @cached_property
+    def text_data(self) -> pl.DataFrame:
+        return self.number_data.select(
+            pl.all().replace_strict(
+                {op.index: str(op.text) for op in self.options},
+                default=None,
+                return_dtype=option_enum(self.options),
+            )
+        )
+
+    def get_df(self, dtype: Literal["number", "text"]) -> pl.DataFrame:
+        return self._masked(
+            pl.DataFrame(
+                [
+                    as_series(self.response_ids).alias(Identifier.Id),
+                    *self._columns(dtype).values(),
+                ]
+            )
+        )
+
+    def describe(self) -> pl.DataFrame:
+        return self._describe_summary(self._timed("count", self._counts().collect))
+
+    def _columns(self, dtype: Literal["number", "text"]) -> dict[str, pl.Series]:
+        data = self.text_data if dtype == "text" else self.number_data
+        return {
+            f"{self.id}{Identifier.Rank}{column.name}": column.alias(
+                f"{self.id}{Identifier.Rank}{column.name}"
+            )
+            for column in data.get_columns()
+        }
+
+    def _long_df(self) -> pl.LazyFrame:
+        return (
+            self.number_data.lazy()
+            .with_row_index("row")
+            .unpivot(index="row", variable_name="item", value_name="value")
+            .select(
+                "row",
+                pl.col("item").cast(pl.UInt32),
+                pl.when(pl.col("value").is_in([op.index for op in self.options])).then(
+                    "value"
+                ),
+            )
+        )
+
+    def _describe_summary(self, counts: pl.DataFrame) -> pl.DataFrame:
+        """
+        Return one row per option with:
 
-    def _validate_data(self, data: dict) -> None: ...
+        - ``first_share``: share of the first choices given to the option;
+        - ``mean_rank``: mean position among the respondents who ranked it;
+        - ``borda``: Borda score, ``n_options - position + 1`` points per
+          ranking, so unranked options score nothing;
+        - ``rank_<position>``: how many respondents put it at each position.
+        """
+        n_options = len(self.options)
+        ranked = counts.filter(pl.col("value").is_not_null())
+        count = pl.col("count")
+        position = pl.col("item")
+        first_total = ranked.filter(position == 1)["count"].sum()
 
-    @property
-    def dtype(self) -> str: ...
+        stats = ranked.group_by("value").agg(
+            (
+                count.filter(position == 1).sum() / first_total
+                if first_total
+                else pl.lit(0.0)
+            ).alias("first_share"),
+            ((position.cast(pl.Float64) * count).sum() / count.sum()).alias(
+                "mean_rank"
+            ),
+            ((n_options - position.cast(pl.Int64) + 1) * count).sum().alias("borda"),
+            *(
+                count.filter(position == rank_index)
+                .sum()
+                .cast(counts.schema["count"])
+                .alias(f"rank_{rank_index}")
+                for rank_index in self.raw_data
+            ),
+        )
 
-    def get_df(self) -> pl.DataFrame: ...
+        return (
+            pl.DataFrame(
+                {"value": [op.index for op in self.options]},
+                schema={"value": counts.schema["value"]},
+            )
+            .join(stats, on="value", how="left")
+            .with_columns(
+                pl.col("first_share", "borda", "^rank_\\d+$").fill_null(0),
+            )
+            .select(
+                self._label_values(pl.col("value")).alias(self.id),
+                pl.exclude("value"),
+            )
+        )
 
-    def describe(self) -> pl.DataFrame: ...
+    def _label_values(self, values: pl.Expr) -> pl.Expr:
+        return option_labels(values, self.options)
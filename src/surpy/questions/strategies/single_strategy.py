@@ -1,44 +1,75 @@
+from functools import cached_property
 from typing import Literal
 import polars as pl
 
-from .strategy import QuestionStrategy
+from .strategy import (
+    QuestionStrategy,
+    as_series,
+    frequency_table,
+    long_values,
+    option_enum,
+    option_labels,
+)
 from ..option import Option
 from ...errors import DataError
+from ...instrumentation import BuildStats
 from ...config import Identifier
 
 
-def _validate_data(data: dict, response_ids: list) -> None:
+def _validate_data(data: dict, response_ids: pl.Series | list) -> None:
     if 1 not in data:
         raise DataError("Single question data must have 1 in keys")
 
     if len(data) != 1:
         raise DataError("Single question data can only have one key")
 
-    values = data[1]
+    values = as_series(data[1])
 
     if len(values) != len(response_ids):
         raise DataError("Length mismatch")
 
-    if not all(isinstance(d, (str, int, type(None))) for d in values):
+    if not (values.dtype in (pl.String, pl.Null) or values.dtype.is_integer()):
         raise DataError("Invalid data type")
 
 
 def _to_number_data(
-    data: list[str | int | float | None], option_mapping: dict[str, int]
-) -> list[int | None]:
-    if all([isinstance(d, (int, float, type(None))) for d in data]):
-        return [int(d) if d is not None else None for d in data]
-    return [
-        {**option_mapping, **{"None": None, "": None}}.get(d, None)
-        for d in [str(d) for d in data]
-    ]
+    data: pl.Series | list[str | int | float | None], option_mapping: dict[str, int]
+) -> pl.Series:
+    data = as_series(data)
+    if data.dtype.is_numeric() or data.dtype == pl.Null:
+        return data.cast(pl.Int64)
+    return data.cast(pl.String).replace_strict(
+        {str(text): index for text, index in option_mapping.items()},
+        default=None,
+        return_dtype=pl.Int64,
+    )
 
 
 def _to_text_data(
-    data: list[int | None], option_mapping: dict[int, str]
-) -> list[str | None]:
-    number_data: list[int] = [int(d) if d is not None else 0 for d in data]
-    return [{**option_mapping, **{0: ""}}.get(d, "") for d in number_data]
+    data: pl.Series | list[int | None], option_mapping: dict[int, str]
+) -> pl.Series:
+    return (
+        as_series(data)
+        .cast(pl.Int64)
+        .replace_strict(
+            {index: str(text) for index, text in option_mapping.items()},
+            default=None,
+            return_dtype=option_enum(
+                [
+                    Option(index=index, text=text)
+                    for index, text in option_mapping.items()
+                ]
+            ),
+        )
+    )
+
+
+def _to_option_codes(data: pl.Series, options: list[Option]) -> pl.Series:
+    """Return the option codes of ``data``, nulling codes that are not options."""
+    number_data = _to_number_data(data, {op.text: op.index for op in options})
+    return pl.select(
+        pl.when(number_data.is_in([op.index for op in options])).then(number_data)
+    ).to_series()
 
 
 class SingleStrategy(QuestionStrategy):
@@ -49,52 +80,52 @@ class SingleStrategy(QuestionStrategy):
         self.id: str = kwargs["id"]
         self.text: str = kwargs["text"]
         self.options: list[Option] = kwargs["options"]
-        self.response_ids: list = kwargs["response_ids"]
-        _validate_data(kwargs["data"], self.response_ids)
-        self.raw_data: list[str | int | float | None] = kwargs["data"][1]
+        self.response_ids: pl.Series | list = kwargs["response_ids"]
+        self.weights: pl.Series | None = kwargs.get("weights")
+        self.mask: pl.Series | None = kwargs.get("mask")
+        self.stats: BuildStats | None = kwargs.get("stats")
+        self._timed("validate", _validate_data, kwargs["data"], self.response_ids)
+        self.raw_data: pl.Series = as_series(kwargs["data"][1])
 
     def _option_mapping(self, _type: Literal["t2n", "n2t"]) -> dict:
         if _type == "t2n":
             return {op.text: op.index for op in self.options}
         return {op.index: op.text for op in self.options}
 
-    @property
-    def number_data(self) -> list[int | None]:
+    @cached_property
+    def number_data(self) -> pl.Series:
         return _to_number_data(self.raw_data, self._option_mapping("t2n"))
 
-    @property
-    def text_data(self):
+    @cached_property
+    def text_data(self) -> pl.Series:
         return _to_text_data(self.number_data, self._option_mapping("n2t"))
 
     def get_df(self, dtype: Literal["number", "text"]) -> pl.DataFrame:
-        return pl.DataFrame(
-            {
-                Identifier.Id: self.response_ids,
-                self.id: self.text_data if dtype == "text" else self.number_data,
-            }
+        return self._masked(
+            pl.DataFrame(
+                {
+                    Identifier.Id: self.response_ids,
+                    self.id: self.text_data if dtype == "text" else self.number_data,
+                }
+            )
         )
 
     def describe(self) -> pl.DataFrame:
-        df = self.get_df(dtype="text")
+        return self._describe_summary(self._timed("count", self._counts().collect))
 
-        describe_df = (
-            df.group_by(self.id)
-            .agg(
-                pl.n_unique(Identifier.Id).alias("count"),
-            )
-            .sort(pl.col(self.id).replace(self._option_mapping("t2n")))
-            .with_columns(
-                (pl.col("count") / pl.sum("count")).alias("percent"),
-                (pl.col("count") / pl.sum("count")).cum_sum().alias("cum_percent"),
-            )
-            .cast(
-                {
-                    self.id: pl.String,
-                    "count": pl.UInt32,
-                    "percent": pl.Float64,
-                    "cum_percent": pl.Float64,
-                }
-            )
+    def _columns(self, dtype: Literal["number", "text"]) -> dict[str, pl.Series]:
+        return {self.id: self.text_data if dtype == "text" else self.number_data}
+
+    def _long_df(self) -> pl.LazyFrame:
+        return long_values(_to_option_codes(self.number_data, self.options))
+
+    def _describe_summary(self, counts: pl.DataFrame) -> pl.DataFrame:
+        return frequency_table(counts).select(
+            self._label_values(pl.col("value")).alias(self.id),
+            "count",
+            "percent",
+            "cum_percent",
         )
 
-        return describe_df
+    def _label_values(self, values: pl.Expr) -> pl.Expr:
+        return option_labels(values, self.options)
@@ -1,9 +1,116 @@
+import copy
 from typing import Literal
 import polars as pl
 from abc import ABC, abstractmethod
 
+from ..option import Option
+from ...errors import DataError
+from ...instrumentation import BuildStats, timed
+
+
+def as_series(values: pl.Series | list) -> pl.Series:
+    """Return ``values`` as a Series, without copying when it already is one."""
+    if isinstance(values, pl.Series):
+        return values
+    return pl.Series(values, strict=False)
+
+
+def option_enum(options: list[Option]) -> pl.Enum:
+    """Return an Enum of the option texts, ordered by option index."""
+    texts = [str(op.text) for op in sorted(options, key=lambda op: op.index)]
+    if len(set(texts)) != len(texts):
+        raise DataError("Option texts must be unique")
+    return pl.Enum(texts)
+
+
+def option_labels(codes: pl.Expr, options: list[Option]) -> pl.Expr:
+    """Map option codes to their texts as an ``option_enum`` column."""
+    return codes.replace_strict(
+        {op.index: str(op.text) for op in options},
+        default=None,
+        return_dtype=option_enum(options),
+    )
+
+
+def item_labels(items: pl.Expr, sub_items: list) -> pl.Expr:
+    """Map 1-based sub-item indexes to their texts as an Enum column."""
+    if not sub_items:
+        return items
+    texts = [str(sub_item) for sub_item in sub_items]
+    return items.replace_strict(
+        {index: text for index, text in enumerate(texts, 1)},
+        default=None,
+        return_dtype=pl.Enum(texts),
+    )
+
+
+def long_values(values: pl.Series, item: int = 1) -> pl.LazyFrame:
+    """Return a long frame with one row per respondent for one column."""
+    return (
+        pl.LazyFrame({"value": values})
+        .with_row_index("row")
+        .select("row", pl.lit(item, dtype=pl.UInt32).alias("item"), "value")
+    )
+
+
+def long_selected(selected: pl.Series, value: int, item: int = 1) -> pl.LazyFrame:
+    """Return a long frame with one row per respondent who selected ``value``."""
+    return pl.LazyFrame({"row": selected.arg_true()}).select(
+        "row",
+        pl.lit(item, dtype=pl.UInt32).alias("item"),
+        pl.lit(value, dtype=pl.Int64).alias("value"),
+    )
+
+
+def mask_rows(long_df: pl.LazyFrame, mask: pl.Series | None) -> pl.LazyFrame:
+    """Keep the rows of a long frame whose respondent is selected by ``mask``."""
+    if mask is None:
+        return long_df
+    return long_df.filter(pl.lit(mask).gather(pl.col("row")))
+
+
+def weight_rows(long_df: pl.LazyFrame, weights: pl.Series | None) -> pl.LazyFrame:
+    """Add each respondent's weight to a long frame as a ``weight`` column."""
+    if weights is None:
+        return long_df
+    return long_df.with_columns(pl.lit(weights).gather(pl.col("row")).alias("weight"))
+
+
+def count_values(
+    long_df: pl.LazyFrame, by: list[str] | None = None, weighted: bool = False
+) -> pl.LazyFrame:
+    """
+    Count responses per ``item`` and ``value`` of a long frame, optionally
+    per extra ``by`` keys. These counts are all a frequency table needs.
+    Weighted counts sum the ``weight`` column added by ``weight_rows``.
+    """
+    count = pl.col("weight").sum() if weighted else pl.len().cast(pl.UInt32)
+    return long_df.group_by(*(by or []), "item", "value").agg(count.alias("count"))
+
+
+def frequency_table(counts: pl.DataFrame) -> pl.DataFrame:
+    """Sort counts by item and value and add percent and cum_percent per item."""
+    return (
+        counts.sort("item", "value")
+        .with_columns(
+            (pl.col("count") / pl.col("count").sum().over("item")).alias("percent")
+        )
+        .with_columns(pl.col("percent").cum_sum().over("item").alias("cum_percent"))
+    )
+
 
 class QuestionStrategy(ABC):
+    # Whether ``item`` in ``_long_df`` distinguishes sub-items or positions.
+    _has_items: bool = False
+    # Whether a respondent can have several values for the same item.
+    _multi_valued: bool = False
+
+    weights: pl.Series | None = None
+    # Respondents a filtered view is restricted to; None keeps everyone.
+    mask: pl.Series | None = None
+    # Per-phase statistics collector; see ``surpy.instrumentation``.
+    stats: BuildStats | None = None
+
     @abstractmethod
     def get_df(self, dtype: Literal["number", "text"]) -> pl.DataFrame:
         pass
@@ -11,3 +118,77 @@ class QuestionStrategy(ABC):
     @abstractmethod
     def describe(self) -> pl.DataFrame:
         pass
+
+    @abstractmethod
+    def _columns(self, dtype: Literal["number", "text"]) -> dict[str, pl.Series]:
+        """
+        Return the question's columns for a wide survey frame, keyed by their
+        data column codes and without the ``ID`` column.
+        """
+
+    @abstractmethod
+    def _long_df(self) -> pl.LazyFrame:
+        """
+        Return one row per response with columns ``row`` (respondent
+        position), ``item`` (sub-item, 1 when there is none) and ``value``
+        (option code).
+        """
+
+    @abstractmethod
+    def _describe_summary(self, summary: pl.DataFrame) -> pl.DataFrame:
+        """
+        Return the ``describe()`` output from a ``_summarize`` result: the
+        ``count_values`` counts, or the sketch of ``NumberStrategy``.
+        """
+
+    def _timed(self, phase: str, function, *args, **kwargs):
+        """Call ``function``, measured as ``<id>.<phase>`` when ``stats`` is set."""
+        return timed(self.stats, f"{self.id}.{phase}", function, *args, **kwargs)
+
+    def _masked_long_df(self) -> pl.LazyFrame:
+        """Return ``_long_df`` restricted to the respondents in ``mask``."""
+        return mask_rows(self._long_df(), self.mask)
+
+    def _masked(self, data: pl.DataFrame | pl.Series) -> pl.DataFrame | pl.Series:
+        """Return the rows of per-respondent ``data`` selected by ``mask``."""
+        if self.mask is None:
+            return data
+        return data.filter(self.mask)
+
+    def with_mask(self, mask: pl.Series | None) -> "QuestionStrategy":
+        """
+        Return a view of the strategy restricted to the respondents where
+        ``mask`` is True. The view is a shallow copy, so the data and any
+        cached conversions are shared rather than copied.
+        """
+        view = copy.copy(self)
+        view.mask = mask
+        return view
+
+    def _counts(self) -> pl.LazyFrame:
+        """Return ``count_values`` of ``_long_df``, weighted when weights are set."""
+        return count_values(
+            weight_rows(self._masked_long_df(), self.weights),
+            weighted=self.weights is not None,
+        )
+
+    def _summarize(self) -> pl.DataFrame:
+        """
+        Return the statistics ``describe()`` is derived from. Summaries of
+        disjoint sets of respondents combine with ``_merge_summaries``.
+        """
+        return self._counts().collect()
+
+    def _merge_summaries(self, summaries: list[pl.DataFrame]) -> pl.DataFrame:
+        counts = pl.concat(summaries)
+        return counts.group_by("item", "value").agg(
+            pl.col("count").sum().cast(counts.schema["count"])
+        )
+
+    def _label_items(self, items: pl.Expr) -> pl.Expr:
+        """Return display labels for the ``item`` column of ``_long_df``."""
+        return items
+
+    def _label_values(self, values: pl.Expr) -> pl.Expr:
+        """Return display labels for the ``value`` column of ``_long_df``."""
+        return values
@@ -1,10 +1,48 @@
+from functools import cached_property
+from typing import Literal
 import polars as pl
 
-from .strategy import QuestionStrategy
+from .strategy import QuestionStrategy, as_series
 from ..option import Option
+from ...errors import DataError
+from ...instrumentation import BuildStats
+from ...config import Identifier
+
+
+_TOKEN_PATTERN = r"\w+"
+
+
+def _validate_data(data: dict, response_ids: pl.Series | list) -> None:
+    if 1 not in data:
+        raise DataError("Text question data must have 1 in keys")
+
+    if len(data) != 1:
+        raise DataError("Text question data can only have one key")
+
+    values = as_series(data[1])
+
+    if len(values) != len(response_ids):
+        raise DataError("Length mismatch")
+
+    if values.dtype not in (pl.String, pl.Null):
+        raise DataError("Invalid data type")
+
+
+def tokenize(text: pl.Expr) -> pl.Expr:
+    """Return the lowercased word tokens of each text as a list column."""
+    return text.str.to_lowercase().str.extract_all(_TOKEN_PATTERN)
 
 
 class TextStrategy(QuestionStrategy):
+    """
+    Answers are tokenized with vectorized polars string expressions into one
+    row per respondent and distinct term. ``describe`` counts respondents
+    per term, and an inverted index over the same rows answers ``search``
+    and ``mentions`` with a dict lookup and a slice of the postings.
+    """
+
+    _multi_valued = True
+
     def __init__(
         self,
         **kwargs,
@@ -12,14 +50,105 @@ class TextStrategy(QuestionStrategy):
         self.id: str = kwargs["id"]
         self.text: str = kwargs["text"]
         self.options: list[Option] = kwargs["options"]
-        self.data: dict = kwargs["data"]
-        self.response_ids: dict = kwargs["response_ids"]
+        self.response_ids: pl.Series | list = kwargs["response_ids"]
+        self.weights: pl.Series | None = kwargs.get("weights")
+        self.mask: pl.Series | None = kwargs.get("mask")
+        self.stats: BuildStats | None = kwargs.get("stats")
+        self._timed("validate", _validate_data, kwargs["data"], self.response_ids)
+        self.raw_data: pl.Series = as_series(kwargs["data"][1]).cast(pl.String)
+
+    @cached_property
+    def _ids(self) -> pl.Series:
+        return as_series(self.response_ids)
+
+    def get_df(self, dtype: Literal["number", "text"] = "text") -> pl.DataFrame:
+        return self._masked(
+            pl.DataFrame(
+                [self._ids.alias(Identifier.Id), *self._columns(dtype).values()]
+            )
+        )
+
+    def describe(self) -> pl.DataFrame:
+        return self._describe_summary(self._timed("count", self._counts().collect))
+
+    def _columns(self, dtype: Literal["number", "text"]) -> dict[str, pl.Series]:
+        return {self.id: self.raw_data.alias(self.id)}
 
-    def _validate_data(self, data: dict) -> None: ...
+    @cached_property
+    def _tokens(self) -> pl.DataFrame:
+        return (
+            pl.LazyFrame({"value": self.raw_data})
+            .with_row_index("row")
+            .select("row", tokenize(pl.col("value")).list.unique())
+            .explode("value")
+            .filter(pl.col("value").is_not_null())
+            .select("row", pl.lit(1, dtype=pl.UInt32).alias("item"), "value")
+            .collect()
+        )
+
+    def _long_df(self) -> pl.LazyFrame:
+        """Return one row per respondent and distinct term, ``value`` the term."""
+        return self._tokens.lazy()
+
+    def _describe_summary(self, counts: pl.DataFrame) -> pl.DataFrame:
+        """Return respondents per term, most mentioned first."""
+        return (
+            counts.sort(["count", "value"], descending=[True, False])
+            .with_columns((pl.col("count") / pl.col("count").sum()).alias("percent"))
+            .select(pl.col("value").alias(self.id), "count", "percent")
+        )
+
+    @cached_property
+    def _postings(self) -> tuple[dict[str, tuple[int, int]], pl.Series]:
+        """
+        Return the inverted index, term -> (offset, length) in the postings,
+        and the postings: respondent positions grouped by term, in order.
+        """
+        postings = self._tokens.group_by("value").agg(pl.col("row").sort())
+        lengths = postings["row"].list.len()
+        index = dict(
+            zip(
+                postings["value"].to_list(),
+                zip((lengths.cum_sum() - lengths).to_list(), lengths.to_list()),
+            )
+        )
+        return index, postings["row"].explode()
 
     @property
-    def dtype(self) -> str: ...
+    def terms(self) -> list[str]:
+        return sorted(self._postings[0])
+
+    def _rows(self, term: str) -> pl.Series:
+        index, rows = self._postings
+        offset, length = index.get(term.lower(), (0, 0))
+        return rows.slice(offset, length)
+
+    def search(self, term: str) -> pl.Series:
+        """Return the ids of the respondents whose answer contains ``term``."""
+        rows = self._rows(term)
+        if self.mask is not None:
+            rows = rows.filter(self.mask.gather(rows))
+        return self._ids.gather(rows)
 
-    def get_df(self) -> pl.DataFrame: ...
+    def mentions(self, terms: list[str], match_all: bool = False) -> pl.Series:
+        """
+        Return whether each respondent mentioned any of ``terms``, or all of
+        them with ``match_all=True``.
+        """
+        if match_all and not terms:
+            return self._masked(
+                pl.repeat(True, len(self.raw_data), eager=True).alias(self.id)
+            )
 
-    def describe(self) -> pl.DataFrame: ...
+        rows = [self._rows(term) for term in terms]
+        if match_all:
+            selected = rows[0]
+            for term_rows in rows[1:]:
+                selected = selected.filter(selected.is_in(term_rows.implode()))
+        else:
+            selected = pl.concat(rows) if rows else pl.Series(dtype=pl.UInt32)
+        return self._masked(
+            pl.repeat(False, len(self.raw_data), eager=True)
+            .scatter(selected, True)
+            .alias(self.id)
+        )
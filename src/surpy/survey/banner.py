@@ -0,0 +1,275 @@
+import polars as pl
+
+from ..errors import DataError
+from ..questions.strategies import (
+    MultipleStrategy,
+    NumberStrategy,
+    SingleStrategy,
+    TextStrategy,
+)
+from ..questions.strategies.strategy import QuestionStrategy, as_series, weight_rows
+from .crosstab import _total
+from .significance import TOTAL, add_chi_square_tests, add_column_tests
+
+
+def _squared_total(weights: pl.Series | None) -> pl.Expr:
+    if weights is None:
+        return pl.len().cast(pl.Float64)
+    return (pl.col("weight") ** 2).sum()
+
+
+def _banner_points(strategy: QuestionStrategy | None) -> list[pl.Expr]:
+    """
+    Return expressions of the banner point, as ``banner_value``, that the
+    respondent of each answer ``row`` falls in, null when none. A single
+    choice banner needs one expression; a multiple choice banner needs one
+    per option, since a respondent can be in several of its points. None
+    stands for the ``Total`` point.
+    """
+    row = pl.col("row")
+    if strategy is None:
+        return [pl.lit(1, dtype=pl.Int64)]
+    if isinstance(strategy, SingleStrategy):
+        points = [pl.lit(strategy.number_data.cast(pl.Int64)).gather(row)]
+    else:
+        points = [
+            pl.when(pl.lit(selected).gather(row)).then(pl.lit(op_index, dtype=pl.Int64))
+            for op_index, selected in strategy._selections().items()
+        ]
+    if strategy.mask is None:
+        return points
+    return [pl.when(pl.lit(strategy.mask).gather(row)).then(point) for point in points]
+
+
+def _answered(answers: pl.DataFrame, n: int) -> pl.DataFrame:
+    """
+    Return one row per respondent and item of ``answers`` with at least one
+    answer, found by scattering each item's rows into a mask of the ``n``
+    respondents rather than by a unique over all answers.
+    """
+    if answers.is_empty():
+        return answers.select("row", "item")
+    return pl.concat(
+        [
+            pl.DataFrame(
+                {
+                    "row": pl.repeat(False, n, eager=True)
+                    .scatter(rows["row"], True)
+                    .arg_true()
+                }
+            ).with_columns(pl.lit(item, dtype=pl.UInt32).alias("item"))
+            for (item,), rows in answers.partition_by("item", as_dict=True).items()
+        ]
+    )
+
+
+def _answers(
+    strategy: QuestionStrategy, weights: pl.Series | None
+) -> tuple[pl.LazyFrame, pl.LazyFrame]:
+    """
+    Return the question's answers, weighted when ``weights`` are set, and
+    the (respondent, item) pairs its bases count, both collected once so
+    every banner reuses them.
+    """
+    answers = strategy._masked_long_df().filter(pl.col("value").is_not_null()).collect()
+    # A respondent is in one cell per (item, banner point) unless the
+    # question is multi-valued; only those are deduplicated for the base.
+    answered = (
+        _answered(answers, len(as_series(strategy.response_ids)))
+        if strategy._multi_valued
+        else answers
+    )
+    return weight_rows(answers.lazy(), weights), weight_rows(answered.lazy(), weights)
+
+
+def _tabulate(
+    answers: pl.LazyFrame,
+    answered: pl.LazyFrame,
+    points: list[pl.Expr],
+    weights: pl.Series | None,
+) -> pl.DataFrame:
+    """
+    Return the cells of one question against the ``points`` of one banner,
+    with the ``base`` of every (item, banner point) and its squared weights.
+    Banner points are looked up by respondent position rather than joined,
+    and each is counted on its own.
+    """
+
+    def _split(frame: pl.LazyFrame, point: pl.Expr) -> pl.LazyFrame:
+        return frame.with_columns(point.alias("banner_value")).filter(
+            pl.col("banner_value").is_not_null()
+        )
+
+    base_keys = ["item", "banner_value"]
+    cells = pl.concat(
+        [
+            _split(answers, point)
+            .group_by(*base_keys, "value")
+            .agg(
+                _total(weights).alias("count"),
+                _squared_total(weights).alias("count_sq"),
+            )
+            for point in points
+        ],
+        parallel=False,
+    )
+    bases = pl.concat(
+        [
+            _split(answered, point)
+            .group_by(base_keys)
+            .agg(
+                _total(weights).alias("base"),
+                _squared_total(weights).alias("base_sq"),
+            )
+            for point in points
+        ],
+        parallel=False,
+    )
+    return cells.join(bases, on=base_keys, how="left").collect()
+
+
+def _labels(
+    counts: pl.DataFrame,
+    questions: list[QuestionStrategy],
+    banners: list[QuestionStrategy],
+) -> tuple[pl.DataFrame, pl.DataFrame]:
+    """
+    Return the item and value labels of every counted (question, item,
+    value) and the label of every banner point, each question labelled by
+    its own strategy.
+    """
+    codes = counts.select("question", "item", "value").unique()
+    question_labels = pl.concat(
+        [
+            codes.filter(pl.col("question") == strategy.id).with_columns(
+                (
+                    strategy._label_items(pl.col("item")).cast(pl.String)
+                    if strategy._has_items
+                    else pl.lit(None, dtype=pl.String)
+                ).alias("item_label"),
+                strategy._label_values(pl.col("value"))
+                .cast(pl.String)
+                .alias("value_label"),
+            )
+            for strategy in questions
+        ]
+    )
+
+    points = counts.select("banner", "banner_value").unique()
+    banner_labels = pl.concat(
+        [
+            points.filter(pl.col("banner") == TOTAL).with_columns(
+                pl.lit(TOTAL).alias("banner_label")
+            ),
+            *(
+                points.filter(pl.col("banner") == strategy.id).with_columns(
+                    strategy._label_values(pl.col("banner_value"))
+                    .cast(pl.String)
+                    .alias("banner_label")
+                )
+                for strategy in banners
+            ),
+        ]
+    )
+    return question_labels, banner_labels
+
+
+def banner(
+    questions: list[QuestionStrategy],
+    banners: list[QuestionStrategy],
+    weights: pl.Series | None = None,
+    total: bool = True,
+    alpha: float | None = None,
+    chi_square: bool = False,
+) -> pl.DataFrame:
+    """
+    Tabulate every question against every point of every banner.
+
+    Each (question, banner) pair is tabulated on its own: every answer is
+    given the banner point its respondent falls in and the cells are
+    counted with a group-by over (item, value, banner value), so memory is
+    bounded by one question's answers rather than by all of them joined.
+    Questions are choice questions, banners are single or multiple choice
+    questions, and with ``total`` a ``Total`` point holding every respondent
+    comes first.
+
+    Returns one tidy row per cell with ``count``, the ``base`` of
+    respondents in the banner point who answered the question (sub-item),
+    its Kish ``effective_base`` (the base itself when unweighted) and
+    ``percent`` = count / base. Unanswered values are left out, and counts
+    are sums of ``weights`` when given. With ``alpha``, the column
+    proportion tests of ``add_column_tests`` are added, and with
+    ``chi_square`` the per-table tests of ``add_chi_square_tests``.
+    """
+    if not questions or not banners:
+        raise DataError("A banner needs at least one question and one banner")
+    for strategy in questions:
+        if isinstance(strategy, (NumberStrategy, TextStrategy)):
+            raise DataError(f"Banner question must be a choice question: {strategy.id}")
+    for strategy in banners:
+        if not isinstance(strategy, (SingleStrategy, MultipleStrategy)):
+            raise DataError(
+                f"Banner must be a single or multiple choice question: {strategy.id}"
+            )
+
+    question_dtype = pl.Enum([strategy.id for strategy in questions])
+    banner_dtype = pl.Enum(
+        [*([TOTAL] if total else []), *(strategy.id for strategy in banners)]
+    )
+    cell_keys = ["question", "item", "value", "banner", "banner_value"]
+    points = [
+        (banner_id, _banner_points(strategy))
+        for banner_id, strategy in [
+            *([(TOTAL, None)] if total else []),
+            *((strategy.id, strategy) for strategy in banners),
+        ]
+    ]
+    tables = []
+    for strategy in questions:
+        answers, answered = _answers(strategy, weights)
+        tables.extend(
+            _tabulate(answers, answered, banner_points, weights).with_columns(
+                pl.lit(strategy.id, dtype=question_dtype).alias("question"),
+                pl.lit(banner_id, dtype=banner_dtype).alias("banner"),
+            )
+            for banner_id, banner_points in points
+        )
+    counts = (
+        pl.concat(tables)
+        .select(*cell_keys, "count", "base", "count_sq", "base_sq")
+        .sort(cell_keys)
+    )
+
+    question_labels, banner_labels = _labels(counts, questions, banners)
+    table = (
+        counts.join(
+            question_labels,
+            on=["question", "item", "value"],
+            how="left",
+            maintain_order="left",
+        )
+        .join(
+            banner_labels,
+            on=["banner", "banner_value"],
+            how="left",
+            maintain_order="left",
+        )
+        .select(
+            "question",
+            pl.col("item_label").alias("item"),
+            pl.col("value_label").alias("value"),
+            "banner",
+            pl.col("banner_label").alias("banner_value"),
+            "count",
+            "base",
+            (pl.col("base").cast(pl.Float64) ** 2 / pl.col("base_sq")).alias(
+                "effective_base"
+            ),
+            (pl.col("count") / pl.col("base")).alias("percent"),
+        )
+    )
+    if alpha is not None:
+        table = add_column_tests(table, alpha)
+    if chi_square:
+        table = add_chi_square_tests(table)
+    return table
@@ -0,0 +1,164 @@
+import polars as pl
+import hashlib
+import json
+import os
+import shutil
+import uuid
+from collections.abc import Iterable
+from pathlib import Path
+
+_DATA_FILE = "data.arrow"
+_SURVEY_FILE = "survey.json"
+
+
+def _int_keys(layout: dict) -> dict:
+    return {
+        int(key): _int_keys(value) if isinstance(value, dict) else value
+        for key, value in layout.items()
+    }
+
+
+def _from_json_layout(layout: dict) -> dict:
+    # JSON object keys are strings; the indexes under each question are ints.
+    return {question_id: _int_keys(value) for question_id, value in layout.items()}
+
+
+def _hash_file(path: Path) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class BuildCache:
+    """
+    On-disk cache of built surveys.
+
+    Each entry holds the survey data as an uncompressed Arrow IPC file, so a
+    warm build is a memory-mapped read, next to a JSON file with the survey
+    metadata and the compiled column layout. Entries are keyed by the source
+    paths and by their modification time and size, or by a hash of their
+    content with ``hash_content=True``. Writing a new entry for the same
+    sources drops the stale ones, and when ``max_bytes`` is set the least
+    recently used entries are evicted to keep the directory under it.
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        max_bytes: int | None = None,
+        hash_content: bool = False,
+    ) -> None:
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+        self.hash_content = hash_content
+
+    def key(self, paths: Iterable[Path], *options) -> str:
+        paths = [Path(path).resolve() for path in paths]
+        source = hashlib.sha256(
+            json.dumps([[str(path) for path in paths], *options]).encode()
+        ).hexdigest()[:16]
+
+        version = hashlib.sha256()
+        for path in paths:
+            if self.hash_content:
+                version.update(_hash_file(path).encode())
+            else:
+                stat = path.stat()
+                version.update(f"{stat.st_mtime_ns}:{stat.st_size};".encode())
+
+        return f"{source}-{version.hexdigest()[:16]}"
+
+    def get(self, key: str) -> tuple[Path, dict, dict, dict] | None:
+        """
+        Return the data path, survey metadata, layout and question kinds of
+        an entry, or None on a miss.
+        """
+
+        entry = self.directory / key
+        survey_path = entry / _SURVEY_FILE
+        if not (survey_path.exists() and (entry / _DATA_FILE).exists()):
+            return None
+
+        with open(survey_path, "r") as f:
+            survey = json.load(f)
+        os.utime(survey_path)
+
+        return (
+            entry / _DATA_FILE,
+            survey["metadata"],
+            _from_json_layout(survey["layout"]),
+            survey["kinds"],
+        )
+
+    def put(
+        self, key: str, data: pl.DataFrame, metadata: dict, layout: dict, kinds: dict
+    ) -> Path:
+        """Write an entry and return the path of its data file."""
+
+        self.directory.mkdir(parents=True, exist_ok=True)
+        entry = self.directory / key
+        tmp_entry = self.directory / f".tmp-{uuid.uuid4().hex}"
+        tmp_entry.mkdir()
+
+        data.write_ipc(tmp_entry / _DATA_FILE, compression="uncompressed")
+        with open(tmp_entry / _SURVEY_FILE, "w") as f:
+            json.dump({"metadata": metadata, "layout": layout, "kinds": kinds}, f)
+
+        try:
+            tmp_entry.rename(entry)
+        except OSError:
+            # Another process wrote the same entry first.
+            shutil.rmtree(tmp_entry, ignore_errors=True)
+
+        source = key.split("-")[0]
+        for stale in self.directory.glob(f"{source}-*"):
+            if stale != entry:
+                shutil.rmtree(stale, ignore_errors=True)
+
+        self.evict(keep=key)
+
+        return entry / _DATA_FILE
+
+    def entries(self) -> list[Path]:
+        """Return the entries, least recently used first."""
+
+        if not self.directory.exists():
+            return []
+
+        return sorted(
+            (
+                entry
+                for entry in self.directory.iterdir()
+                if not entry.name.startswith(".") and (entry / _SURVEY_FILE).exists()
+            ),
+            key=lambda entry: (entry / _SURVEY_FILE).stat().st_mtime_ns,
+        )
+
+    def size(self) -> int:
+        return sum(
+            path.stat().st_size for entry in self.entries() for path in entry.iterdir()
+        )
+
+    def evict(self, keep: str | None = None) -> None:
+        if self.max_bytes is None:
+            return
+
+        entries = self.entries()
+        sizes = {
+            entry: sum(path.stat().st_size for path in entry.iterdir())
+            for entry in entries
+        }
+        total = sum(sizes.values())
+
+        for entry in entries:
+            if total <= self.max_bytes:
+                break
+            if entry.name == keep:
+                continue
+            shutil.rmtree(entry, ignore_errors=True)
+            total -= sizes[entry]
+
+    def clear(self) -> None:
+        shutil.rmtree(self.directory, ignore_errors=True)
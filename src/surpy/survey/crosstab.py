@@ -0,0 +1,112 @@
+import polars as pl
+
+from ..questions.strategies.strategy import QuestionStrategy
+
+
+def _total(weights: pl.Series | None) -> pl.Expr:
+    if weights is None:
+        return pl.len().cast(pl.UInt32)
+    return pl.col("weight").sum()
+
+
+def _base(
+    cells: pl.LazyFrame,
+    joined: pl.LazyFrame,
+    keys: list[str],
+    summable: bool,
+    weights: pl.Series | None,
+    name: str,
+) -> pl.LazyFrame:
+    """
+    Add the ``name`` base per ``keys`` to ``cells``. When every respondent
+    falls in exactly one of the cells summed over, the base is a sum of the
+    cell counts; otherwise respondents are deduplicated first.
+    """
+    if summable:
+        return cells.with_columns(pl.col("count").sum().over(keys).alias(name))
+    bases = (
+        joined.unique(["row", *keys]).group_by(keys).agg(_total(weights).alias(name))
+    )
+    return cells.join(bases, on=keys, how="left")
+
+
+def crosstab(
+    row: QuestionStrategy,
+    col: QuestionStrategy,
+    weights: pl.Series | None = None,
+) -> pl.DataFrame:
+    """
+    Tabulate ``row`` against ``col`` from their long frames.
+
+    Each respondent contributes to every (row value, column value) pair they
+    answered, so multiple choice questions expand to one category per option
+    and matrix and rank questions to one block per sub-item or position.
+    Returns one row per cell with ``count`` and row, column and total
+    percentages; counts are sums of ``weights`` when given.
+    """
+    joined = (
+        row._masked_long_df()
+        .rename({"item": "row_item", "value": "row_value"})
+        .join(
+            col._masked_long_df().rename({"item": "col_item", "value": "col_value"}),
+            on="row",
+        )
+    )
+    if weights is not None:
+        joined = joined.with_columns(
+            pl.lit(weights).gather(pl.col("row")).alias("weight")
+        )
+
+    cell_keys = ["row_item", "row_value", "col_item", "col_value"]
+    cells = joined.group_by(cell_keys).agg(_total(weights).alias("count"))
+    cells = _base(
+        cells,
+        joined,
+        ["row_item", "row_value", "col_item"],
+        not col._multi_valued,
+        weights,
+        "row_base",
+    )
+    cells = _base(
+        cells,
+        joined,
+        ["row_item", "col_item", "col_value"],
+        not row._multi_valued,
+        weights,
+        "col_base",
+    )
+    cells = _base(
+        cells,
+        joined,
+        ["row_item", "col_item"],
+        not (row._multi_valued or col._multi_valued),
+        weights,
+        "total_base",
+    )
+
+    labels = [
+        *(
+            [row._label_items(pl.col("row_item")).alias(f"{row.id}_item")]
+            if row._has_items
+            else []
+        ),
+        row._label_values(pl.col("row_value")).alias(row.id),
+        *(
+            [col._label_items(pl.col("col_item")).alias(f"{col.id}_item")]
+            if col._has_items
+            else []
+        ),
+        col._label_values(pl.col("col_value")).alias(col.id),
+    ]
+
+    return (
+        cells.sort(cell_keys)
+        .select(
+            *labels,
+            "count",
+            (pl.col("count") / pl.col("row_base")).alias("row_percent"),
+            (pl.col("count") / pl.col("col_base")).alias("col_percent"),
+            (pl.col("count") / pl.col("total_base")).alias("total_percent"),
+        )
+        .collect()
+    )
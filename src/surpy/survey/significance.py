@@ -0,0 +1,209 @@
+import math
+
+import polars as pl
+
+
+TOTAL = "Total"
+
+_POINT_KEYS = ["question", "item", "banner", "banner_value"]
+_CELL_KEYS = ["question", "item", "value", "banner", "banner_value"]
+_TABLE_KEYS = ["question", "item", "banner"]
+
+# Abramowitz & Stegun 7.1.26, absolute error below 1.5e-7.
+_ERFC_P = 0.3275911
+_ERFC_A = (0.254829592, -0.284496736, 1.421413741, -1.453152027, 1.061405429)
+
+
+def _erfc(x: pl.Expr) -> pl.Expr:
+    t = 1 / (1 + _ERFC_P * x.abs())
+    polynomial = pl.lit(0.0)
+    for a in reversed(_ERFC_A):
+        polynomial = (polynomial + a) * t
+    tail = polynomial * (-(x**2)).exp()
+    return pl.when(x >= 0).then(tail).otherwise(2 - tail)
+
+
+def _normal_sf(z: pl.Expr) -> pl.Expr:
+    """Return P(Z > z) for a standard normal Z."""
+    return 0.5 * _erfc(z / math.sqrt(2))
+
+
+def _chi_square_sf(x: pl.Expr, df: pl.Expr) -> pl.Expr:
+    """
+    Return P(X > x) for a chi-square X with ``df`` degrees of freedom:
+    exact for 1 and 2 degrees of freedom, otherwise by the Wilson-Hilferty
+    normal approximation of the cube root of X / df.
+    """
+    df = df.cast(pl.Float64)
+    z = ((x / df) ** (1 / 3) - (1 - 2 / (9 * df))) / (2 / (9 * df)).sqrt()
+    return (
+        pl.when(df == 1)
+        .then(_erfc((x / 2).sqrt()))
+        .when(df == 2)
+        .then((-x / 2).exp())
+        .when(df > 2)
+        .then(_normal_sf(z))
+    )
+
+
+def _grid(table: pl.DataFrame) -> pl.DataFrame:
+    """
+    Return every (value, banner point) pair of each table, excluding the
+    ``Total`` point, with a zero count where the banner table has no cell.
+    """
+    points = (
+        table.filter(pl.col("banner") != TOTAL)
+        .select(*_POINT_KEYS, "base", "effective_base")
+        .unique(_POINT_KEYS)
+    )
+    return (
+        table.select("question", "item", "value")
+        .unique()
+        .join(points, on=["question", "item"], nulls_equal=True)
+        .join(
+            table.select(*_CELL_KEYS, "count"),
+            on=_CELL_KEYS,
+            how="left",
+            nulls_equal=True,
+        )
+        .with_columns(pl.col("count").fill_null(0).cast(pl.Float64))
+        .with_columns((pl.col("count") / pl.col("base")).alias("percent"))
+    )
+
+
+def column_proportion_tests(table: pl.DataFrame) -> pl.DataFrame:
+    """
+    Return the pooled two-proportion z-test of every cell of a ``banner``
+    table against every other point of the same banner, ``other``.
+
+    All pairs of all tables are tested at once from a self-join of the
+    cells. Proportions are weighted, and the bases are the effective bases,
+    so weighting does not overstate significance. ``z`` is positive when the
+    cell's percent is higher than ``other``'s; ``p_value`` is two-sided.
+    """
+    grid = _grid(table)
+    p1, p2 = pl.col("percent"), pl.col("percent_other")
+    n1, n2 = pl.col("effective_base"), pl.col("effective_base_other")
+    pooled = (p1 * n1 + p2 * n2) / (n1 + n2)
+    se = (pooled * (1 - pooled) * (1 / n1 + 1 / n2)).sqrt()
+    return (
+        grid.join(
+            grid.select(
+                "question",
+                "item",
+                "value",
+                "banner",
+                "banner_value",
+                "percent",
+                "effective_base",
+            ),
+            on=["question", "item", "value", "banner"],
+            suffix="_other",
+            nulls_equal=True,
+        )
+        .filter(pl.col("banner_value") != pl.col("banner_value_other"))
+        .with_columns(pl.when(se > 0).then((p1 - p2) / se).otherwise(0.0).alias("z"))
+        .select(
+            *_CELL_KEYS,
+            pl.col("banner_value_other").alias("other"),
+            "z",
+            _erfc(pl.col("z").abs() / math.sqrt(2)).alias("p_value"),
+        )
+        .sort(*_CELL_KEYS, "other")
+    )
+
+
+def add_column_tests(table: pl.DataFrame, alpha: float = 0.05) -> pl.DataFrame:
+    """
+    Add ``higher_than`` to a ``banner`` table: the points of the same banner
+    whose percent the cell's percent is significantly higher than, at level
+    ``alpha``, by ``column_proportion_tests``.
+    """
+    higher = (
+        column_proportion_tests(table)
+        .filter((pl.col("z") > 0) & (pl.col("p_value") < alpha))
+        .group_by(_CELL_KEYS)
+        .agg(pl.col("other").alias("higher_than"))
+    )
+    return table.join(
+        higher, on=_CELL_KEYS, how="left", nulls_equal=True, maintain_order="left"
+    ).with_columns(pl.col("higher_than").fill_null([]))
+
+
+def chi_square_tests(table: pl.DataFrame) -> pl.DataFrame:
+    """
+    Return Pearson's chi-square test of independence of every (question,
+    item, banner) table of a ``banner`` table, all computed in one pass.
+
+    With weights, the statistic is scaled by the ratio of effective to
+    weighted bases, a first-order design effect correction. The p-value is
+    exact for 1 and 2 degrees of freedom and uses the Wilson-Hilferty
+    approximation beyond. For multi-valued questions the cells overlap, so
+    the test is only indicative.
+    """
+    count = pl.col("count")
+    row_total = count.sum().over(*_TABLE_KEYS, "value")
+    col_total = count.sum().over(_POINT_KEYS)
+    expected = row_total * col_total / count.sum().over(_TABLE_KEYS)
+    grid = _grid(table)
+    scale = (
+        grid.unique(_POINT_KEYS)
+        .group_by(_TABLE_KEYS)
+        .agg((pl.col("effective_base").sum() / pl.col("base").sum()).alias("scale"))
+    )
+    return (
+        grid.with_columns(
+            expected.alias("expected"),
+            row_total.alias("row_total"),
+            col_total.alias("col_total"),
+        )
+        .group_by(_TABLE_KEYS)
+        .agg(
+            ((count - pl.col("expected")) ** 2 / pl.col("expected"))
+            .filter(pl.col("expected") > 0)
+            .sum()
+            .alias("chi_square"),
+            (
+                (
+                    pl.col("value")
+                    .filter(pl.col("row_total") > 0)
+                    .n_unique()
+                    .cast(pl.Int64)
+                    - 1
+                )
+                * (
+                    pl.col("banner_value")
+                    .filter(pl.col("col_total") > 0)
+                    .n_unique()
+                    .cast(pl.Int64)
+                    - 1
+                )
+            )
+            .clip(0)
+            .alias("df"),
+        )
+        .join(scale, on=_TABLE_KEYS, nulls_equal=True)
+        .with_columns(pl.col("chi_square") * pl.col("scale"))
+        .select(
+            *_TABLE_KEYS,
+            "chi_square",
+            "df",
+            _chi_square_sf(pl.col("chi_square"), pl.col("df")).alias("p_value"),
+        )
+        .sort(_TABLE_KEYS)
+    )
+
+
+def add_chi_square_tests(table: pl.DataFrame) -> pl.DataFrame:
+    """
+    Add ``chi_square``, ``df`` and ``p_value`` to every row of a ``banner``
+    table from ``chi_square_tests`` of its (question, item, banner) table.
+    Rows of the ``Total`` point are not tested and hold nulls.
+    """
+    return table.join(
+        chi_square_tests(table),
+        on=_TABLE_KEYS,
+        how="left",
+        nulls_equal=True,
+        maintain_order="left",
+    )
@@ -0,0 +1,62 @@
+from collections.abc import Iterable
+
+import polars as pl
+
+from ..config import QuestionType
+from ..questions.question import Question
+from ..questions.strategies.strategy import QuestionStrategy
+
+
+stream_types = {
+    QuestionType.Single,
+    QuestionType.Multiple,
+    QuestionType.MatrixSingle,
+    QuestionType.MatrixMultiple,
+    QuestionType.Rank,
+    QuestionType.Number,
+    QuestionType.Text,
+}
+
+
+class SummaryAccumulator:
+    """
+    Running ``describe()`` statistics of one question across batches.
+
+    Each update folds the batch's summary into the running one, so only one
+    summary per question is ever held.
+    """
+
+    def __init__(self) -> None:
+        self._strategy: QuestionStrategy | None = None
+        self._summary: pl.DataFrame | None = None
+
+    def update(self, strategy: QuestionStrategy) -> None:
+        summary = strategy._summarize()
+        if self._summary is not None:
+            summary = strategy._merge_summaries([self._summary, summary])
+        self._strategy = strategy
+        self._summary = summary
+
+    def result(self) -> pl.DataFrame:
+        if self._strategy is None or self._summary is None:
+            raise ValueError("No batch was accumulated")
+        return self._strategy._describe_summary(self._summary)
+
+
+def describe_stream(batches: Iterable[list[Question]]) -> dict[str, pl.DataFrame]:
+    """
+    Return ``describe()`` of every streamable question, keyed by question id,
+    from an iterable of question batches covering consecutive respondents.
+    """
+    accumulators: dict[str, SummaryAccumulator] = {}
+    for questions in batches:
+        for question in questions:
+            if question.qtype in stream_types:
+                accumulators.setdefault(question.id, SummaryAccumulator()).update(
+                    question._strategy
+                )
+
+    return {
+        question_id: accumulator.result()
+        for question_id, accumulator in accumulators.items()
+    }
@@ -1,7 +1,241 @@
+from typing import Literal
+import polars as pl
+
+from ..config import Identifier, QuestionType
+from ..errors import QuestionNotFoundError
 from ..questions.question import Question
+from ..errors import DataError
+from ..questions.strategies.single_strategy import _to_option_codes
+from ..questions.strategies.strategy import as_series
+from .banner import banner
+from .crosstab import crosstab
+from .weighting import RakingResult, rake
+
+
+_describe_all_types = {
+    QuestionType.Single,
+    QuestionType.Multiple,
+    QuestionType.MatrixSingle,
+    QuestionType.MatrixMultiple,
+    QuestionType.Rank,
+}
 
 
 class Survey:
     def __init__(self, name: str, questions: list[Question]):
         self.name = name
         self.questions = questions
+        self.weights: pl.Series | None = None
+        # Respondents kept by a filtered view; see ``filter``.
+        self.mask: pl.Series | None = None
+
+    def get_question(self, question_id: str) -> Question:
+        for question in self.questions:
+            if question.id == question_id:
+                return question
+        raise QuestionNotFoundError(f"Question does not exist: {question_id}")
+
+    def _weights(self, weight: str | pl.Series | None) -> pl.Series | None:
+        if weight is None:
+            return self.weights
+        if isinstance(weight, str):
+            return as_series(self.get_question(weight).data[1]).cast(pl.Float64)
+        return weight
+
+    def set_weights(self, weights: pl.Series | None) -> None:
+        """Use ``weights`` in every question's ``describe()``; None unweights."""
+        self.weights = weights
+        for question in self.questions:
+            question.weights = weights
+
+    def _question_of(self, column: str) -> Question:
+        """Return the question a data column code like ``Q2_1`` belongs to."""
+        for question in self.questions:
+            if column == question.id or (
+                column.startswith(question.id)
+                and column[len(question.id)]
+                in (Identifier.Multiple, Identifier.Matrix, Identifier.Rank)
+            ):
+                return question
+        raise QuestionNotFoundError(f"Question does not exist: {column}")
+
+    def filter(
+        self,
+        predicate: pl.Expr | pl.Series,
+        dtype: Literal["number", "text"] = "number",
+    ) -> "Survey":
+        """
+        Return a view of the survey restricted to the respondents matching
+        ``predicate``.
+
+        ``predicate`` is a boolean Series aligned with the respondents or an
+        expression over data column codes, e.g. ``pl.col("Q1") == 2``, which
+        is evaluated against the ``dtype`` columns of only the questions it
+        references. Respondents for whom it is null are dropped. The view's
+        questions share the data of this survey and apply the mask lazily in
+        ``get_df``, ``describe``, ``describe_all`` and ``crosstab``; filtering
+        a view narrows it further.
+        """
+        if isinstance(predicate, pl.Expr):
+            columns = {Identifier.Id: as_series(self.questions[0].response_ids)}
+            for name in predicate.meta.root_names():
+                if name != Identifier.Id:
+                    columns.update(self._question_of(name)._strategy._columns(dtype))
+            frame = pl.DataFrame(
+                [column.alias(name) for name, column in columns.items()]
+            )
+            mask = frame.select(predicate.alias("mask")).to_series()
+        else:
+            mask = predicate
+        mask = mask.cast(pl.Boolean).fill_null(False)
+        if len(mask) != len(as_series(self.questions[0].response_ids)):
+            raise DataError("Filter must have one value per respondent")
+        if self.mask is not None:
+            mask = self.mask & mask
+
+        view = Survey(self.name, [question.filter(mask) for question in self.questions])
+        view.weights = self.weights
+        view.mask = mask
+        return view
+
+    def rake(
+        self,
+        targets: dict[str, dict[str | int, float]],
+        tol: float = 1e-6,
+        max_iter: int = 100,
+        trim: tuple[float, float] | None = None,
+    ) -> RakingResult:
+        """
+        Rake respondent weights to ``targets`` and apply them to the survey.
+
+        ``targets`` maps single choice question ids to the target share of
+        each option, keyed by option text or index. See
+        ``surpy.survey.weighting.rake`` for the algorithm.
+        """
+        if self.mask is not None:
+            raise DataError("Weights must be raked on the unfiltered survey")
+        codes = {}
+        code_targets = {}
+        for question_id, question_targets in targets.items():
+            question = self.get_question(question_id)
+            if question.qtype != QuestionType.Single:
+                raise DataError(f"Rake variable must be single choice: {question_id}")
+            t2n = {op.text: op.index for op in question.options}
+            codes[question_id] = _to_option_codes(
+                question._strategy.number_data, question.options
+            )
+            code_targets[question_id] = {
+                t2n.get(option, option): share
+                for option, share in question_targets.items()
+            }
+
+        result = rake(codes, code_targets, tol=tol, max_iter=max_iter, trim=trim)
+        self.set_weights(result.weights)
+        return result
+
+    def crosstab(
+        self, row_id: str, col_id: str, weight: str | pl.Series | None = None
+    ) -> pl.DataFrame:
+        """
+        Tabulate question ``row_id`` against question ``col_id``.
+
+        ``weight`` is either the id of a number question holding respondent
+        weights or a Series aligned with the respondents. See
+        ``surpy.survey.crosstab.crosstab`` for the output layout.
+        """
+        return crosstab(
+            self.get_question(row_id)._strategy,
+            self.get_question(col_id)._strategy,
+            self._weights(weight),
+        )
+
+    def banner(
+        self,
+        questions: list[str] | None,
+        banners: list[str],
+        weight: str | pl.Series | None = None,
+        total: bool = True,
+        alpha: float | None = None,
+        chi_square: bool = False,
+    ) -> pl.DataFrame:
+        """
+        Tabulate ``questions`` against every point of the single or multiple
+        choice ``banners``. With ``questions=None`` every choice question
+        but the banners is tabulated. ``weight`` is as in ``crosstab``; with
+        ``alpha`` the cells are marked with the banner points they are
+        significantly higher than, and with ``chi_square`` each table's
+        chi-square test of independence is added to its rows.
+
+        See ``surpy.survey.banner.banner`` for the output layout and
+        ``surpy.survey.significance`` for the tests.
+        """
+        selected = (
+            [
+                question
+                for question in self.questions
+                if question.qtype in _describe_all_types and question.id not in banners
+            ]
+            if questions is None
+            else [self.get_question(question_id) for question_id in questions]
+        )
+        return banner(
+            [question._strategy for question in selected],
+            [self.get_question(banner_id)._strategy for banner_id in banners],
+            self._weights(weight),
+            total=total,
+            alpha=alpha,
+            chi_square=chi_square,
+        )
+
+    def to_frame(
+        self,
+        dtype: Literal["number", "text"] = "number",
+        questions: list[str] | None = None,
+    ) -> pl.DataFrame:
+        """
+        Return one wide frame with the ``ID`` column and the columns of every
+        question, or only of the ``questions`` ids, named by their data
+        column codes (``Q1``, ``Q2_1``, ``Q3.1``...).
+
+        The frame is stacked from the questions' columns, which all line up
+        with one shared ``ID`` column, so no joins are needed and the columns
+        are not copied.
+        """
+        selected = (
+            self.questions
+            if questions is None
+            else [self.get_question(question_id) for question_id in questions]
+        )
+        if not self.questions:
+            return pl.DataFrame()
+
+        columns = {Identifier.Id: as_series(self.questions[0].response_ids)}
+        for question in selected:
+            columns.update(question._strategy._columns(dtype))
+
+        frame = pl.DataFrame([column.alias(name) for name, column in columns.items()])
+        return frame if self.mask is None else frame.filter(self.mask)
+
+    def describe_all(self) -> dict[str, pl.DataFrame]:
+        """
+        Return ``describe()`` of every choice question, keyed by question id.
+
+        The counts of all questions are collected together with
+        ``pl.collect_all``, so the queries run in parallel, and each question
+        is counted by its own ``_counts``, keeping its fastest count path.
+        """
+        strategies = {
+            question.id: question._strategy
+            for question in self.questions
+            if question.qtype in _describe_all_types
+        }
+        counts = pl.collect_all(
+            [strategy._counts() for strategy in strategies.values()]
+        )
+
+        return {
+            question_id: strategy._describe_summary(question_counts)
+            for (question_id, strategy), question_counts in zip(
+                strategies.items(), counts
+            )
+        }
@@ -1,17 +1,26 @@
 import polars as pl
 import json
 import yaml
+from collections.abc import Mapping
+from concurrent.futures import ThreadPoolExecutor
+from glob import glob
 from pathlib import Path
-from functools import partial
+from dataclasses import dataclass
+from functools import lru_cache, partial
 
 from .survey import Survey
-from ..errors import FilePathError, DataError
+from .streaming import describe_stream, stream_types
+from .build_cache import BuildCache
+from ..errors import FilePathError, FileTypeError, DataError
+from ..instrumentation import BuildStats, timed
 from ..questions.question import Question
 from ..questions.option import Option
-from ..config import Identifier
+from ..config import Identifier, QuestionType
 
 
-def _load_data_single(survey_data: dict, question_code: str, question_data: list):
+def _load_data_single(
+    survey_data: dict, question_code: str, question_data: pl.Series | list
+):
     question_id = question_code
 
     if question_id in survey_data:
@@ -20,7 +29,9 @@ def _load_data_single(survey_data: dict, question_code: str, question_data: list
     survey_data[question_id] = {1: question_data}
 
 
-def _load_data_multiple(survey_data: dict, question_code: str, question_data: list):
+def _load_data_multiple(
+    survey_data: dict, question_code: str, question_data: pl.Series | list
+):
     try:
         question_id, multiple_index = question_code.split(Identifier.Multiple)
         multiple_index = int(multiple_index)
@@ -39,7 +50,7 @@ def _load_data_multiple(survey_data: dict, question_code: str, question_data: li
 
 
 def _load_data_matrix_single(
-    survey_data: dict, question_code: str, question_data: list
+    survey_data: dict, question_code: str, question_data: pl.Series | list
 ):
     try:
         question_id, matrix_index = question_code.split(Identifier.Matrix)
@@ -59,7 +70,7 @@ def _load_data_matrix_single(
 
 
 def _load_data_matrix_multiple(
-    survey_data: dict, question_code: str, question_data: list
+    survey_data: dict, question_code: str, question_data: pl.Series | list
 ):
     try:
         question_id, sub_question_code = question_code.split(Identifier.Matrix)
@@ -83,7 +94,9 @@ def _load_data_matrix_multiple(
     survey_data[question_id][matrix_index][multiple_index] = question_data
 
 
-def _load_data_rank(survey_data: dict, question_code: str, question_data: list):
+def _load_data_rank(
+    survey_data: dict, question_code: str, question_data: pl.Series | list
+):
     try:
         question_id, rank_index = question_code.split(Identifier.Rank)
         rank_index = int(rank_index)
@@ -98,50 +111,291 @@ def _load_data_rank(survey_data: dict, question_code: str, question_data: list):
     survey_data[question_id][rank_index] = question_data
 
 
-def _load_survey_data(raw_data: dict[str, list]) -> dict[str, dict]:
-    if Identifier.Id not in raw_data.keys():
-        raise DataError("Could not find ID")
+_load_data_by_kind = {
+    "single": _load_data_single,
+    "multiple": _load_data_multiple,
+    "matrix_single": _load_data_matrix_single,
+    "matrix_multiple": _load_data_matrix_multiple,
+    "rank": _load_data_rank,
+}
+
+_kind_by_type = {
+    QuestionType.Single: "single",
+    QuestionType.Number: "single",
+    QuestionType.Text: "single",
+    QuestionType.Multiple: "multiple",
+    QuestionType.MatrixSingle: "matrix_single",
+    QuestionType.MatrixMultiple: "matrix_multiple",
+    QuestionType.Rank: "rank",
+}
+
+
+def _column_kind(column: str) -> tuple[str, str]:
+    """Return the kind of a column code and the id of its question."""
+
+    if Identifier.Multiple in column and Identifier.Matrix not in column:
+        return "multiple", column.split(Identifier.Multiple)[0]
+    elif Identifier.Multiple not in column and Identifier.Matrix in column:
+        return "matrix_single", column.split(Identifier.Matrix)[0]
+    elif Identifier.Multiple in column and Identifier.Matrix in column:
+        return "matrix_multiple", column.split(Identifier.Matrix)[0]
+    elif Identifier.Rank in column:
+        return "rank", column.split(Identifier.Rank)[0]
+    else:
+        return "single", column
 
-    survey_data = {}
 
-    for column, column_data in raw_data.items():
-        if Identifier.Multiple in column and Identifier.Matrix not in column:
-            _load_data_multiple(survey_data, column, column_data)
-        elif Identifier.Multiple not in column and Identifier.Matrix in column:
-            _load_data_matrix_single(survey_data, column, column_data)
-        elif Identifier.Multiple in column and Identifier.Matrix in column:
-            _load_data_matrix_multiple(survey_data, column, column_data)
-        elif Identifier.Rank in column:
-            _load_data_rank(survey_data, column, column_data)
-        else:
-            _load_data_single(survey_data, column, column_data)
+def _index_errors(question_id: str, name: str, keys, expected: range) -> list[str]:
+    if set(keys) == set(expected):
+        return []
+    return [
+        (
+            f"{question_id}: {name} indexes {sorted(keys)} do not match "
+            f"{expected.start}..{expected.stop - 1}"
+        )
+    ]
 
-    return survey_data
 
+@dataclass(frozen=True)
+class LayoutPlan:
+    """
+    Column layout of a data file, compiled once from its header.
 
-def _load_excel_data(
-    path: Path, sheet_name: str | None = None
-) -> dict[str, dict[int, list]]:
-    if sheet_name:
-        raw_data: dict[str, list] = pl.read_excel(path, sheet_name=sheet_name).to_dict(
-            as_series=False
-        )
-    else:
-        raw_data: dict[str, list] = pl.read_excel(path).to_dict(as_series=False)
+    ``tree`` has the same nested shape as the survey data, holding column
+    names instead of columns, and ``kinds`` maps each question id to the
+    kind of its columns. Bad column codes are collected in ``errors`` rather
+    than raised, so ``validate`` can report them all at once.
+    """
+
+    tree: dict
+    kinds: dict[str, str]
+    errors: tuple[str, ...] = ()
+
+    @property
+    def columns(self) -> list[str]:
+        return _layout_columns(self.tree)
+
+    def apply(self, raw_data: Mapping[str, pl.Series | list]) -> dict[str, dict]:
+        return _map_layout(self.tree, raw_data)
+
+    def validate(self, questions_metadata: list[dict] | None = None) -> None:
+        errors = [*self.errors]
+
+        for question_metadata in questions_metadata or []:
+            errors.extend(self._metadata_errors(question_metadata))
+
+        if errors:
+            raise DataError(
+                "Invalid survey data:\n" + "\n".join(f"- {e}" for e in errors)
+            )
+
+    def _metadata_errors(self, question_metadata: dict) -> list[str]:
+        question_id = question_metadata["id"]
+        qtype = question_metadata["type"]
+
+        if question_id not in self.tree:
+            return [f"{question_id}: no column in data"]
+
+        kind = self.kinds[question_id]
+        if qtype in _kind_by_type and _kind_by_type[qtype] != kind:
+            return [f"{question_id}: {kind} columns do not fit a {qtype} question"]
+
+        layout = self.tree[question_id]
+        n_options = len(question_metadata.get("options", []))
+        n_sub_items = len(question_metadata.get("sub_items", []))
+
+        if qtype == QuestionType.Multiple:
+            return _index_errors(question_id, "option", layout, range(1, n_options + 1))
+        elif qtype in (QuestionType.MatrixSingle, QuestionType.MatrixMultiple):
+            errors = _index_errors(
+                question_id, "sub-item", layout, range(1, n_sub_items + 1)
+            )
+            if qtype == QuestionType.MatrixMultiple:
+                for sub_index, sub_layout in layout.items():
+                    errors.extend(
+                        _index_errors(
+                            f"{question_id}{Identifier.Matrix}{sub_index}",
+                            "option",
+                            sub_layout,
+                            range(1, n_options + 1),
+                        )
+                    )
+            return errors
+        elif qtype == QuestionType.Rank and not set(layout) <= set(
+            range(1, n_options + 1)
+        ):
+            return [
+                (
+                    f"{question_id}: rank positions {sorted(layout)} exceed "
+                    f"{n_options} options"
+                )
+            ]
+
+        return []
+
+
+@lru_cache(maxsize=128)
+def compile_layout(header: tuple[str, ...]) -> LayoutPlan:
+    """
+    Return the ``LayoutPlan`` of a header. Plans are cached by header, so
+    building files of the same shape parses the column codes only once.
+    """
+
+    tree = {}
+    kinds = {}
+    errors = [] if Identifier.Id in header else ["Could not find ID"]
+
+    for column in header:
+        kind, question_id = _column_kind(column)
+        if kinds.setdefault(question_id, kind) != kind:
+            errors.append(
+                f"{column}: {kind} column mixed with {kinds[question_id]} "
+                f"columns of {question_id}"
+            )
+            continue
+
+        try:
+            _load_data_by_kind[kind](tree, column, column)
+        except (ValueError, TypeError) as e:
+            errors.append(f"{column}: {e}")
+
+    return LayoutPlan(tree=tree, kinds=kinds, errors=tuple(errors))
+
+
+def _load_survey_data(
+    raw_data: Mapping[str, pl.Series | list],
+    questions_metadata: list[dict] | None = None,
+    stats: BuildStats | None = None,
+) -> dict[str, dict]:
+    plan = timed(stats, "compile_layout", compile_layout, tuple(raw_data))
+    timed(stats, "validate", plan.validate, questions_metadata)
+
+    return timed(stats, "load_survey_data", plan.apply, raw_data)
+
+
+class LazyQuestionData(Mapping):
+    """
+    Question data backed by a ``pl.LazyFrame``.
+
+    ``layout`` has the same nested shape as the question's data, holding
+    column names instead of columns. Only those columns are collected from
+    the source, and only on the first access to a value.
+    """
+
+    def __init__(self, source: pl.LazyFrame, layout: dict) -> None:
+        self._source = source
+        self._layout = layout
+        self._data: dict | None = None
 
-    return _load_survey_data(raw_data)
+    @property
+    def is_loaded(self) -> bool:
+        return self._data is not None
 
+    def _collect(self) -> dict:
+        if self._data is None:
+            frame = self._source.select(_layout_columns(self._layout)).collect()
+            self._data = _map_layout(self._layout, frame)
+        return self._data
 
-def _load_csv_data(path: Path) -> dict[str, dict[int, list]]:
-    raw_data: dict[str, list] = pl.read_csv(path).to_dict(as_series=False)
+    def __getitem__(self, key):
+        return self._collect()[key]
 
-    return _load_survey_data(raw_data)
+    def __iter__(self):
+        return iter(self._layout)
 
+    def __len__(self) -> int:
+        return len(self._layout)
 
-def _load_json_data(path: Path) -> dict[str, dict[int, list]]:
+
+def _layout_columns(layout: dict) -> list[str]:
+    return [
+        column
+        for value in layout.values()
+        for column in (_layout_columns(value) if isinstance(value, dict) else [value])
+    ]
+
+
+def _map_layout(layout: dict, frame: pl.DataFrame | Mapping) -> dict:
+    return {
+        key: _map_layout(value, frame) if isinstance(value, dict) else frame[value]
+        for key, value in layout.items()
+    }
+
+
+def _scan_survey_data(
+    source: pl.LazyFrame,
+    questions_metadata: list[dict] | None = None,
+    plan: LayoutPlan | None = None,
+) -> dict[str, dict | LazyQuestionData]:
+    if plan is None:
+        plan = compile_layout(tuple(source.collect_schema().names()))
+        plan.validate(questions_metadata)
+    response_ids = source.select(Identifier.Id).collect().to_series()
+
+    return {
+        question_id: (
+            {1: response_ids}
+            if question_id == Identifier.Id
+            else LazyQuestionData(source, question_layout)
+        )
+        for question_id, question_layout in plan.tree.items()
+    }
+
+
+def _read_excel_data(path: Path, sheet_name: str | None = None) -> pl.DataFrame:
+    if sheet_name:
+        return pl.read_excel(path, sheet_name=sheet_name)
+    return pl.read_excel(path)
+
+
+def _read_json_data(path: Path) -> pl.DataFrame:
     with open(path, "r") as f:
-        raw_data = json.load(f)
-        return _load_survey_data(raw_data)
+        return pl.DataFrame(json.load(f), strict=False)
+
+
+def _scan_excel_data(path: Path, sheet_name: str | None = None) -> pl.LazyFrame:
+    return _read_excel_data(path, sheet_name).lazy()
+
+
+def _scan_csv_data(path: Path) -> pl.LazyFrame:
+    return pl.scan_csv(path)
+
+
+def _scan_json_data(path: Path) -> pl.LazyFrame:
+    return _read_json_data(path).lazy()
+
+
+def _scan_parquet_data(path: Path) -> pl.LazyFrame:
+    return pl.scan_parquet(path)
+
+
+def _scan_ipc_data(path: Path) -> pl.LazyFrame:
+    return pl.scan_ipc(path)
+
+
+def _build_questions(
+    data: Mapping,
+    questions_metadata: list[dict],
+    stats: BuildStats | None = None,
+    packed: bool = False,
+) -> list[Question]:
+    return [
+        Question(
+            id := question_metadata["id"],
+            qtype=question_metadata["type"],
+            text=question_metadata["text"],
+            data=data[id],
+            response_ids=data[Identifier.Id][1],
+            options=[
+                Option(index=i, text=op)
+                for i, op in enumerate(question_metadata.get("options", []), 1)
+            ],
+            sub_items=question_metadata.get("sub_items", []),
+            packed=packed and question_metadata["type"] == QuestionType.Multiple,
+            stats=stats,
+        )
+        for question_metadata in questions_metadata
+    ]
 
 
 def _load_yml_metadata(path: Path) -> dict[str, str | list]:
@@ -157,37 +411,135 @@ def _load_json_metadata(path: Path) -> dict[str, str | list]:
 
 
 class SurveyBuilder:
+    """
+    Build a ``Survey`` from a data file and a metadata file.
+
+    With ``lazy=True`` the data file is scanned instead of read: only the
+    ``ID`` column is loaded at build time, and each question collects its own
+    columns the first time its data is accessed. CSV, Parquet and Arrow IPC
+    files are scanned with projection pushdown; Excel and JSON files are read
+    once and then split lazily.
+
+    Arrow IPC (``.arrow``, ``.feather``, ``.ipc``) files written without
+    compression are memory-mapped, so building from them is near zero-copy.
+
+    With a ``BuildCache`` the data and metadata are read and checked once,
+    then stored in the cache; later builds from the same unchanged files
+    memory-map the cached data instead.
+
+    With a ``BuildStats`` the wall time and output size of every build
+    phase, and of the built questions' validation and describes, are
+    recorded in it.
+
+    With ``packed=True`` the option columns of multiple choice questions
+    are replaced by ``UInt64`` bitmasks when the questions are built; with
+    ``lazy=True`` this loads those questions at build time.
+    """
+
     def __init__(
-        self, data_path: str, metadata_path: str, sheet_name: str | None = None
+        self,
+        data_path: str,
+        metadata_path: str,
+        sheet_name: str | None = None,
+        lazy: bool = False,
+        cache: BuildCache | None = None,
+        stats: BuildStats | None = None,
+        packed: bool = False,
     ) -> None:
         self.data_path = Path(data_path)
         self.metadata_path = Path(metadata_path)
         self.sheet_name = sheet_name
+        self.lazy = lazy
+        self.cache = cache
+        self.stats = stats
+        self.packed = packed
+
+    @property
+    def _source_paths(self) -> list[Path]:
+        return [self.data_path, self.metadata_path]
 
     def build(self) -> Survey:
-        data = self._load_data()
+        if self.cache is None:
+            survey_metadata = timed(self.stats, "load_metadata", self._load_metadata)
+            load_data = self._scan_data if self.lazy else self._load_data
+            data = load_data(survey_metadata["questions"])
+        else:
+            survey_metadata, data = timed(self.stats, "load_cached", self._load_cached)
+        questions = timed(
+            self.stats,
+            "build_questions",
+            _build_questions,
+            data,
+            survey_metadata["questions"],
+            self.stats,
+            self.packed,
+        )
+
+        return Survey(name=survey_metadata.get("name", "SURVEY"), questions=questions)
+
+    def describe_stream(self, batch_size: int = 100_000) -> dict[str, pl.DataFrame]:
+        """
+        Return ``describe()`` of every streamable question without loading
+        the whole data file.
+
+        The file is scanned and collected in batches of about ``batch_size``
+        rows. Each batch is built into questions whose mergeable summaries
+        are folded into one accumulator per question, so memory is bounded
+        by the batch size and the number of distinct answers. Only CSV,
+        Parquet and Arrow IPC files can be streamed.
+        """
+
+        source = self._scan_source(streaming=True)
         survey_metadata = self._load_metadata()
-        questions = [
-            Question(
-                id := question_metadata["id"],
-                qtype=question_metadata["type"],
-                text=question_metadata["text"],
-                data=data[id],
-                response_ids=data[Identifier.Id][1],
-                options=[
-                    Option(index=i, text=op)
-                    for i, op in enumerate(question_metadata.get("options", []), 1)
-                ],
-                sub_items=question_metadata.get("sub_items", []),
-            )
+        questions_metadata = [
+            question_metadata
             for question_metadata in survey_metadata["questions"]
+            if question_metadata["type"] in stream_types
         ]
+        plan = compile_layout(tuple(source.collect_schema().names()))
+        plan.validate(questions_metadata)
+        layout = {
+            question_id: plan.tree[question_id]
+            for question_id in [
+                Identifier.Id,
+                *(question_metadata["id"] for question_metadata in questions_metadata),
+            ]
+        }
+        columns = _layout_columns(layout)
 
-        return Survey(name=survey_metadata.get("name", "SURVEY"), questions=questions)
+        return describe_stream(
+            _build_questions(_map_layout(layout, batch), questions_metadata)
+            for batch in source.select(columns).collect_batches(chunk_size=batch_size)
+        )
+
+    def _read_data(self, data_path: Path) -> pl.DataFrame:
+        _read_data_by_type = {
+            ".csv": pl.read_csv,
+            ".xlsx": partial(_read_excel_data, sheet_name=self.sheet_name),
+            ".json": _read_json_data,
+            ".parquet": pl.read_parquet,
+            # Uncompressed IPC files are memory-mapped by polars, so the
+            # columns are views on the page cache and can be shared between
+            # processes.
+            ".arrow": pl.read_ipc,
+            ".feather": pl.read_ipc,
+            ".ipc": pl.read_ipc,
+        }
+
+        if data_path.suffix not in _read_data_by_type:
+            raise FileTypeError(f"Unsupported data file type: {data_path}")
 
-    def _load_data(self) -> dict[str, dict[int, list]]:
+        if data_path.exists():
+            return _read_data_by_type[data_path.suffix](data_path)
+        else:
+            raise FilePathError(f"File does not exists: {data_path}")
+
+    def _load_data(
+        self, questions_metadata: list[dict] | None = None
+    ) -> dict[str, dict[int, pl.Series]]:
         """
-        Return dictionary with id as key and data as value.
+        Return dictionary with id as key and data as value. Values are the
+        columns of the loaded frame as ``pl.Series``, shown here as lists.
         {
             "Q1": {1: [1, 2, 3, 2],},
             "Q2": {
@@ -209,18 +561,86 @@ class SurveyBuilder:
                 }
             }
         }
+
+        The columns are checked against ``questions_metadata`` up front, and
+        every problem is reported in one ``DataError``.
+        """
+
+        raw_data = timed(self.stats, "read_data", self._read_frame)
+
+        return _load_survey_data(raw_data.to_dict(), questions_metadata, self.stats)
+
+    def _read_frame(self) -> pl.DataFrame:
+        return self._read_data(self.data_path)
+
+    def _load_cached(self) -> tuple[dict, dict[str, dict | LazyQuestionData]]:
         """
+        Return the survey metadata and data from the cache, building the
+        cache entry first on a miss.
+        """
+
+        key = self.cache.key(self._source_paths, type(self).__name__, self.sheet_name)
+        entry = self.cache.get(key)
+
+        if entry is None:
+            survey_metadata = self._load_metadata()
+            raw_data = self._read_frame()
+            plan = compile_layout(tuple(raw_data.columns))
+            plan.validate(survey_metadata["questions"])
+            data_path = self.cache.put(
+                key, raw_data, survey_metadata, plan.tree, plan.kinds
+            )
+        else:
+            data_path, survey_metadata, tree, kinds = entry
+            plan = LayoutPlan(tree=tree, kinds=kinds)
+
+        if self.lazy:
+            return survey_metadata, _scan_survey_data(pl.scan_ipc(data_path), plan=plan)
+        return survey_metadata, plan.apply(pl.read_ipc(data_path))
 
-        _load_data_by_type = {
-            ".csv": _load_csv_data,
-            ".xlsx": partial(_load_excel_data, sheet_name=self.sheet_name),
-            ".json": _load_json_data,
+    def _scan_data(
+        self, questions_metadata: list[dict] | None = None
+    ) -> dict[str, dict | LazyQuestionData]:
+        """
+        Return the same mapping as ``_load_data``, with each question's data
+        wrapped in a ``LazyQuestionData`` and only the ``ID`` column loaded.
+        """
+
+        source = self._scan_source()
+        return timed(
+            self.stats, "scan_data", _scan_survey_data, source, questions_metadata
+        )
+
+    def _scan_source(self, streaming: bool = False) -> pl.LazyFrame:
+        return self._scan_file(self.data_path, streaming)
+
+    def _scan_file(self, data_path: Path, streaming: bool = False) -> pl.LazyFrame:
+        """
+        Return a scan of ``data_path``. With ``streaming`` only the formats
+        polars can collect in batches, CSV, Parquet and Arrow IPC, are
+        accepted.
+        """
+
+        _scan_data_by_type = {
+            ".csv": _scan_csv_data,
+            ".parquet": _scan_parquet_data,
+            ".arrow": _scan_ipc_data,
+            ".feather": _scan_ipc_data,
+            ".ipc": _scan_ipc_data,
         }
+        if not streaming:
+            _scan_data_by_type |= {
+                ".xlsx": partial(_scan_excel_data, sheet_name=self.sheet_name),
+                ".json": _scan_json_data,
+            }
 
-        if self.data_path.exists():
-            return _load_data_by_type[self.data_path.suffix](self.data_path)
+        if data_path.suffix not in _scan_data_by_type:
+            raise FileTypeError(f"Unsupported data file type: {data_path}")
+
+        if data_path.exists():
+            return _scan_data_by_type[data_path.suffix](data_path)
         else:
-            raise FilePathError(f"File does not exists: {self.data_path}")
+            raise FilePathError(f"File does not exists: {data_path}")
 
     def _load_metadata(self) -> dict:
         """
@@ -237,3 +657,121 @@ class SurveyBuilder:
             return _load_metadata_by_type[self.metadata_path.suffix](self.metadata_path)
         else:
             raise FilePathError(f"File does not exists: {self.metadata_path}")
+
+
+class WaveSurveyBuilder(SurveyBuilder):
+    """
+    Build one ``Survey`` from several data files sharing one metadata file,
+    e.g. the monthly waves of a tracker.
+
+    ``data_paths`` is a list of paths or a glob pattern. Files are read and
+    parsed concurrently in a thread pool, since polars releases the GIL while
+    reading, then stacked without copying their columns. A ``WAVE`` single
+    choice question tells the waves apart; its options are the file names.
+
+    With ``lazy=True`` or in ``describe_stream`` the waves are scanned and
+    stacked lazily instead, in wave order. ``data_path`` is the first wave.
+    """
+
+    def __init__(
+        self,
+        data_paths: str | list[str],
+        metadata_path: str,
+        sheet_name: str | None = None,
+        max_workers: int | None = None,
+        lazy: bool = False,
+        cache: BuildCache | None = None,
+        stats: BuildStats | None = None,
+        packed: bool = False,
+    ) -> None:
+        if isinstance(data_paths, str):
+            data_paths = sorted(glob(data_paths))
+        if not data_paths:
+            raise FilePathError("No data files to load")
+        super().__init__(
+            data_paths[0],
+            metadata_path,
+            sheet_name=sheet_name,
+            lazy=lazy,
+            cache=cache,
+            stats=stats,
+            packed=packed,
+        )
+        self.data_paths = [Path(data_path) for data_path in data_paths]
+        self.max_workers = max_workers
+
+    @property
+    def _source_paths(self) -> list[Path]:
+        return [*self.data_paths, self.metadata_path]
+
+    @property
+    def wave_names(self) -> list[str]:
+        names = [data_path.stem for data_path in self.data_paths]
+        if len(set(names)) == len(names):
+            return names
+        return [str(data_path) for data_path in self.data_paths]
+
+    def _check_wave(self, data_path: Path, columns: list[str]) -> None:
+        if Identifier.Wave in columns:
+            raise DataError(f"{data_path}: {Identifier.Wave} is a reserved column")
+
+        try:
+            compile_layout(tuple(columns)).validate()
+        except DataError as e:
+            raise DataError(f"{data_path}: {e}") from e
+
+    def _read_wave(self, data_path: Path, wave: int) -> pl.DataFrame:
+        raw_data = self._read_data(data_path)
+        self._check_wave(data_path, raw_data.columns)
+
+        return raw_data.with_columns(
+            pl.lit(wave, dtype=pl.Int64).alias(Identifier.Wave)
+        )
+
+    def _scan_wave(
+        self, data_path: Path, wave: int, streaming: bool = False
+    ) -> pl.LazyFrame:
+        source = self._scan_file(data_path, streaming)
+        self._check_wave(data_path, source.collect_schema().names())
+
+        return source.with_columns(pl.lit(wave, dtype=pl.Int64).alias(Identifier.Wave))
+
+    def _scan_source(self, streaming: bool = False) -> pl.LazyFrame:
+        return pl.concat(
+            [
+                self._scan_wave(data_path, wave, streaming)
+                for wave, data_path in enumerate(self.data_paths, 1)
+            ],
+            how="diagonal_relaxed",
+        )
+
+    def _read_frame(self) -> pl.DataFrame:
+        """
+        Return all waves stacked in order, with a ``WAVE`` column holding the
+        wave codes.
+        """
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            raw_data = list(
+                executor.map(
+                    self._read_wave,
+                    self.data_paths,
+                    range(1, len(self.data_paths) + 1),
+                )
+            )
+
+        return pl.concat(raw_data, how="diagonal_relaxed", rechunk=False)
+
+    def _load_metadata(self) -> dict:
+        survey_metadata = super()._load_metadata()
+        wave_metadata = {
+            "id": Identifier.Wave,
+            "type": QuestionType.Single,
+            "text": "Wave",
+            "options": self.wave_names,
+        }
+
+        return {
+            **survey_metadata,
+            "questions": [*survey_metadata["questions"], wave_metadata],
+        }
@@ -0,0 +1,116 @@
+from dataclasses import dataclass
+
+import polars as pl
+
+from ..errors import DataError
+
+
+@dataclass
+class RakingResult:
+    weights: pl.Series
+    iterations: int
+    converged: bool
+    max_error: float
+
+
+def _category_positions(
+    codes: pl.Series, targets: dict[int, float]
+) -> tuple[pl.Series, list[pl.Series], pl.Series]:
+    """
+    Return each respondent's position in ``targets`` (null when the code is
+    null), one membership mask per position, and the target shares in the
+    same order, normalized to sum to 1.
+    """
+    categories = list(targets)
+    positions = codes.replace_strict(
+        {code: position for position, code in enumerate(categories)},
+        default=None,
+        return_dtype=pl.UInt32,
+    )
+    masks = [
+        (positions == position).fill_null(False) for position in range(len(categories))
+    ]
+    shares = pl.Series(list(targets.values()), dtype=pl.Float64)
+    return positions, masks, shares / shares.sum()
+
+
+def _validate_targets(
+    codes: dict[str, pl.Series], targets: dict[str, dict[int, float]]
+) -> None:
+    errors = []
+    for variable, variable_targets in targets.items():
+        if variable not in codes:
+            errors.append(f"{variable}: no data for rake variable")
+            continue
+        if any(share < 0 for share in variable_targets.values()):
+            errors.append(f"{variable}: target shares must not be negative")
+        observed = set(codes[variable].drop_nulls().unique().to_list())
+        if missing := observed - set(variable_targets):
+            errors.append(f"{variable}: no target for codes {sorted(missing)}")
+        if empty := {
+            code
+            for code, share in variable_targets.items()
+            if share > 0 and code not in observed
+        }:
+            errors.append(f"{variable}: no respondents for codes {sorted(empty)}")
+    if errors:
+        raise DataError("Invalid raking targets:\n" + "\n".join(errors))
+
+
+def rake(
+    codes: dict[str, pl.Series],
+    targets: dict[str, dict[int, float]],
+    base_weights: pl.Series | None = None,
+    tol: float = 1e-6,
+    max_iter: int = 100,
+    trim: tuple[float, float] | None = None,
+) -> RakingResult:
+    """
+    Weight respondents to marginal ``targets`` by iterative proportional
+    fitting.
+
+    ``codes`` holds one code per respondent for each rake variable and
+    ``targets`` the wanted share of each code; shares are normalized per
+    variable. Respondents with a null code are left out of that variable's
+    adjustment. Each pass adjusts the variables in turn: category totals are
+    masked sums over precomputed membership masks, and the adjustment is one
+    gather of per-category factors over the whole weight column. Raking stops when
+    no share is off its target by more than ``tol``. ``trim`` bounds weights
+    to ``(low, high)`` multiples of the mean weight after each pass, then
+    rescales them to the starting total so trimming does not shrink them.
+    """
+    _validate_targets(codes, targets)
+
+    n = len(next(iter(codes.values()))) if codes else 0
+    weights = (
+        pl.repeat(1.0, n, dtype=pl.Float64, eager=True).alias("weight")
+        if base_weights is None
+        else base_weights.cast(pl.Float64).rename("weight")
+    )
+    variables = [
+        _category_positions(codes[variable], variable_targets)
+        for variable, variable_targets in targets.items()
+    ]
+    population = weights.sum()
+
+    max_error = float("inf")
+    for iteration in range(1, max_iter + 1):
+        max_error = 0.0
+        for positions, masks, shares in variables:
+            current = pl.Series(
+                [weights.filter(mask).sum() for mask in masks], dtype=pl.Float64
+            )
+            total = current.sum()
+            max_error = max(max_error, ((current / total) - shares).abs().max())
+            factors = (shares * total / current).fill_nan(1.0)
+            weights = weights * factors.gather(positions).fill_null(1.0)
+
+        if max_error <= tol:
+            return RakingResult(weights, iteration, True, max_error)
+
+        if trim is not None:
+            mean = weights.mean()
+            weights = weights.clip(trim[0] * mean, trim[1] * mean)
+            weights = weights * (population / weights.sum())
+
+    return RakingResult(weights, max_iter, False, max_error)
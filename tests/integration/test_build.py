@@ -1,5 +1,15 @@
 from pathlib import Path
-from surpy.survey.survey_builder import SurveyBuilder
+
+import pytest
+import polars as pl
+from polars.testing import assert_frame_equal
+
+from surpy.config import Identifier, QuestionType
+from surpy.errors import FileTypeError
+from surpy.instrumentation import BuildStats
+from surpy.questions.strategies.multiple_strategy import PackedSelections
+from surpy.survey.build_cache import BuildCache
+from surpy.survey.survey_builder import SurveyBuilder, WaveSurveyBuilder
 
 
 FIXTURES = Path(__file__).parent.parent / "fixtures"
@@ -15,3 +25,313 @@ def test_build_survey():
     survey = survey_builder.build()
 
     assert len(survey.questions) == 8
+
+
+def test_build_survey_keeps_columns_as_series():
+    survey_builder = SurveyBuilder(
+        data_path=str(FIXTURES / "survey_data.xlsx"),
+        metadata_path=str(FIXTURES / "survey_metadata.yml"),
+        sheet_name="number",
+    )
+
+    survey = survey_builder.build()
+
+    assert isinstance(survey.questions[0].response_ids, pl.Series)
+    assert all(
+        isinstance(column, pl.Series)
+        for question in survey.questions
+        if question.qtype != QuestionType.MatrixMultiple
+        for column in question.data.values()
+    )
+
+
+def test_build_survey_records_phase_stats():
+    stats = BuildStats()
+    survey = SurveyBuilder(
+        data_path=str(FIXTURES / "survey_data.xlsx"),
+        metadata_path=str(FIXTURES / "survey_metadata.yml"),
+        sheet_name="number",
+        stats=stats,
+    ).build()
+
+    phases = {phase.phase: phase for phase in stats.phases}
+    assert list(phases) == [
+        "load_metadata",
+        "read_data",
+        "compile_layout",
+        "validate",
+        "load_survey_data",
+        "build_questions",
+    ]
+    assert phases["read_data"].columns == 30
+    assert phases["read_data"].bytes > 0
+    assert phases["load_survey_data"].columns == 30
+    assert phases["build_questions"].columns == 8
+
+    survey.get_question("Q1")._strategy.describe()
+
+    assert [phase.phase for phase in stats.phases[-2:]] == [
+        "Q1.validate",
+        "Q1.count",
+    ]
+
+
+def test_build_lazy_survey_loads_question_on_first_use(tmp_path):
+    data_path = tmp_path / "survey_data.csv"
+    pl.read_excel(FIXTURES / "survey_data.xlsx", sheet_name="text").write_csv(data_path)
+    eager_survey = SurveyBuilder(
+        data_path=str(data_path),
+        metadata_path=str(FIXTURES / "survey_metadata.yml"),
+    ).build()
+
+    lazy_survey = SurveyBuilder(
+        data_path=str(data_path),
+        metadata_path=str(FIXTURES / "survey_metadata.yml"),
+        lazy=True,
+    ).build()
+
+    assert len(lazy_survey.questions) == 8
+    assert not any(question.data.is_loaded for question in lazy_survey.questions)
+
+    q1, q4 = lazy_survey.questions[0], lazy_survey.questions[3]
+
+    assert_frame_equal(
+        q1._strategy.describe(), eager_survey.questions[0]._strategy.describe()
+    )
+    assert_frame_equal(
+        q4._strategy.get_df("number"),
+        eager_survey.questions[3]._strategy.get_df("number"),
+    )
+    assert q1.data.is_loaded and q4.data.is_loaded
+    assert not lazy_survey.questions[1].data.is_loaded
+
+
+def test_filter_lazy_survey_loads_only_referenced_questions(tmp_path):
+    data_path = tmp_path / "survey_data.csv"
+    pl.read_excel(FIXTURES / "survey_data.xlsx", sheet_name="text").write_csv(data_path)
+    eager_survey = SurveyBuilder(
+        data_path=str(data_path),
+        metadata_path=str(FIXTURES / "survey_metadata.yml"),
+    ).build()
+    lazy_survey = SurveyBuilder(
+        data_path=str(data_path),
+        metadata_path=str(FIXTURES / "survey_metadata.yml"),
+        lazy=True,
+    ).build()
+
+    view = lazy_survey.filter(pl.col("Q1") == 1)
+
+    assert lazy_survey.get_question("Q1").data.is_loaded
+    assert not any(
+        question.data.is_loaded
+        for question in lazy_survey.questions
+        if question.id != "Q1"
+    )
+    assert_frame_equal(
+        view.get_question("Q4")._strategy.describe(),
+        eager_survey.filter(pl.col("Q1") == 1).get_question("Q4")._strategy.describe(),
+    )
+
+
+def test_build_packed_survey():
+    builder_kwargs = dict(
+        data_path=str(FIXTURES / "survey_data.xlsx"),
+        metadata_path=str(FIXTURES / "survey_metadata.yml"),
+        sheet_name="text",
+    )
+    survey = SurveyBuilder(**builder_kwargs).build()
+    packed_survey = SurveyBuilder(**builder_kwargs, packed=True).build()
+
+    question = packed_survey.get_question("Q4")
+
+    assert isinstance(question.data, PackedSelections)
+    assert not packed_survey.get_question("Q6").packed
+    assert_frame_equal(
+        question._strategy.describe(), survey.get_question("Q4")._strategy.describe()
+    )
+    assert question.any_of(["Dog", "Cat"]).equals(
+        survey.get_question("Q4").any_of(["Dog", "Cat"])
+    )
+    assert question.n_selected().equals(survey.get_question("Q4").n_selected())
+
+
+@pytest.mark.parametrize("suffix", [".parquet", ".arrow", ".feather"])
+@pytest.mark.parametrize("lazy", [False, True])
+def test_build_survey_from_columnar_files(tmp_path, suffix, lazy):
+    frame = pl.read_excel(FIXTURES / "survey_data.xlsx", sheet_name="text")
+    data_path = tmp_path / f"survey_data{suffix}"
+    if suffix == ".parquet":
+        frame.write_parquet(data_path)
+    else:
+        frame.write_ipc(data_path, compression="uncompressed")
+
+    survey = SurveyBuilder(
+        data_path=str(data_path),
+        metadata_path=str(FIXTURES / "survey_metadata.yml"),
+        lazy=lazy,
+    ).build()
+
+    assert len(survey.questions) == 8
+    assert_frame_equal(
+        survey.questions[0]._strategy.get_df("text"),
+        frame.select(
+            Identifier.Id,
+            pl.col("Q1").cast(pl.Enum(["Male", "Female"])),
+        ),
+    )
+
+
+def test_build_survey_rejects_unknown_file_type(tmp_path):
+    data_path = tmp_path / "survey_data.txt"
+    data_path.write_text("ID\n1\n")
+
+    with pytest.raises(FileTypeError):
+        SurveyBuilder(
+            data_path=str(data_path),
+            metadata_path=str(FIXTURES / "survey_metadata.yml"),
+        ).build()
+
+
+@pytest.mark.parametrize("suffix", [".csv", ".parquet"])
+def test_describe_stream_matches_describe_all(tmp_path, suffix):
+    frame = pl.read_excel(FIXTURES / "survey_data.xlsx", sheet_name="text")
+    data_path = tmp_path / f"survey_data{suffix}"
+    if suffix == ".csv":
+        frame.write_csv(data_path)
+    else:
+        frame.write_parquet(data_path)
+    survey_builder = SurveyBuilder(
+        data_path=str(data_path),
+        metadata_path=str(FIXTURES / "survey_metadata.yml"),
+    )
+
+    describe_stream = survey_builder.describe_stream(batch_size=2)
+    describe_all = survey_builder.build().describe_all()
+
+    survey = survey_builder.build()
+
+    assert set(describe_stream) == {*describe_all, "Q2", "Q8"}
+    for question_id, describe in describe_all.items():
+        assert_frame_equal(describe_stream[question_id], describe)
+    for question_id in ["Q2", "Q8"]:
+        assert_frame_equal(
+            describe_stream[question_id],
+            survey.get_question(question_id)._strategy.describe(),
+        )
+
+
+@pytest.mark.parametrize("lazy", [False, True])
+def test_build_survey_from_waves(tmp_path, lazy):
+    frame = pl.read_excel(FIXTURES / "survey_data.xlsx", sheet_name="number")
+    for wave, offset in enumerate([0, 3, 6], 1):
+        frame.slice(offset, 3).write_csv(tmp_path / f"wave_{wave}.csv")
+    full_survey = SurveyBuilder(
+        data_path=str(FIXTURES / "survey_data.xlsx"),
+        metadata_path=str(FIXTURES / "survey_metadata.yml"),
+        sheet_name="number",
+    ).build()
+
+    survey = WaveSurveyBuilder(
+        data_paths=str(tmp_path / "wave_*.csv"),
+        metadata_path=str(FIXTURES / "survey_metadata.yml"),
+        lazy=lazy,
+    ).build()
+
+    assert len(survey.questions) == 9
+    assert_frame_equal(
+        survey.get_question("Q4")._strategy.describe(),
+        full_survey.get_question("Q4")._strategy.describe(),
+    )
+    assert survey.get_question(Identifier.Wave)._strategy.describe()[
+        Identifier.Wave
+    ].to_list() == ["wave_1", "wave_2", "wave_3"]
+    assert survey.crosstab("Q1", Identifier.Wave)["count"].sum() == 9
+
+
+def test_describe_stream_from_waves(tmp_path):
+    frame = pl.read_excel(FIXTURES / "survey_data.xlsx", sheet_name="text")
+    for wave, offset in enumerate([0, 3, 6], 1):
+        frame.slice(offset, 3).write_parquet(tmp_path / f"wave_{wave}.parquet")
+    survey_builder = WaveSurveyBuilder(
+        data_paths=str(tmp_path / "wave_*.parquet"),
+        metadata_path=str(FIXTURES / "survey_metadata.yml"),
+    )
+
+    describe_stream = survey_builder.describe_stream(batch_size=2)
+    survey = survey_builder.build()
+
+    assert Identifier.Wave in describe_stream
+    for question_id, describe in describe_stream.items():
+        assert_frame_equal(
+            describe, survey.get_question(question_id)._strategy.describe()
+        )
+
+
+@pytest.mark.parametrize("lazy", [False, True])
+def test_build_survey_from_cache(tmp_path, monkeypatch, lazy):
+    data_path = tmp_path / "survey_data.csv"
+    pl.read_excel(FIXTURES / "survey_data.xlsx", sheet_name="text").write_csv(data_path)
+    cache = BuildCache(str(tmp_path / "cache"))
+    survey_builder = SurveyBuilder(
+        data_path=str(data_path),
+        metadata_path=str(FIXTURES / "survey_metadata.yml"),
+        lazy=lazy,
+        cache=cache,
+    )
+
+    cold_survey = survey_builder.build()
+    assert len(cache.entries()) == 1
+
+    def fail(*args, **kwargs):
+        raise AssertionError("source files were read on a warm build")
+
+    monkeypatch.setattr(SurveyBuilder, "_read_frame", fail)
+    monkeypatch.setattr(SurveyBuilder, "_load_metadata", fail)
+    warm_survey = survey_builder.build()
+
+    assert len(warm_survey.questions) == 8
+    for index in [0, 2, 3]:
+        assert_frame_equal(
+            warm_survey.questions[index]._strategy.get_df("text"),
+            cold_survey.questions[index]._strategy.get_df("text"),
+        )
+
+
+def test_build_cache_invalidates_changed_files(tmp_path):
+    data_path = tmp_path / "survey_data.csv"
+    frame = pl.read_excel(FIXTURES / "survey_data.xlsx", sheet_name="text")
+    frame.write_csv(data_path)
+    cache = BuildCache(str(tmp_path / "cache"), hash_content=True)
+    survey_builder = SurveyBuilder(
+        data_path=str(data_path),
+        metadata_path=str(FIXTURES / "survey_metadata.yml"),
+        cache=cache,
+    )
+
+    survey_builder.build()
+    first_entry = cache.entries()
+
+    frame.head(3).write_csv(data_path)
+    survey = survey_builder.build()
+
+    assert len(survey.questions[0].response_ids) == 3
+    assert len(cache.entries()) == 1
+    assert cache.entries() != first_entry
+
+
+def test_survey_to_frame_round_trips_data_columns():
+    frame = pl.read_excel(FIXTURES / "survey_data.xlsx", sheet_name="number")
+    survey = SurveyBuilder(
+        data_path=str(FIXTURES / "survey_data.xlsx"),
+        metadata_path=str(FIXTURES / "survey_metadata.yml"),
+        sheet_name="number",
+    ).build()
+
+    wide = survey.to_frame("number")
+
+    assert wide.columns == frame.columns
+    assert wide["Q6.2_3"].to_list() == (frame["Q6.2_3"] != 0).cast(pl.Int64).to_list()
+    assert wide["Q7#1"].to_list() == frame["Q7#1"].to_list()
+    assert survey.to_frame("text")["Q5.1"].dtype == pl.Enum(
+        [str(i) for i in range(1, 11)]
+    )
@@ -0,0 +1,84 @@
+import pytest
+import polars as pl
+from polars.testing import assert_frame_equal
+
+from surpy.config import Identifier
+from surpy.questions.strategies.matrix_multiple_strategy import (
+    MatrixMultipleStrategy,
+)
+from surpy.questions.strategies.strategy import count_values, weight_rows
+from surpy.questions.option import Option
+
+
+OPTIONS_DTYPE = pl.Enum(["Cheap", "Fast"])
+SUB_ITEMS_DTYPE = pl.Enum(["Brand A", "Brand B"])
+
+
+@pytest.fixture
+def matrix_multiple_strategy():
+    return MatrixMultipleStrategy(
+        id="Q1",
+        text="Test Matrix Multiple Strategy",
+        options=[Option(index=1, text="Cheap"), Option(index=2, text="Fast")],
+        sub_items=["Brand A", "Brand B"],
+        response_ids=["001", "002", "003"],
+        data={
+            1: {1: [1, 0, 1], 2: [1, 1, None]},
+            2: {1: [0, 0, 0], 2: ["1", "", "1"]},
+        },
+    )
+
+
+def test_matrix_multiple_strategy(matrix_multiple_strategy: MatrixMultipleStrategy):
+    number_df = matrix_multiple_strategy.get_df("number")
+
+    assert number_df.columns == [
+        Identifier.Id,
+        "Brand A_Cheap",
+        "Brand A_Fast",
+        "Brand B_Cheap",
+        "Brand B_Fast",
+    ]
+    assert number_df["Brand A_Fast"].to_list() == [1, 1, 0]
+    assert matrix_multiple_strategy.get_df("text")["Brand B_Fast"].to_list() == [
+        "Fast",
+        None,
+        "Fast",
+    ]
+
+    assert_frame_equal(
+        matrix_multiple_strategy.describe(),
+        pl.DataFrame(
+            {
+                "Q1_item": ["Brand A", "Brand A", "Brand B"],
+                "Q1": ["Cheap", "Fast", "Fast"],
+                "count": [2, 2, 2],
+                "percent": [0.5, 0.5, 1.0],
+                "cum_percent": [0.5, 1.0, 1.0],
+            },
+            schema={
+                "Q1_item": SUB_ITEMS_DTYPE,
+                "Q1": OPTIONS_DTYPE,
+                "count": pl.UInt32,
+                "percent": pl.Float64,
+                "cum_percent": pl.Float64,
+            },
+        ),
+    )
+
+
+@pytest.mark.parametrize("weights", [None, pl.Series([0.5, 1.0, 2.0])])
+def test_matrix_multiple_counts_match_long_form(
+    matrix_multiple_strategy: MatrixMultipleStrategy, weights
+):
+    matrix_multiple_strategy.weights = weights
+    long_counts = count_values(
+        weight_rows(matrix_multiple_strategy._long_df(), weights),
+        weighted=weights is not None,
+    )
+
+    assert_frame_equal(
+        matrix_multiple_strategy._counts().collect(),
+        long_counts.collect(),
+        check_row_order=False,
+    )
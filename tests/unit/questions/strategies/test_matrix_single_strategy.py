@@ -0,0 +1,78 @@
+import pytest
+import polars as pl
+from polars.testing import assert_frame_equal
+
+from surpy.config import Identifier
+from surpy.errors import DataError
+from surpy.questions.strategies.matrix_single_strategy import MatrixSingleStrategy
+from surpy.questions.option import Option
+
+
+OPTIONS_DTYPE = pl.Enum(["Bad", "OK", "Good"])
+SUB_ITEMS_DTYPE = pl.Enum(["Price", "Service"])
+
+
+@pytest.fixture(
+    params=[
+        {1: [1, 3, 3, None], 2: [2, 2, 9, 1]},
+        {1: ["Bad", "Good", "Good", None], 2: ["OK", "OK", "Great", "Bad"]},
+    ]
+)
+def matrix_single_strategy(request):
+    return MatrixSingleStrategy(
+        id="Q1",
+        text="Test Matrix Single Strategy",
+        options=[
+            Option(index=1, text="Bad"),
+            Option(index=2, text="OK"),
+            Option(index=3, text="Good"),
+        ],
+        sub_items=["Price", "Service"],
+        response_ids=[f"00{i}" for i in range(1, 5)],
+        data=request.param,
+    )
+
+
+def test_matrix_single_strategy(matrix_single_strategy: MatrixSingleStrategy):
+    number_df = matrix_single_strategy.get_df("number")
+
+    assert number_df.columns == [Identifier.Id, "Price", "Service"]
+    assert number_df["Price"].to_list() == [1, 3, 3, None]
+
+    text_df = matrix_single_strategy.get_df("text")
+
+    assert text_df["Service"].to_list() == ["OK", "OK", None, "Bad"]
+    assert text_df["Service"].dtype == OPTIONS_DTYPE
+
+    assert_frame_equal(
+        matrix_single_strategy.describe(),
+        pl.DataFrame(
+            {
+                "Q1_item": ["Price"] * 3 + ["Service"] * 3,
+                "Q1": [None, "Bad", "Good", None, "Bad", "OK"],
+                "count": [1, 1, 2, 1, 1, 2],
+                "percent": [1 / 4, 1 / 4, 2 / 4, 1 / 4, 1 / 4, 2 / 4],
+                "cum_percent": [1 / 4, 2 / 4, 1.0, 1 / 4, 2 / 4, 1.0],
+                "mean": [7 / 3] * 3 + [5 / 3] * 3,
+            },
+            schema={
+                "Q1_item": SUB_ITEMS_DTYPE,
+                "Q1": OPTIONS_DTYPE,
+                "count": pl.UInt32,
+                "percent": pl.Float64,
+                "cum_percent": pl.Float64,
+                "mean": pl.Float64,
+            },
+        ),
+    )
+
+
+def test_matrix_single_strategy_rejects_length_mismatch():
+    with pytest.raises(DataError):
+        MatrixSingleStrategy(
+            id="Q1",
+            text="Test Matrix Single Strategy",
+            options=[Option(index=1, text="A")],
+            response_ids=["001", "002"],
+            data={1: [1, 1], 2: [1]},
+        )
@@ -0,0 +1,126 @@
+import pytest
+import polars as pl
+from polars.testing import assert_frame_equal
+
+from surpy.config import Identifier
+from surpy.questions.strategies.multiple_strategy import MultipleStrategy
+from surpy.questions.option import Option
+
+
+OPTIONS_DTYPE = pl.Enum(["A", "B", "C"])
+
+
+@pytest.fixture(
+    params=[
+        {1: [1, 0, 1, 0], 2: [1, 1, 1, 1], 3: [0, 0, 0, 1]},
+        {1: [1, None, 1, None], 2: [1, 1, 1, 1], 3: [None, None, None, 1]},
+        {1: ["A", "", "A", None], 2: ["B", "B", "B", "B"], 3: [None, "", "", "C"]},
+    ]
+)
+def data(request):
+    return request.param
+
+
+@pytest.fixture(params=[False, True], ids=["unpacked", "packed"])
+def multiple_strategy(request, data):
+    return MultipleStrategy(
+        id="Q1",
+        text="Test Multiple Strategy",
+        options=[
+            Option(index=1, text="A"),
+            Option(index=2, text="B"),
+            Option(index=3, text="C"),
+        ],
+        response_ids=[f"00{i}" for i in range(1, 5)],
+        data=data,
+        packed=request.param,
+    )
+
+
+def test_multiple_strategy(multiple_strategy: MultipleStrategy):
+    assert_frame_equal(
+        multiple_strategy.get_df("number"),
+        pl.DataFrame(
+            {
+                Identifier.Id: [f"00{i}" for i in range(1, 5)],
+                "A": [1, 0, 1, 0],
+                "B": [1, 1, 1, 1],
+                "C": [0, 0, 0, 1],
+            }
+        ),
+    )
+
+    assert_frame_equal(
+        multiple_strategy.get_df("text"),
+        pl.DataFrame(
+            {
+                Identifier.Id: [f"00{i}" for i in range(1, 5)],
+                "A": ["A", None, "A", None],
+                "B": ["B", "B", "B", "B"],
+                "C": [None, None, None, "C"],
+            },
+            schema={
+                Identifier.Id: pl.String,
+                "A": OPTIONS_DTYPE,
+                "B": OPTIONS_DTYPE,
+                "C": OPTIONS_DTYPE,
+            },
+        ),
+    )
+
+    assert_frame_equal(
+        multiple_strategy.describe(),
+        pl.DataFrame(
+            {
+                "Q1": ["A", "B", "C"],
+                "count": [2, 4, 1],
+                "percent": [2 / 7, 4 / 7, 1 / 7],
+                "cum_percent": [2 / 7, 6 / 7, 7 / 7],
+            },
+            schema={
+                "Q1": OPTIONS_DTYPE,
+                "count": pl.UInt32,
+                "percent": pl.Float64,
+                "cum_percent": pl.Float64,
+            },
+        ),
+    )
+
+
+def test_multiple_strategy_queries(multiple_strategy: MultipleStrategy):
+    assert multiple_strategy.n_selected().to_list() == [2, 1, 2, 2]
+    assert multiple_strategy.any_of(["A", 3]).to_list() == [True, False, True, True]
+    assert multiple_strategy.any_of([]).to_list() == [False] * 4
+    assert multiple_strategy.all_of(["A", "B"]).to_list() == [True, False, True, False]
+    assert_frame_equal(
+        multiple_strategy.co_selection(),
+        pl.DataFrame(
+            {"Q1": ["A", "B", "C"], "A": [2, 2, 0], "B": [2, 4, 1], "C": [0, 1, 1]},
+            schema={
+                "Q1": OPTIONS_DTYPE,
+                "A": pl.UInt32,
+                "B": pl.UInt32,
+                "C": pl.UInt32,
+            },
+        ),
+    )
+
+
+def test_multiple_strategy_packs_many_options():
+    n_options = 130
+    data = {i: [i % 2, 1, 0] for i in range(1, n_options + 1)}
+    strategy = MultipleStrategy(
+        id="Q1",
+        text="Many options",
+        options=[Option(index=i, text=f"O{i}") for i in range(1, n_options + 1)],
+        response_ids=["001", "002", "003"],
+        data=data,
+        packed=True,
+    )
+
+    assert strategy.raw_data is None
+    assert strategy.masks.columns == ["mask_0", "mask_1", "mask_2"]
+    assert strategy.masks.schema["mask_0"] == pl.UInt64
+    assert strategy.n_selected().to_list() == [65, 130, 0]
+    assert strategy.all_of([1, 65, 129]).to_list() == [True, True, False]
+    assert strategy.number_data["O130"].to_list() == [0, 1, 0]
@@ -0,0 +1,86 @@
+import pytest
+import polars as pl
+from polars.testing import assert_frame_equal
+
+from surpy.config import Identifier
+from surpy.errors import DataError
+from surpy.questions.strategies.number_strategy import NumberStrategy
+
+
+def _number_strategy(values, **kwargs):
+    return NumberStrategy(
+        id="Q1",
+        text="Test Number Strategy",
+        options=[],
+        response_ids=[str(i) for i in range(len(values))],
+        data={1: values},
+        **kwargs,
+    )
+
+
+@pytest.mark.parametrize("values", [[4, 1, None, 3, 2], ["4", "1", "", "3", "2"]])
+def test_number_strategy(values):
+    number_strategy = _number_strategy(values)
+
+    assert number_strategy.get_df("number").columns == [Identifier.Id, "Q1"]
+    assert_frame_equal(
+        number_strategy.describe(),
+        pl.DataFrame(
+            {
+                "statistic": [
+                    "count",
+                    "mean",
+                    "std",
+                    "min",
+                    "p25",
+                    "p50",
+                    "p75",
+                    "max",
+                ],
+                "Q1": [4.0, 2.5, (5 / 3) ** 0.5, 1.0, 1.5, 2.5, 3.5, 4.0],
+            }
+        ),
+    )
+
+
+def test_number_strategy_weighted():
+    number_strategy = _number_strategy([1, 2, 3])
+    number_strategy.weights = pl.Series([1.0, 0.0, 3.0])
+
+    describe = dict(number_strategy.describe(quantiles=(0.5,)).iter_rows())
+
+    assert describe["count"] == 4.0
+    assert describe["mean"] == 2.5
+    assert describe["p50"] == 2.5
+
+
+def test_number_strategy_sketch_merges_across_chunks():
+    values = pl.int_range(0, 100_000, eager=True).shuffle(seed=1)
+    chunks = [_number_strategy(chunk) for chunk in values.to_frame().iter_slices(7_000)]
+    strategy = chunks[0]
+
+    summary = strategy._merge_summaries([chunk._summarize() for chunk in chunks])
+    describe = dict(strategy._describe_summary(summary, (0.01, 0.5, 0.99)).iter_rows())
+    exact = dict(_number_strategy(values).describe((0.01, 0.5, 0.99)).iter_rows())
+
+    assert summary.height <= 110
+    for statistic in ["count", "mean", "std", "min", "max"]:
+        assert describe[statistic] == pytest.approx(exact[statistic])
+    for statistic in ["p1", "p50", "p99"]:
+        assert describe[statistic] == pytest.approx(exact[statistic], abs=200)
+
+
+def test_number_strategy_histogram():
+    number_strategy = _number_strategy([0, 1, 2, 5, 9, 10, None])
+
+    assert_frame_equal(
+        number_strategy.histogram(bins=2),
+        pl.DataFrame(
+            {"bin_start": [0.0, 5.0], "bin_end": [5.0, 10.0], "count": [3, 3]},
+            schema_overrides={"count": pl.UInt32},
+        ),
+    )
+    assert number_strategy.histogram(bins=[1, 3, 20])["count"].to_list() == [2, 3]
+
+    with pytest.raises(DataError):
+        number_strategy.histogram(bins=[1])
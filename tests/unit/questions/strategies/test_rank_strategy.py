@@ -0,0 +1,70 @@
+import pytest
+import polars as pl
+from polars.testing import assert_frame_equal
+
+from surpy.config import Identifier
+from surpy.questions.strategies.rank_strategy import RankStrategy
+from surpy.questions.option import Option
+
+
+OPTIONS_DTYPE = pl.Enum(["A", "B", "C"])
+
+
+@pytest.fixture(
+    params=[
+        {1: [1, 2, 1, None], 2: [2, 1, None, None]},
+        {1: ["A", "B", "A", None], 2: ["B", "A", None, ""]},
+    ]
+)
+def rank_strategy(request):
+    return RankStrategy(
+        id="Q1",
+        text="Test Rank Strategy",
+        options=[
+            Option(index=1, text="A"),
+            Option(index=2, text="B"),
+            Option(index=3, text="C"),
+        ],
+        response_ids=[f"00{i}" for i in range(1, 5)],
+        data=request.param,
+    )
+
+
+def test_rank_strategy(rank_strategy: RankStrategy):
+    number_df = rank_strategy.get_df("number")
+
+    assert number_df.columns == [Identifier.Id, "Q1#1", "Q1#2"]
+    assert number_df["Q1#2"].to_list() == [2, 1, None, None]
+    assert rank_strategy.get_df("text")["Q1#1"].to_list() == ["A", "B", "A", None]
+
+    assert_frame_equal(
+        rank_strategy.describe(),
+        pl.DataFrame(
+            {
+                "Q1": ["A", "B", "C"],
+                "first_share": [2 / 3, 1 / 3, 0.0],
+                "mean_rank": [4 / 3, 3 / 2, None],
+                "borda": [8, 5, 0],
+                "rank_1": [2, 1, 0],
+                "rank_2": [1, 1, 0],
+            },
+            schema={
+                "Q1": OPTIONS_DTYPE,
+                "first_share": pl.Float64,
+                "mean_rank": pl.Float64,
+                "borda": pl.Int64,
+                "rank_1": pl.UInt32,
+                "rank_2": pl.UInt32,
+            },
+        ),
+    )
+
+
+def test_rank_strategy_weighted(rank_strategy: RankStrategy):
+    rank_strategy.weights = pl.Series([1.0, 2.0, 1.0, 1.0])
+
+    describe = rank_strategy.describe()
+
+    assert describe["first_share"].to_list() == [0.5, 0.5, 0.0]
+    assert describe["borda"].to_list() == [10.0, 8.0, 0.0]
+    assert describe["rank_1"].to_list() == [2.0, 2.0, 0.0]
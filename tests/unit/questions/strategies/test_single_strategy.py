@@ -19,21 +19,39 @@ from surpy.questions.option import Option
         [["A", "B", None], {"A": 1, "B": 2, "C": 3}, [1, 2, None]],
         [[1, 2, None], {"A": 1, "B": 2, "C": 3}, [1, 2, None]],
         [["A", "B", ""], {"A": 1, "B": 2, "C": 3}, [1, 2, None]],
+        [["A", "D", "None"], {"A": 1, "B": 2, "C": 3}, [1, None, None]],
+        [[None, None, None], {"A": 1, "B": 2, "C": 3}, [None, None, None]],
     ],
 )
 def test_to_number_data(data, option_mapping, number_data):
-    assert number_data == _to_number_data(data=data, option_mapping=option_mapping)
+    assert (
+        number_data
+        == _to_number_data(data=data, option_mapping=option_mapping).to_list()
+    )
 
 
 @pytest.mark.parametrize(
     "data, option_mapping, number_data",
     [
         [[1, 2, 3], {1: "A", 2: "B", 3: "C"}, ["A", "B", "C"]],
-        [[1, 2, None], {1: "A", 2: "B", 3: "C"}, ["A", "B", ""]],
+        [[1, 2, None], {1: "A", 2: "B", 3: "C"}, ["A", "B", None]],
+        [[1, 4, None], {1: "A", 2: "B", 3: "C"}, ["A", None, None]],
     ],
 )
 def test_to_text_data(data, option_mapping, number_data):
-    assert number_data == _to_text_data(data=data, option_mapping=option_mapping)
+    text_data = _to_text_data(data=data, option_mapping=option_mapping)
+
+    assert text_data.dtype == pl.Enum(["A", "B", "C"])
+    assert number_data == text_data.to_list()
+
+
+def test_to_text_data_numeric_option_texts():
+    text_data = _to_text_data(
+        data=[1, 10, None], option_mapping={i: i for i in range(1, 11)}
+    )
+
+    assert text_data.dtype == pl.Enum([str(i) for i in range(1, 11)])
+    assert text_data.to_list() == ["1", "10", None]
 
 
 @pytest.fixture(params=[[1, 2, 3, 2, 1, 2], ["A", "B", "C", "B", "A", "B"]])
@@ -62,8 +80,15 @@ def test_single_strategy_without_none(single_strategy_without_none: SingleStrate
         2: "B",
         3: "C",
     }
-    assert single_strategy_without_none.number_data == [1, 2, 3, 2, 1, 2]
-    assert single_strategy_without_none.text_data == ["A", "B", "C", "B", "A", "B"]
+    assert single_strategy_without_none.number_data.to_list() == [1, 2, 3, 2, 1, 2]
+    assert single_strategy_without_none.text_data.to_list() == [
+        "A",
+        "B",
+        "C",
+        "B",
+        "A",
+        "B",
+    ]
 
     assert_frame_equal(
         single_strategy_without_none.get_df("number"),
@@ -78,7 +103,8 @@ def test_single_strategy_without_none(single_strategy_without_none: SingleStrate
             {
                 Identifier.Id: [f"00{i}" for i in range(1, 7)],
                 "Q1": ["A", "B", "C", "B", "A", "B"],
-            }
+            },
+            schema={Identifier.Id: pl.String, "Q1": pl.Enum(["A", "B", "C"])},
         ),
     )
 
@@ -92,7 +118,7 @@ def test_single_strategy_without_none(single_strategy_without_none: SingleStrate
                 "cum_percent": [2 / 6, 5 / 6, 6 / 6],
             },
             schema={
-                "Q1": pl.String,
+                "Q1": pl.Enum(["A", "B", "C"]),
                 "count": pl.UInt32,
                 "percent": pl.Float64,
                 "cum_percent": pl.Float64,
@@ -123,8 +149,15 @@ def single_strategy_with_none(request):
 
 
 def test_single_strategy_with_none(single_strategy_with_none: SingleStrategy):
-    assert single_strategy_with_none.number_data == [1, 2, None, 2, 1, 2]
-    assert single_strategy_with_none.text_data == ["A", "B", "", "B", "A", "B"]
+    assert single_strategy_with_none.number_data.to_list() == [1, 2, None, 2, 1, 2]
+    assert single_strategy_with_none.text_data.to_list() == [
+        "A",
+        "B",
+        None,
+        "B",
+        "A",
+        "B",
+    ]
 
     assert_frame_equal(
         single_strategy_with_none.get_df("number"),
@@ -141,8 +174,9 @@ def test_single_strategy_with_none(single_strategy_with_none: SingleStrategy):
         pl.DataFrame(
             {
                 Identifier.Id: [f"00{i}" for i in range(1, 7)],
-                "Q1": ["A", "B", "", "B", "A", "B"],
-            }
+                "Q1": ["A", "B", None, "B", "A", "B"],
+            },
+            schema={Identifier.Id: pl.String, "Q1": pl.Enum(["A", "B", "C"])},
         ),
     )
 
@@ -150,13 +184,13 @@ def test_single_strategy_with_none(single_strategy_with_none: SingleStrategy):
         single_strategy_with_none.describe(),
         pl.DataFrame(
             {
-                "Q1": ["", "A", "B"],
+                "Q1": [None, "A", "B"],
                 "count": [1, 2, 3],
                 "percent": [1 / 6, 2 / 6, 3 / 6],
                 "cum_percent": [1 / 6, 3 / 6, 6 / 6],
             },
             schema={
-                "Q1": pl.String,
+                "Q1": pl.Enum(["A", "B", "C"]),
                 "count": pl.UInt32,
                 "percent": pl.Float64,
                 "cum_percent": pl.Float64,
@@ -0,0 +1,57 @@
+import pytest
+import polars as pl
+from polars.testing import assert_frame_equal
+
+from surpy.config import Identifier
+from surpy.errors import DataError
+from surpy.questions.strategies.text_strategy import TextStrategy
+
+
+@pytest.fixture
+def text_strategy():
+    return TextStrategy(
+        id="Q1",
+        text="Test Text Strategy",
+        options=[],
+        response_ids=["001", "002", "003", "004"],
+        data={1: ["Cute dogs, cute cats", "Dogs are loyal", None, "cats"]},
+    )
+
+
+def test_text_strategy(text_strategy: TextStrategy):
+    assert text_strategy.get_df().columns == [Identifier.Id, "Q1"]
+    assert text_strategy.terms == ["are", "cats", "cute", "dogs", "loyal"]
+
+    assert_frame_equal(
+        text_strategy.describe(),
+        pl.DataFrame(
+            {
+                "Q1": ["cats", "dogs", "are", "cute", "loyal"],
+                "count": [2, 2, 1, 1, 1],
+                "percent": [2 / 7, 2 / 7, 1 / 7, 1 / 7, 1 / 7],
+            },
+            schema_overrides={"count": pl.UInt32},
+        ),
+    )
+
+
+def test_text_strategy_search(text_strategy: TextStrategy):
+    assert text_strategy.search("Dogs").to_list() == ["001", "002"]
+    assert text_strategy.search("birds").to_list() == []
+    assert text_strategy.mentions(["loyal", "cats"]).to_list() == [
+        True,
+        True,
+        False,
+        True,
+    ]
+    assert text_strategy.mentions(["dogs", "cats"], match_all=True).to_list() == [
+        True,
+        False,
+        False,
+        False,
+    ]
+
+
+def test_text_strategy_rejects_numbers():
+    with pytest.raises(DataError):
+        TextStrategy(id="Q1", text="", options=[], response_ids=["001"], data={1: [1]})
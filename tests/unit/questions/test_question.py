@@ -1,8 +1,10 @@
 import pytest
+import polars as pl
 
 from surpy.questions.option import Option
 from surpy.questions.question import Question
 from surpy.config import QuestionType
+from surpy.errors import DataError
 from surpy.questions.strategies import (
     SingleStrategy,
     MultipleStrategy,
@@ -12,6 +14,7 @@ from surpy.questions.strategies import (
     TextStrategy,
     NumberStrategy,
 )
+from surpy.questions.strategies.multiple_strategy import PackedSelections
 
 
 @pytest.mark.parametrize(
@@ -115,3 +118,102 @@ def test_question_create_validation(
     assert all([isinstance(op, Option) for op in question.options])
     assert isinstance(question.sub_items, list)
     assert isinstance(question._strategy, expected_strategy)
+
+
+def test_question_caches_strategy():
+    question = Question(
+        id="Q1",
+        qtype=QuestionType.Single,
+        text="test single_choice",
+        data={1: [1, 2, 3]},
+        response_ids=["001", "002", "003"],
+        options=[Option(index=i, text=op) for i, op in enumerate(["A", "B", "C"], 1)],
+    )
+
+    strategy = question._strategy
+
+    assert question._strategy is strategy
+    assert strategy.number_data is strategy.number_data
+
+    question.data = {1: [3, 2, 1]}
+
+    assert question._strategy is not strategy
+    assert question._strategy.number_data.to_list() == [3, 2, 1]
+
+    strategy = question._strategy
+    question.options.append(Option(index=4, text="D"))
+    question.invalidate_strategy()
+
+    assert question._strategy is not strategy
+    assert len(question._strategy.options) == 4
+
+
+def test_question_compares_by_identity():
+    def build():
+        return Question(
+            id="Q1",
+            qtype=QuestionType.Single,
+            text="single",
+            data={1: pl.Series([1, 2, 3])},
+            response_ids=pl.Series(["001", "002", "003"]),
+            options=[Option(index=1, text="A"), Option(index=2, text="B")],
+        )
+
+    question = build()
+
+    assert question == question
+    assert question != build()
+
+
+@pytest.mark.parametrize("packed", [False, True], ids=["unpacked", "packed"])
+def test_question_multiple_choice_queries(packed):
+    question = Question(
+        id="Q1",
+        qtype=QuestionType.Multiple,
+        text="multiple",
+        data={1: [1, 0, 1, 0], 2: [1, 1, 1, 1], 3: [0, 0, 0, 1]},
+        response_ids=["001", "002", "003", "004"],
+        options=[Option(index=i, text=op) for i, op in enumerate(["A", "B", "C"], 1)],
+        packed=packed,
+    )
+
+    assert question.n_selected().to_list() == [2, 1, 2, 2]
+    assert question.any_of(["A", 3]).to_list() == [True, False, True, True]
+    assert question.all_of(["A", "B"]).to_list() == [True, False, True, False]
+    assert question.co_selection()["B"].to_list() == [2, 4, 1]
+    assert question.filter(
+        pl.Series([True, True, False, False])
+    ).n_selected().to_list() == [2, 1]
+
+
+def test_question_packed_keeps_only_masks():
+    question = Question(
+        id="Q1",
+        qtype=QuestionType.Multiple,
+        text="multiple",
+        data={1: [1, 0, 1], 2: [0, 0, 1]},
+        response_ids=["001", "002", "003"],
+        options=[Option(index=1, text="A"), Option(index=2, text="B")],
+        packed=True,
+    )
+
+    assert isinstance(question.data, PackedSelections)
+    assert question.data.masks.columns == ["mask_0"]
+    assert question.data[2].to_list() == [False, False, True]
+    assert question._strategy.raw_data is None
+    assert question._strategy.masks is question.data.masks
+    assert question._strategy.get_df("number")["B"].to_list() == [0, 0, 1]
+
+
+def test_question_multiple_choice_queries_reject_other_types():
+    question = Question(
+        id="Q1",
+        qtype=QuestionType.Single,
+        text="single",
+        data={1: [1, 2]},
+        response_ids=["001", "002"],
+        options=[Option(index=1, text="A"), Option(index=2, text="B")],
+    )
+
+    with pytest.raises(DataError):
+        question.any_of(["A"])
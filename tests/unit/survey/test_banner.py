@@ -0,0 +1,144 @@
+import pytest
+import polars as pl
+from polars.testing import assert_frame_equal
+
+from surpy.errors import DataError
+from surpy.questions.option import Option
+from surpy.questions.strategies import (
+    MatrixSingleStrategy,
+    MultipleStrategy,
+    NumberStrategy,
+    SingleStrategy,
+    TextStrategy,
+)
+from surpy.survey.banner import banner
+from surpy.survey.crosstab import crosstab
+
+
+RESPONSE_IDS = ["001", "002", "003", "004"]
+OPTIONS = [Option(index=1, text="A"), Option(index=2, text="B")]
+
+
+@pytest.fixture
+def gender():
+    return SingleStrategy(
+        id="G",
+        text="gender",
+        options=[Option(index=1, text="M"), Option(index=2, text="F")],
+        response_ids=RESPONSE_IDS,
+        data={1: [1, 2, 2, 1]},
+    )
+
+
+@pytest.fixture
+def single():
+    return SingleStrategy(
+        id="Q1",
+        text="single",
+        options=OPTIONS,
+        response_ids=RESPONSE_IDS,
+        data={1: [1, 2, None, 2]},
+    )
+
+
+@pytest.fixture
+def multiple():
+    return MultipleStrategy(
+        id="Q2",
+        text="multiple",
+        options=OPTIONS,
+        response_ids=RESPONSE_IDS,
+        data={1: [1, 1, 0, 1], 2: [1, 0, 1, 0]},
+    )
+
+
+def test_banner_single_by_single(single, gender):
+    assert_frame_equal(
+        banner([single], [gender]),
+        pl.DataFrame(
+            {
+                "question": ["Q1"] * 5,
+                "item": [None] * 5,
+                "value": ["A", "A", "B", "B", "B"],
+                "banner": ["Total", "G", "Total", "G", "G"],
+                "banner_value": ["Total", "M", "Total", "M", "F"],
+                "count": [1, 1, 2, 1, 1],
+                "base": [3, 2, 3, 2, 1],
+                "effective_base": [3.0, 2.0, 3.0, 2.0, 1.0],
+                "percent": [1 / 3, 0.5, 2 / 3, 0.5, 1.0],
+            },
+            schema_overrides={
+                "question": pl.Enum(["Q1"]),
+                "item": pl.String,
+                "banner": pl.Enum(["Total", "G"]),
+                "count": pl.UInt32,
+                "base": pl.UInt32,
+            },
+        ),
+    )
+
+
+def test_banner_matches_crosstab(single, multiple, gender):
+    weights = pl.Series([1.0, 2.0, 0.5, 1.5])
+    result = banner([single, multiple], [gender, multiple], weights, total=False)
+
+    for question in (single, multiple):
+        for point in (gender, multiple):
+            if point is question:
+                continue
+            cells = result.filter(
+                pl.col("question") == question.id, pl.col("banner") == point.id
+            )
+            expected = crosstab(question, point, weights).filter(
+                pl.col(question.id).is_not_null()
+            )
+            assert cells["count"].to_list() == pytest.approx(
+                expected["count"].to_list()
+            )
+
+
+def test_banner_matrix_and_mask(gender):
+    matrix = MatrixSingleStrategy(
+        id="Q3",
+        text="matrix",
+        options=OPTIONS,
+        sub_items=["x", "y"],
+        response_ids=RESPONSE_IDS,
+        data={1: [1, 2, 1, 1], 2: [2, 2, None, 1]},
+    ).with_mask(pl.Series([True, True, False, True]))
+    gender = gender.with_mask(matrix.mask)
+
+    result = banner([matrix], [gender]).filter(pl.col("banner") == "Total")
+
+    assert result["item"].to_list() == ["x", "x", "y", "y"]
+    assert result["count"].to_list() == [2, 1, 1, 2]
+    assert result["base"].to_list() == [3, 3, 3, 3]
+
+
+def test_banner_rejects_matrix_banner(single):
+    matrix = MatrixSingleStrategy(
+        id="Q3",
+        text="matrix",
+        options=OPTIONS,
+        response_ids=RESPONSE_IDS,
+        data={1: [1, 2, 1, 1]},
+    )
+
+    with pytest.raises(DataError):
+        banner([single], [matrix])
+
+
+@pytest.mark.parametrize(
+    "strategy_class, data",
+    [
+        (NumberStrategy, {1: [1.5, 2.0, None, 3.0]}),
+        (TextStrategy, {1: ["a", "b", None, "c"]}),
+    ],
+)
+def test_banner_rejects_number_and_text_questions(single, gender, strategy_class, data):
+    question = strategy_class(
+        id="Q4", text="open", options=[], response_ids=RESPONSE_IDS, data=data
+    )
+
+    with pytest.raises(DataError, match="Q4"):
+        banner([single, question], [gender])
@@ -0,0 +1,59 @@
+import os
+
+import polars as pl
+from polars.testing import assert_frame_equal
+
+from surpy.survey.build_cache import BuildCache
+
+
+def _write_source(path, text):
+    path.write_text(text)
+    return path
+
+
+def test_build_cache_round_trip(tmp_path):
+    cache = BuildCache(str(tmp_path / "cache"))
+    source = _write_source(tmp_path / "data.csv", "ID,Q1\n1,2\n")
+    key = cache.key([source])
+    frame = pl.DataFrame({"ID": ["1"], "Q1": [2]})
+
+    assert cache.get(key) is None
+
+    cache.put(key, frame, {"name": "S"}, {"ID": {1: "ID"}, "Q1": {1: "Q1"}}, {})
+    data_path, metadata, layout, kinds = cache.get(key)
+
+    assert_frame_equal(pl.read_ipc(data_path), frame)
+    assert metadata == {"name": "S"}
+    assert layout == {"ID": {1: "ID"}, "Q1": {1: "Q1"}}
+    assert kinds == {}
+
+
+def test_build_cache_key_tracks_file_changes(tmp_path):
+    cache = BuildCache(str(tmp_path / "cache"))
+    source = _write_source(tmp_path / "data.csv", "ID\n1\n")
+    key = cache.key([source])
+
+    assert cache.key([source]) == key
+    assert cache.key([source], "sheet") != key
+
+    _write_source(source, "ID\n1\n2\n")
+
+    assert cache.key([source]) != key
+    assert cache.key([source]).split("-")[0] == key.split("-")[0]
+
+
+def test_build_cache_evicts_least_recently_used(tmp_path):
+    frame = pl.DataFrame({"ID": [str(i) for i in range(1000)]})
+    cache = BuildCache(str(tmp_path / "cache"))
+    keys = []
+    for i in range(3):
+        keys.append(cache.key([_write_source(tmp_path / f"{i}.csv", "ID\n")]))
+        cache.put(keys[-1], frame, {}, {}, {})
+        # Spread the access times so the order does not depend on the clock.
+        survey_path = cache.directory / keys[-1] / "survey.json"
+        os.utime(survey_path, ns=(i * 10**9, i * 10**9))
+
+    cache.max_bytes = cache.size() * 2 // 3
+    cache.evict()
+
+    assert [entry.name for entry in cache.entries()] == keys[1:]
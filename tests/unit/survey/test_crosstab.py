@@ -0,0 +1,81 @@
+import pytest
+import polars as pl
+from polars.testing import assert_frame_equal
+
+from surpy.questions.option import Option
+from surpy.questions.strategies import MultipleStrategy, SingleStrategy
+from surpy.survey.crosstab import crosstab
+
+
+RESPONSE_IDS = ["001", "002", "003", "004"]
+
+
+@pytest.fixture
+def single():
+    return SingleStrategy(
+        id="Q1",
+        text="single",
+        options=[Option(index=1, text="M"), Option(index=2, text="F")],
+        response_ids=RESPONSE_IDS,
+        data={1: [1, 2, 2, 1]},
+    )
+
+
+@pytest.fixture
+def multiple():
+    return MultipleStrategy(
+        id="Q2",
+        text="multiple",
+        options=[Option(index=1, text="A"), Option(index=2, text="B")],
+        response_ids=RESPONSE_IDS,
+        data={1: [1, 1, 0, 1], 2: [1, 0, 1, 0]},
+    )
+
+
+def test_crosstab_single_by_single(single):
+    other = SingleStrategy(
+        id="Q3",
+        text="other single",
+        options=[Option(index=1, text="M"), Option(index=2, text="F")],
+        response_ids=RESPONSE_IDS,
+        data={1: [1, 1, 2, 2]},
+    )
+
+    assert_frame_equal(
+        crosstab(single, other),
+        pl.DataFrame(
+            {
+                "Q1": ["M", "M", "F", "F"],
+                "Q3": ["M", "F", "M", "F"],
+                "count": [1, 1, 1, 1],
+                "row_percent": [0.5, 0.5, 0.5, 0.5],
+                "col_percent": [0.5, 0.5, 0.5, 0.5],
+                "total_percent": [0.25, 0.25, 0.25, 0.25],
+            },
+            schema_overrides={
+                "Q1": pl.Enum(["M", "F"]),
+                "Q3": pl.Enum(["M", "F"]),
+                "count": pl.UInt32,
+            },
+        ),
+    )
+
+
+def test_crosstab_multiple_by_single_weighted(single, multiple):
+    assert_frame_equal(
+        crosstab(multiple, single, weights=pl.Series([1.0, 2.0, 1.0, 1.0])),
+        pl.DataFrame(
+            {
+                "Q2": ["A", "A", "B", "B"],
+                "Q1": ["M", "F", "M", "F"],
+                "count": [2.0, 2.0, 1.0, 1.0],
+                "row_percent": [2 / 4, 2 / 4, 1 / 2, 1 / 2],
+                "col_percent": [2 / 2, 2 / 3, 1 / 2, 1 / 3],
+                "total_percent": [2 / 5, 2 / 5, 1 / 5, 1 / 5],
+            },
+            schema_overrides={
+                "Q2": pl.Enum(["A", "B"]),
+                "Q1": pl.Enum(["M", "F"]),
+            },
+        ),
+    )
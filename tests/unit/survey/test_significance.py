@@ -0,0 +1,95 @@
+import pytest
+import polars as pl
+
+from surpy.questions.option import Option
+from surpy.questions.strategies import SingleStrategy
+from surpy.survey.banner import banner
+from surpy.survey.significance import (
+    _chi_square_sf,
+    chi_square_tests,
+    column_proportion_tests,
+)
+
+
+@pytest.fixture
+def table():
+    # Banner point M answers A 10 / B 30, F answers A 20 / B 40.
+    response_ids = [str(i) for i in range(100)]
+    question = SingleStrategy(
+        id="Q1",
+        text="single",
+        options=[Option(index=1, text="A"), Option(index=2, text="B")],
+        response_ids=response_ids,
+        data={1: [1] * 10 + [2] * 30 + [1] * 20 + [2] * 40},
+    )
+    gender = SingleStrategy(
+        id="G",
+        text="gender",
+        options=[Option(index=1, text="M"), Option(index=2, text="F")],
+        response_ids=response_ids,
+        data={1: [1] * 40 + [2] * 60},
+    )
+    return question, gender
+
+
+def test_column_proportion_tests(table):
+    question, gender = table
+    tests = column_proportion_tests(banner([question], [gender]))
+
+    assert tests["other"].to_list() == ["M", "F", "M", "F"]
+    assert tests["z"].to_list() == pytest.approx(
+        [0.890871, -0.890871, -0.890871, 0.890871], abs=1e-6
+    )
+    assert tests["p_value"].to_list() == pytest.approx([0.372998] * 4, abs=1e-6)
+
+
+def test_banner_higher_than(table):
+    question, gender = table
+    result = banner([question], [gender], alpha=0.5)
+
+    assert result["higher_than"].to_list() == [[], [], ["M"], [], ["F"], []]
+    assert banner([question], [gender], alpha=0.05)["higher_than"].to_list() == [[]] * 6
+
+
+def test_chi_square_tests(table):
+    question, gender = table
+    tests = chi_square_tests(banner([question], [gender]))
+
+    assert tests["chi_square"].to_list() == pytest.approx([0.793651], abs=1e-6)
+    assert tests["df"].to_list() == [1]
+    assert tests["p_value"].to_list() == pytest.approx([0.372998], abs=1e-6)
+
+
+def test_banner_chi_square(table):
+    question, gender = table
+    result = banner([question], [gender], chi_square=True)
+
+    assert result.columns[-3:] == ["chi_square", "df", "p_value"]
+    tested = result.filter(pl.col("banner") == "G")
+    assert tested["chi_square"].to_list() == pytest.approx([0.793651] * 4, abs=1e-6)
+    assert tested["df"].to_list() == [1] * 4
+    assert result.filter(pl.col("banner") == "Total")["p_value"].null_count() == 2
+
+
+def test_chi_square_tests_effective_base(table):
+    question, gender = table
+    weights = pl.Series([1.0, 3.0] * 50)
+    result = banner([question], [gender], weights)
+
+    assert result["effective_base"].to_list() == pytest.approx(
+        [80.0, 32.0, 48.0, 80.0, 32.0, 48.0]
+    )
+    # Kish effective base is 80% of the weighted base, and so is the statistic.
+    assert chi_square_tests(result)["chi_square"].to_list() == pytest.approx(
+        [0.793651 * 0.8], abs=1e-6
+    )
+
+
+def test_chi_square_sf():
+    p_values = pl.DataFrame({"x": [3.0, 10.0, 20.0], "df": [2, 4, 10]}).select(
+        _chi_square_sf(pl.col("x"), pl.col("df"))
+    )
+
+    assert p_values.to_series().to_list() == pytest.approx(
+        [0.223130, 0.040428, 0.029253], abs=1e-3
+    )
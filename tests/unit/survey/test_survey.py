@@ -1,3 +1,12 @@
+import pytest
+import polars as pl
+from polars.testing import assert_frame_equal
+
+from surpy.config import QuestionType
+from surpy.errors import DataError, QuestionNotFoundError
+from surpy.questions.option import Option
+from surpy.questions.question import Question
+from surpy.questions.strategies import MatrixMultipleStrategy
 from surpy.survey.survey import Survey
 from unittest.mock import Mock
 
@@ -9,3 +18,181 @@ def test_survey_keep_questions():
     survey = Survey(name="test_survey", questions=[q1, q2])
 
     assert survey.questions == [q1, q2]
+
+
+@pytest.fixture
+def survey():
+    options = [Option(index=i, text=op) for i, op in enumerate(["A", "B", "C"], 1)]
+    response_ids = ["001", "002", "003", "004"]
+    return Survey(
+        name="test_survey",
+        questions=[
+            Question(
+                id="Q1",
+                qtype=QuestionType.Single,
+                text="single",
+                data={1: [1, 2, None, 2]},
+                response_ids=response_ids,
+                options=options,
+            ),
+            Question(
+                id="Q2",
+                qtype=QuestionType.Multiple,
+                text="multiple",
+                data={1: [1, 0, 1, 0], 2: [0, 0, 0, 0], 3: [1, 1, 1, 1]},
+                response_ids=response_ids,
+                options=options,
+            ),
+            Question(
+                id="Q3",
+                qtype=QuestionType.Text,
+                text="text",
+                data={1: ["a", "b", "c", "d"]},
+                response_ids=response_ids,
+            ),
+        ],
+    )
+
+
+def test_survey_describe_all(survey):
+    describe_all = survey.describe_all()
+
+    assert list(describe_all) == ["Q1", "Q2"]
+    for question in survey.questions[:2]:
+        assert_frame_equal(describe_all[question.id], question._strategy.describe())
+
+
+def test_survey_describe_all_uses_question_counts(monkeypatch):
+    question = Question(
+        id="Q4",
+        qtype=QuestionType.MatrixMultiple,
+        text="matrix multiple",
+        data={1: {1: [1, 0], 2: [1, 1]}, 2: {1: [0, 0], 2: [1, 0]}},
+        response_ids=["001", "002"],
+        options=[Option(index=1, text="A"), Option(index=2, text="B")],
+        sub_items=["x", "y"],
+    )
+    describe = question._strategy.describe()
+
+    # The boolean column sums of ``_counts`` are far faster than the long
+    # frame, so describe_all must not fall back to it.
+    def _long_df(self):
+        raise AssertionError("describe_all built the long frame")
+
+    monkeypatch.setattr(MatrixMultipleStrategy, "_long_df", _long_df)
+
+    assert_frame_equal(
+        Survey(name="test_survey", questions=[question]).describe_all()["Q4"],
+        describe,
+    )
+
+
+def test_survey_crosstab(survey):
+    crosstab = survey.crosstab("Q2", "Q1")
+
+    assert crosstab.columns == [
+        "Q2",
+        "Q1",
+        "count",
+        "row_percent",
+        "col_percent",
+        "total_percent",
+    ]
+    assert crosstab["count"].sum() == 6
+
+    with pytest.raises(QuestionNotFoundError):
+        survey.crosstab("Q1", "Q9")
+
+
+def test_survey_rake(survey):
+    result = survey.rake({"Q1": {"A": 0.5, "B": 0.5}})
+
+    assert result.converged
+    assert survey.weights is result.weights
+    assert all(question.weights is result.weights for question in survey.questions)
+
+    describe = survey.get_question("Q1")._strategy.describe()
+
+    assert describe["count"].to_list() == pytest.approx([1.0, 1.5, 1.5])
+    assert_frame_equal(survey.describe_all()["Q1"], describe)
+
+    survey.set_weights(None)
+
+    assert survey.get_question("Q1")._strategy.describe()["count"].to_list() == [
+        1,
+        1,
+        2,
+    ]
+
+
+def test_survey_to_frame(survey):
+    frame = survey.to_frame()
+
+    assert frame.columns == ["ID", "Q1", "Q2_1", "Q2_2", "Q2_3", "Q3"]
+    assert frame["Q1"].to_list() == [1, 2, None, 2]
+    assert frame["Q2_1"].to_list() == [1, 0, 1, 0]
+    assert frame["Q3"].to_list() == ["a", "b", "c", "d"]
+
+
+def test_survey_to_frame_text_selected_questions(survey):
+    frame = survey.to_frame("text", questions=["Q2", "Q1"])
+
+    assert frame.columns == ["ID", "Q2_1", "Q2_2", "Q2_3", "Q1"]
+    assert frame["Q1"].to_list() == ["A", "B", None, "B"]
+    assert frame["Q2_1"].to_list() == ["A", None, "A", None]
+    assert frame["Q1"].dtype == pl.Enum(["A", "B", "C"])
+
+
+def test_survey_filter(survey):
+    view = survey.filter(pl.col("Q2_1") == 1)
+
+    assert view.to_frame()["ID"].to_list() == ["001", "003"]
+    assert view.get_question("Q1")._strategy.get_df("number")["Q1"].to_list() == [
+        1,
+        None,
+    ]
+    assert view.get_question("Q3")._strategy.search("c").to_list() == ["003"]
+    assert view.get_question("Q2").n_selected().to_list() == [2, 2]
+
+    sliced = Question(
+        id="Q1",
+        qtype=QuestionType.Single,
+        text="single",
+        data={1: [1, None]},
+        response_ids=["001", "003"],
+        options=survey.get_question("Q1").options,
+    )
+    assert_frame_equal(view.describe_all()["Q1"], sliced._strategy.describe())
+    assert view.crosstab("Q2", "Q1")["count"].sum() == 4
+
+    assert view.get_question("Q2").data is survey.get_question("Q2").data
+    assert survey.to_frame().height == 4
+
+
+def test_survey_filter_chained(survey):
+    view = survey.filter(pl.col("Q2_1") == 1).filter(pl.col("Q1") == 1)
+
+    assert view.to_frame()["ID"].to_list() == ["001"]
+    assert view.get_question("Q1")._strategy.describe()["count"].to_list() == [1]
+
+    with pytest.raises(DataError):
+        view.rake({"Q1": {"A": 1.0}})
+    with pytest.raises(DataError):
+        survey.filter(pl.Series([True]))
+
+
+def test_survey_banner(survey):
+    result = survey.banner(["Q1"], ["Q2"])
+
+    assert result.filter(pl.col("banner") == "Total")["count"].to_list() == [1, 2]
+    assert result.filter(pl.col("banner") == "Q2")["banner_value"].unique(
+        maintain_order=True
+    ).to_list() == ["A", "C"]
+    # By default the banner questions are not tabulated against themselves.
+    assert survey.banner(None, ["Q1"])["question"].unique().to_list() == ["Q2"]
+
+
+def test_survey_banner_chi_square(survey):
+    result = survey.banner(["Q2"], ["Q1"], chi_square=True)
+
+    assert {"chi_square", "df", "p_value"} <= set(result.columns)
@@ -1,4 +1,5 @@
 import pytest
+import polars as pl
 
 from surpy.survey.survey_builder import (
     _load_data_single,
@@ -7,8 +8,10 @@ from surpy.survey.survey_builder import (
     _load_data_matrix_multiple,
     _load_data_rank,
     _load_survey_data,
+    compile_layout,
 )
 from surpy.config import Identifier
+from surpy.errors import DataError
 
 
 @pytest.mark.parametrize(
@@ -197,3 +200,56 @@ def test_load_survey_data(raw_data):
         "Q5": {1: [1, 2, 3], 2: [2, 3, 1], 3: [3, 1, 2]},
         "Q6": {1: [20, 10, 100]},
     }
+
+
+def test_load_survey_data_keeps_series(raw_data):
+    survey_data = _load_survey_data(pl.DataFrame(raw_data).to_dict())
+
+    assert isinstance(survey_data["Q1"][1], pl.Series)
+    assert isinstance(survey_data["Q4"][2][1], pl.Series)
+    assert survey_data["Q2"][3].to_list() == [1, 1, 1]
+
+
+def test_compile_layout_is_cached(raw_data):
+    header = tuple(raw_data)
+
+    assert compile_layout(header) is compile_layout(
+        tuple(pl.DataFrame(raw_data).columns)
+    )
+    assert compile_layout(header).tree["Q4"] == {
+        1: {1: "Q4.1_1", 2: "Q4.1_2"},
+        2: {1: "Q4.2_1", 2: "Q4.2_2"},
+    }
+    assert compile_layout(header).kinds["Q5"] == "rank"
+
+
+def test_load_survey_data_reports_all_errors():
+    raw_data = {"Q1": [1], "Q2_x": [0], "Q2_1": [1], "Q2.1": [0]}
+
+    with pytest.raises(DataError) as e:
+        _load_survey_data(raw_data)
+
+    message = str(e.value)
+    assert "Could not find ID" in message
+    assert "Q2_x: Invalid question code" in message
+    assert "Q2.1: matrix_single column mixed with multiple columns" in message
+
+
+def test_load_survey_data_checks_metadata(raw_data):
+    questions_metadata = [
+        {"id": "Q1", "type": "single_choice", "options": ["A", "B", "C"]},
+        {"id": "Q2", "type": "multiple_choice", "options": ["A", "B"]},
+        {"id": "Q3", "type": "multiple_choice", "options": ["A", "B", "C"]},
+        {"id": "Q5", "type": "rank", "options": ["A", "B"]},
+        {"id": "Q9", "type": "number"},
+    ]
+
+    with pytest.raises(DataError) as e:
+        _load_survey_data(raw_data, questions_metadata)
+
+    message = str(e.value)
+    assert "Q1" not in message
+    assert "Q2: option indexes [1, 2, 3] do not match 1..2" in message
+    assert "Q3: matrix_single columns do not fit" in message
+    assert "Q5: rank positions [1, 2, 3] exceed 2 options" in message
+    assert "Q9: no column in data" in message
@@ -0,0 +1,61 @@
+import pytest
+import polars as pl
+
+from surpy.errors import DataError
+from surpy.survey.weighting import rake
+
+
+@pytest.fixture
+def codes():
+    return {
+        "gender": pl.Series([1, 1, 1, 2, 2, 1, 2, 1]),
+        "region": pl.Series([1, 2, 3, 1, 2, 3, 1, None]),
+    }
+
+
+def _shares(codes: pl.Series, weights: pl.Series) -> dict[int, float]:
+    frame = pl.DataFrame({"code": codes, "weight": weights}).drop_nulls("code")
+    totals = frame.group_by("code").agg(pl.col("weight").sum())
+    return {code: weight / frame["weight"].sum() for code, weight in totals.iter_rows()}
+
+
+def test_rake_matches_targets(codes):
+    targets = {
+        "gender": {1: 0.5, 2: 0.5},
+        "region": {1: 2, 2: 1, 3: 1},
+    }
+
+    result = rake(codes, targets)
+
+    assert result.converged
+    assert result.weights.sum() == pytest.approx(8)
+    assert _shares(codes["gender"], result.weights) == pytest.approx({1: 0.5, 2: 0.5})
+    assert _shares(codes["region"], result.weights) == pytest.approx(
+        {1: 0.5, 2: 0.25, 3: 0.25}
+    )
+
+
+def test_rake_trims_weights(codes):
+    result = rake(codes, {"gender": {1: 0.05, 2: 0.95}}, max_iter=5, trim=(0.5, 2))
+
+    assert not result.converged
+    assert result.weights.max() <= 2 * result.weights.mean() + 1e-9
+    assert result.weights.sum() == pytest.approx(len(codes["gender"]))
+
+
+def test_rake_trim_keeps_the_weight_total():
+    result = rake(
+        {"a": pl.Series([1, 1, 1, 2])}, {"a": {1: 0.5, 2: 0.5}}, trim=(0.5, 1.5)
+    )
+
+    assert result.weights.sum() == pytest.approx(4.0)
+    assert 0.5 < result.weights.min() and result.weights.max() < 2
+
+
+def test_rake_reports_all_target_errors(codes):
+    with pytest.raises(DataError) as e:
+        rake(codes, {"gender": {1: 1.0}, "region": {1: 1, 2: 1, 3: 1, 4: 1}, "age": {}})
+
+    assert "gender: no target for codes [2]" in str(e.value)
+    assert "region: no respondents for codes [4]" in str(e.value)
+    assert "age: no data for rake variable" in str(e.value)
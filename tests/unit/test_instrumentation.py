@@ -0,0 +1,45 @@
+import polars as pl
+
+from surpy.instrumentation import BuildStats, PhaseStats, timed
+
+
+def test_timed_without_stats_is_a_plain_call():
+    assert timed(None, "phase", sorted, [3, 1, 2]) == [1, 2, 3]
+
+
+def test_timed_records_shape_and_calls_callback():
+    seen = []
+    stats = BuildStats(callback=seen.append)
+    frame = pl.DataFrame({"a": [1, 2, 3], "b": [4, 5, 6]})
+
+    assert timed(stats, "frame", lambda: frame) is frame
+    timed(stats, "data", lambda: {"Q1": {1: frame["a"]}, "Q2": {1: {1: frame["b"]}}})
+    timed(stats, "questions", lambda: [1, 2])
+
+    assert seen == stats.phases
+    assert [
+        (phase.phase, phase.rows, phase.columns, phase.bytes) for phase in seen
+    ] == [
+        ("frame", 3, 2, frame.estimated_size()),
+        ("data", 3, 2, frame.estimated_size()),
+        ("questions", None, 2, None),
+    ]
+    assert all(phase.seconds >= 0 for phase in seen)
+
+
+def test_build_stats_to_frame():
+    stats = BuildStats()
+    stats.record(PhaseStats("read_data", 0.5, 10, 2, 160))
+    stats.record(PhaseStats("validate", 0.25))
+
+    assert stats.total_seconds == 0.75
+    assert stats.to_frame().to_dicts() == [
+        {"phase": "read_data", "seconds": 0.5, "rows": 10, "columns": 2, "bytes": 160},
+        {
+            "phase": "validate",
+            "seconds": 0.25,
+            "rows": None,
+            "columns": None,
+            "bytes": None,
+        },
+    ]